@@ -0,0 +1,103 @@
+from typing import Iterator, List, Optional, Tuple
+from src.enums.color import Color
+from src.game.position import Position, SQUARE_POSITIONS
+
+# Piece type indexes, ordered by value so they can double as table offsets
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+PIECE_TYPES = ('Pawn', 'Knight', 'Bishop', 'Rook', 'Queen', 'King')
+PIECE_INDEX = {name: index for index, name in enumerate(PIECE_TYPES)}
+
+# Color indexes used by every bitboard table
+WHITE, BLACK = 0, 1
+
+
+def color_index(color: Color) -> int:
+    """Converts a Color to its bitboard table index."""
+    return WHITE if color == Color.WHITE else BLACK
+
+
+def piece_index(piece) -> Optional[int]:
+    """Returns the piece type index for a piece, or None for unknown pieces."""
+    return PIECE_INDEX.get(piece.__class__.__name__)
+
+
+def square_index(x: int, y: int) -> int:
+    """Converts x,y coordinates to a 0-63 square index (A1 = 0, H8 = 63)."""
+    return y * 8 + x
+
+
+def square_position(square: int) -> Position:
+    """Converts a 0-63 square index back to its shared Position."""
+    return SQUARE_POSITIONS[square]
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yields the square index of every set bit, lowest first."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+class BitBoard:
+    """64-bit integer masks per color and piece type, plus occupancy.
+
+    Square ``y * 8 + x`` maps to bit ``1 << (y * 8 + x)``, so iterating the
+    bits of a mask visits squares in the same order as the nested loops in Board.
+    """
+
+    def __init__(self):
+        self.pieces: List[List[int]] = [[0] * 6, [0] * 6]
+        self.occupancy: List[int] = [0, 0]
+        self.occupied = 0
+
+    def clear(self):
+        """Removes every piece."""
+        self.pieces = [[0] * 6, [0] * 6]
+        self.occupancy = [0, 0]
+        self.occupied = 0
+
+    def add_piece(self, color: int, piece_type: int, square: int):
+        """Places a piece on an empty square."""
+        bit = 1 << square
+        self.pieces[color][piece_type] |= bit
+        self.occupancy[color] |= bit
+        self.occupied |= bit
+
+    def remove_piece(self, color: int, piece_type: int, square: int):
+        """Clears a piece from its square."""
+        bit = ~(1 << square)
+        self.pieces[color][piece_type] &= bit
+        self.occupancy[color] &= bit
+        self.occupied &= bit
+
+    def move_piece(self, color: int, piece_type: int, from_square: int, to_square: int):
+        """Moves a piece between squares; the destination must already be empty."""
+        bits = (1 << from_square) | (1 << to_square)
+        self.pieces[color][piece_type] ^= bits
+        self.occupancy[color] ^= bits
+        self.occupied ^= bits
+
+    def piece_at(self, square: int) -> Optional[Tuple[int, int]]:
+        """Returns (color, piece_type) for the piece on a square, or None."""
+        bit = 1 << square
+        if not self.occupied & bit:
+            return None
+        color = WHITE if self.occupancy[WHITE] & bit else BLACK
+        for piece_type, mask in enumerate(self.pieces[color]):
+            if mask & bit:
+                return color, piece_type
+        return None
+
+    def king_square(self, color: int) -> int:
+        """Returns the square of the color's king, or -1 if it has been captured."""
+        kings = self.pieces[color][KING]
+        return (kings & -kings).bit_length() - 1
+
+    def count(self, color: int, piece_type: int) -> int:
+        """Returns how many pieces of a type the color has on the board."""
+        return self.pieces[color][piece_type].bit_count()
+
+    def squares_of(self, color: int) -> Iterator[int]:
+        """Yields the square of every piece of a color."""
+        return iter_bits(self.occupancy[color])
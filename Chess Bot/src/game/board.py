@@ -10,13 +10,43 @@ from src.game.position import Position
 from src.enums.color import Color
 from typing import Optional
 from src.game.move import Move
+from src.game.bitboard import (BitBoard, PIECE_TYPES, PAWN, KING, WHITE, color_index, iter_bits, piece_index,
+                                square_index, square_position)
+from src.game.fen import parse_fen, format_fen
+from src.game.packed import pack_position, unpack_position
+from src.game.zobrist import PIECE_KEYS, compute_key
+from src.game.movegen import attack_map
+from src.game.piece_square_tables import MATERIAL_VALUES, SQUARE_VALUES
 from typing import List, Dict, Tuple, Optional
 from collections import defaultdict  
 
 class Board:
+    # Number of each piece type a color starts with, in captured-pieces display order
+    STARTING_PIECES = {'Pawn': 8, 'Rook': 2, 'Knight': 2, 'Bishop': 2, 'Queen': 1, 'King': 1}
+    # Piece class of each bitboard piece type index
+    PIECE_CLASSES = (Pawn, Knight, Bishop, Rook, Queen, King)
+    # Rank pawns start on, by color index
+    PAWN_START_RANKS = (1, 6)
+
     def __init__(self):
-        self.squares = [[Square(Position(x, y), Color.WHITE if (x + y) % 2 == 0 else Color.BLACK)
+        self.squares = [[Square(Position.at(x, y), Color.WHITE if (x + y) % 2 == 0 else Color.BLACK)
                          for y in range(8)] for x in range(8)]
+        self.bitboard = BitBoard()
+        # Zobrist key of the piece placement, updated incrementally with the bitboards
+        self.zobrist_key = 0
+        # Centipawn evaluation terms per color, updated incrementally with the bitboards
+        self.material = [0, 0]
+        self.positional = [0, 0]
+        # Executed moves, most recent last; each holds what is needed to undo it
+        self.undo_stack: List[Move] = []
+        # (hash, color index to move) of positions before the undo stack back to the last capture or
+        # pawn move, oldest first, when the position was carried over from another board
+        self.prior_keys: List[Tuple[int, int]] = []
+        # Squares attacked by each color index, computed on demand and dropped on every move
+        self.attack_maps: List[Optional[int]] = [None, None]
+        # Pieces on the board and king squares (-1 if none) per color index, updated on every move
+        self.piece_lists: List[List[Piece]] = [[], []]
+        self.king_squares = [-1, -1]
 
     def initialize_board(self):
         """Sets up pieces in the starting positions."""
@@ -42,32 +72,212 @@ class Board:
         
         self.squares[4][0].piece = King(Position(4, 0), Color.WHITE)
         self.squares[4][7].piece = King(Position(4,7), Color.BLACK)
-        pass
+        self.sync_bitboard()
+
+    def sync_bitboard(self):
+        """Rebuilds the bitboards from the squares after pieces were placed directly."""
+        self.undo_stack = []
+        self.prior_keys = []
+        self.attack_maps = [None, None]
+        self.bitboard.clear()
+        for x in range(8):
+            for y in range(8):
+                piece = self.squares[x][y].piece
+                if piece is None:
+                    continue
+                piece_type = piece_index(piece)
+                if piece_type is not None:
+                    self.bitboard.add_piece(color_index(piece.color), piece_type, square_index(x, y))
+        self.zobrist_key = compute_key(self.bitboard)
+        squares = self.squares
+        self.piece_lists = [[squares[square & 7][square >> 3].piece for square in self.bitboard.squares_of(color)]
+                            for color in range(2)]
+        self.king_squares = [self.bitboard.king_square(color) for color in range(2)]
+        self.material = [0, 0]
+        self.positional = [0, 0]
+        for color in range(2):
+            for piece_type in range(6):
+                values = SQUARE_VALUES[color][piece_type]
+                for square in iter_bits(self.bitboard.pieces[color][piece_type]):
+                    self.material[color] += MATERIAL_VALUES[piece_type]
+                    self.positional[color] += values[square]
+
+    def set_pieces(self, placement: List[Tuple[int, int, int]]):
+        """Replaces every piece with (square, color index, piece type) placements."""
+        for column in self.squares:
+            for square in column:
+                square.remove_piece()
+        for square, color, piece_type in placement:
+            x, y = square & 7, square >> 3
+            piece = self.PIECE_CLASSES[piece_type](Position(x, y), Color.WHITE if color == WHITE else Color.BLACK)
+            # Pawns off their starting rank have lost their double step
+            if piece_type == PAWN and y != self.PAWN_START_RANKS[color]:
+                piece.has_moved = True
+            self.squares[x][y].piece = piece
+        self.sync_bitboard()
+
+    def load_fen(self, fen: str) -> Color:
+        """Sets up a FEN position and returns the color to move."""
+        placement, side = parse_fen(fen)
+        self.set_pieces(placement)
+        return Color.WHITE if side == WHITE else Color.BLACK
+
+    def to_fen(self, color: Color = Color.WHITE) -> str:
+        """Returns the position as a FEN string with the given color to move."""
+        return format_fen(self.bitboard, color_index(color))
+
+    def pack(self, color: Color = Color.WHITE) -> bytes:
+        """Returns the position and color to move in a compact 25-byte form."""
+        return pack_position(self.bitboard, color_index(color))
+
+    def load_packed(self, data: bytes) -> Color:
+        """Sets up a position from pack output and returns the color to move."""
+        placement, side = unpack_position(data)
+        self.set_pieces(placement)
+        return Color.WHITE if side == WHITE else Color.BLACK
+
+    def make_move(self, move: Move):
+        """Plays a move: squares, piece object, bitboards, hash and evaluation."""
+        move.execute(self)
+
+    def unmake_move(self) -> Optional[Move]:
+        """Takes back the most recent move and returns it, or None if no move was made."""
+        if not self.undo_stack:
+            return None
+        move = self.undo_stack[-1]
+        move.undo(self)
+        return move
+
+    def repetitions(self, side: int) -> int:
+        """Counts earlier occurrences of the current position with side, a color index, to move.
+
+        The undo stack is the position history: every move keeps the hash of
+        the position it was played from, where its piece's color was to move.
+        Positions before the last capture or pawn move cannot recur, so the
+        walk stops there.
+        """
+        count = 0
+        key = self.zobrist_key
+        for move in reversed(self.undo_stack):
+            if move.piece_captured is not None or piece_index(move.piece_moved) == PAWN:
+                return count
+            if move.previous_key == key and color_index(move.piece_moved.color) == side:
+                count += 1
+        return count + self.prior_keys.count((key, side))
+
+    def halfmove_clock(self) -> int:
+        """Returns the plies since the last capture or pawn move, counted from the last position set up."""
+        clock = 0
+        for move in reversed(self.undo_stack):
+            if move.piece_captured is not None or piece_index(move.piece_moved) == PAWN:
+                return clock
+            clock += 1
+        return clock + len(self.prior_keys)
+
+    def repetition_history(self) -> List[Tuple[int, int]]:
+        """Returns the positions repetitions looks back on, to carry them over to another board as prior_keys."""
+        history = []
+        for move in reversed(self.undo_stack):
+            if move.piece_captured is not None or piece_index(move.piece_moved) == PAWN:
+                return history[::-1]
+            history.append((move.previous_key, color_index(move.piece_moved.color)))
+        return self.prior_keys + history[::-1]
+
+    def attacked_squares(self, color: Color) -> int:
+        """Returns the mask of squares a color attacks, cached until the next move or take-back."""
+        index = color_index(color)
+        attacked = self.attack_maps[index]
+        if attacked is None:
+            attacked = self.attack_maps[index] = attack_map(self.bitboard, index)
+        return attacked
+
+    def is_attacked(self, position: Position, color: Color) -> bool:
+        """Returns whether a color attacks a square."""
+        return bool(self.attacked_squares(color) >> square_index(position.x, position.y) & 1)
+
+    def apply_move_state(self, move: Move):
+        """Updates the bitboards, hash and evaluation after a move has been executed on the squares."""
+        move.previous_key = self.zobrist_key
+        self.undo_stack.append(move)
+        self.attack_maps = [None, None]
+        piece_type = piece_index(move.piece_moved)
+        if piece_type is None:
+            return
+        from_square = square_index(move.from_position.x, move.from_position.y)
+        to_square = square_index(move.to_position.x, move.to_position.y)
+        if move.piece_captured is not None:
+            captured_type = piece_index(move.piece_captured)
+            if captured_type is not None:
+                captured_color = color_index(move.piece_captured.color)
+                pieces = self.piece_lists[captured_color]
+                move.captured_index = next(index for index, piece in enumerate(pieces)
+                                           if piece is move.piece_captured)
+                del pieces[move.captured_index]
+                if captured_type == KING:
+                    self.king_squares[captured_color] = -1
+                self.bitboard.remove_piece(captured_color, captured_type, to_square)
+                self.zobrist_key ^= PIECE_KEYS[captured_color][captured_type][to_square]
+                self.material[captured_color] -= MATERIAL_VALUES[captured_type]
+                self.positional[captured_color] -= SQUARE_VALUES[captured_color][captured_type][to_square]
+        color = color_index(move.piece_moved.color)
+        if piece_type == KING:
+            self.king_squares[color] = to_square
+        self.bitboard.move_piece(color, piece_type, from_square, to_square)
+        keys = PIECE_KEYS[color][piece_type]
+        self.zobrist_key ^= keys[from_square] ^ keys[to_square]
+        values = SQUARE_VALUES[color][piece_type]
+        self.positional[color] += values[to_square] - values[from_square]
+
+    def revert_move_state(self, move: Move):
+        """Restores the bitboards, hash and evaluation after a move has been undone on the squares."""
+        stack = self.undo_stack
+        if stack and stack[-1] is move:
+            stack.pop()
+        else:
+            # Taken back out of order; moves compare by value, so match the object itself
+            self.undo_stack = [played for played in stack if played is not move]
+        self.attack_maps = [None, None]
+        piece_type = piece_index(move.piece_moved)
+        if piece_type is None:
+            return
+        from_square = square_index(move.from_position.x, move.from_position.y)
+        to_square = square_index(move.to_position.x, move.to_position.y)
+        color = color_index(move.piece_moved.color)
+        if piece_type == KING:
+            self.king_squares[color] = from_square
+        self.bitboard.move_piece(color, piece_type, to_square, from_square)
+        # XOR rather than restoring previous_key, which is stale when later moves are still on the board
+        keys = PIECE_KEYS[color][piece_type]
+        self.zobrist_key ^= keys[from_square] ^ keys[to_square]
+        values = SQUARE_VALUES[color][piece_type]
+        self.positional[color] -= values[to_square] - values[from_square]
+        if move.piece_captured is not None:
+            captured_type = piece_index(move.piece_captured)
+            if captured_type is not None:
+                captured_color = color_index(move.piece_captured.color)
+                pieces = self.piece_lists[captured_color]
+                # The index is exact for the latest move; after an out-of-order take-back the list may be shorter
+                pieces.insert(min(move.captured_index, len(pieces)), move.piece_captured)
+                self.zobrist_key ^= PIECE_KEYS[captured_color][captured_type][to_square]
+                if captured_type == KING:
+                    self.king_squares[captured_color] = to_square
+                self.bitboard.add_piece(captured_color, captured_type, to_square)
+                self.material[captured_color] += MATERIAL_VALUES[captured_type]
+                self.positional[captured_color] += SQUARE_VALUES[captured_color][captured_type][to_square]
 
     def get_captured_pieces(self, color: Color) -> list:
         """Returns list of captured pieces of specified color"""
-        all_pieces = {
-            Color.WHITE: {'♙': 8, '♖': 2, '♘': 2, '♗': 2, '♕': 1, '♔': 1},
-            Color.BLACK: {'♟': 8, '♜': 2, '♞': 2, '♝': 2, '♛': 1, '♚': 1}
+        symbols = {
+            Color.WHITE: {'Pawn': '♙', 'Rook': '♖', 'Knight': '♘', 'Bishop': '♗', 'Queen': '♕', 'King': '♔'},
+            Color.BLACK: {'Pawn': '♟', 'Rook': '♜', 'Knight': '♞', 'Bishop': '♝', 'Queen': '♛', 'King': '♚'}
         }
         
-        # Count current pieces on board
-        current_pieces = {'♙': 0, '♖': 0, '♘': 0, '♗': 0, '♕': 0, '♔': 0,
-                        '♟': 0, '♜': 0, '♞': 0, '♝': 0, '♛': 0, '♚': 0}
-        
-        for y in range(8):
-            for x in range(8):
-                piece = self.squares[x][y].piece
-                if piece:
-                    symbol = self.get_piece_symbol(piece).strip()
-                    current_pieces[symbol] += 1
-        
-        # Calculate captured pieces
+        # Compare the piece counts on the bitboards with the starting counts
+        index = color_index(color)
         captured = []
-        target_pieces = all_pieces[color]
-        for symbol, total in target_pieces.items():
-            diff = total - current_pieces[symbol]
-            captured.extend([symbol] * diff)
+        for name, total in self.STARTING_PIECES.items():
+            diff = total - self.bitboard.count(index, PIECE_TYPES.index(name))
+            captured.extend([symbols[color][name]] * diff)
         
         return captured
 
@@ -125,24 +335,14 @@ class Board:
     
     def get_pieces(self, color: Color) -> list[Piece]:
         """ Gets all none taken pieces based on Color(Black|White)"""
-        piece_list = []
-        for y in range(8):
-            for x in range(8):
-                square_piece = self.squares[x][y].piece
-                if square_piece:
-                    if square_piece.color == color:
-                        piece_list.append(square_piece)
-                
-        return piece_list
+        return list(self.piece_lists[color_index(color)])
     
     def find_kings_position(self, color: Color) -> Position:
         """Gets the kings position based on Color"""
-        for y in range(8):
-            for x in range(8):
-                if isinstance(self.squares[x][y].piece, King):
-                    if self.squares[x][y].piece.color == color:
-                        return Position(x,y) 
-        return None
+        king_square = self.king_squares[color_index(color)]
+        if king_square < 0:
+            return None
+        return square_position(king_square)
         
 
     @staticmethod
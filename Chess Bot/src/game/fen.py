@@ -0,0 +1,64 @@
+from typing import List, Tuple
+from src.game.bitboard import BitBoard, WHITE, BLACK
+
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+# FEN letter of each piece type index; uppercase is white
+PIECE_LETTERS = 'pnbrqk'
+
+
+def parse_fen(fen: str) -> Tuple[List[Tuple[int, int, int]], int]:
+    """Parses a FEN string into (square, color, piece type) placements and the color index to move.
+
+    Castling and en passant fields are accepted but ignored, as the game
+    does not implement those rules.
+    """
+    fields = fen.split()
+    if not fields:
+        raise ValueError("Empty FEN")
+    ranks = fields[0].split('/')
+    if len(ranks) != 8:
+        raise ValueError(f"FEN needs 8 ranks: {fen}")
+    side = fields[1] if len(fields) > 1 else 'w'
+    if side not in ('w', 'b'):
+        raise ValueError(f"Invalid side to move: {side}")
+
+    placement = []
+    for row, rank in enumerate(ranks):
+        y = 7 - row
+        x = 0
+        for char in rank:
+            if char.isdigit():
+                x += int(char)
+                continue
+            piece_type = PIECE_LETTERS.find(char.lower())
+            if piece_type < 0 or x > 7:
+                raise ValueError(f"Invalid FEN rank: {rank}")
+            placement.append((y * 8 + x, WHITE if char.isupper() else BLACK, piece_type))
+            x += 1
+        if x != 8:
+            raise ValueError(f"FEN rank does not cover 8 files: {rank}")
+    return placement, WHITE if side == 'w' else BLACK
+
+
+def format_fen(bitboard: BitBoard, side: int) -> str:
+    """Writes the position on a bitboard and the color index to move as a FEN string."""
+    ranks = []
+    for y in range(7, -1, -1):
+        rank = ''
+        empty = 0
+        for x in range(8):
+            piece = bitboard.piece_at(y * 8 + x)
+            if piece is None:
+                empty += 1
+                continue
+            if empty:
+                rank += str(empty)
+                empty = 0
+            color, piece_type = piece
+            letter = PIECE_LETTERS[piece_type]
+            rank += letter.upper() if color == WHITE else letter
+        if empty:
+            rank += str(empty)
+        ranks.append(rank)
+    return f"{'/'.join(ranks)} {'w' if side == WHITE else 'b'} - - 0 1"
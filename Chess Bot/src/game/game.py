@@ -1,17 +1,27 @@
+from src.game.bitboard import color_index
 from src.game.board import Board
 from src.game.move import Move
+from src.game.movegen import generate_legal_moves, in_check
 from src.game.position import Position
 from src.players.player import Player
-from typing import List
+from typing import List, Optional
 from src.enums.color import Color
 from src.enums.game_status import GameStatus
 
 class Game:
+    # Occurrences of a position, and plies without a capture or pawn move, that end the game in a draw
+    REPETITION_LIMIT = 3
+    FIFTY_MOVE_PLIES = 100
+
     def __init__(self):
         self.board = Board()
         self.players: List[Player] = []
         self.current_player: Player = None
         self.game_status = GameStatus.ONGOING
+        # Why a drawn game was drawn: 'repetition' or 'fifty moves'
+        self.draw_reason: Optional[str] = None
+        # Prints capture messages when True; headless runs turn it off
+        self.verbose = True
 
     def start_game(self, player1, player2):
         """Initializes and begins the game. And sets the players"""
@@ -20,8 +30,8 @@ class Game:
         self.current_player = self.players[0]
         
     
-    def play_turn(self):
-        """executes the current turn"""
+    def play_turn(self) -> Optional[Move]:
+        """executes the current turn and returns the move played, None if the player had none"""
         player_move = self.current_player.make_move(self)  
         
         if player_move is None:
@@ -29,20 +39,49 @@ class Game:
                 self.game_status = GameStatus.CHECKMATE
             elif self.is_stalemate():
                 self.game_status = GameStatus.STALEMATE
-            return
+            return None
             
-        player_move.execute(self.board)
-        
-
-        player_move.piece_moved.move_to(player_move.to_position)
+        self.board.make_move(player_move)
+        mover = self.current_player
         
 
-        if player_move.piece_captured:
+        if player_move.piece_captured and self.verbose:
             print(f"{player_move.piece_moved.__class__.__name__} captures {player_move.piece_captured.__class__.__name__}")
             
 
         self.switch_turn()
+        self.check_draw()
+        mover.after_move(self)
+        return player_move
         
+    def load_fen(self, fen: str):
+        """Sets up a FEN position and hands the turn to the player of the color to move."""
+        self.set_side_to_move(self.board.load_fen(fen))
+
+    def to_fen(self) -> str:
+        """Returns the current position as a FEN string."""
+        return self.board.to_fen(self.side_to_move())
+
+    def pack(self) -> bytes:
+        """Returns the current position in the board's compact packed form."""
+        return self.board.pack(self.side_to_move())
+
+    def load_packed(self, data: bytes):
+        """Sets up a position from pack output and hands the turn to the color to move."""
+        self.set_side_to_move(self.board.load_packed(data))
+
+    def side_to_move(self) -> Color:
+        """Returns the color of the current player, white before the game has players."""
+        return self.current_player.color if self.current_player is not None else Color.WHITE
+
+    def set_side_to_move(self, color: Color):
+        """Makes the player of a color the current player."""
+        self.game_status = GameStatus.ONGOING
+        self.draw_reason = None
+        for player in self.players:
+            if player.color == color:
+                self.current_player = player
+
     def setup_players(self, player1, player2):
         """Adds players to players list, this player2 can be algorithm or human."""
         self.players.append(player1)
@@ -57,7 +96,7 @@ class Game:
             case GameStatus.STALEMATE:
                 print("Stalemate")
             case GameStatus.DRAW:
-                print("Draw")
+                print(f"Draw by {self.draw_reason}" if self.draw_reason else "Draw")
             case GameStatus.ONGOING:
                 print("Draw")
         
@@ -70,23 +109,30 @@ class Game:
             self.current_player = self.players[0]          
         
 
+    def check_draw(self) -> bool:
+        """Ends the game in a draw on threefold repetition or after fifty moves without a capture or pawn move."""
+        board = self.board
+        if board.repetitions(color_index(self.side_to_move())) + 1 >= self.REPETITION_LIMIT:
+            self.draw_reason = 'repetition'
+        elif board.halfmove_clock() >= self.FIFTY_MOVE_PLIES:
+            self.draw_reason = 'fifty moves'
+        else:
+            return False
+        self.game_status = GameStatus.DRAW
+        return True
+
     def is_check(self, color = None) -> bool:
         """Determines if a player is in check."""
         if color == None:
             color = self.current_player.color
-        to_positions = self.get_valid_moves()
-        if color == Color.WHITE:
-            enemy_king_position = self.board.find_kings_position(Color.BLACK)
-        else:
-            enemy_king_position = self.board.find_kings_position(Color.WHITE)
-        if enemy_king_position == None:
+        enemy = 1 - color_index(color)
+        enemy_king_square = self.board.bitboard.king_square(enemy)
+        if enemy_king_square < 0:
             self.game_status = GameStatus.CHECKMATE
             self.end_game()
             return True
-        for position in to_positions:
-            if position.x == enemy_king_position.x and position.y == enemy_king_position.y:
-                return True
-        return False
+        return bool(self.board.attacked_squares(color) >> enemy_king_square & 1)
+
     def get_valid_moves_for_color(self, color: Color) -> List[Position]:
         """Returns a list of all positions attacked by the given color's pieces."""
         pieces = self.board.get_pieces(color)
@@ -96,90 +142,44 @@ class Game:
         return positions
     
     def self_check(self):
-        current_index = self.players.index(self.current_player)
-        non_current_index = (current_index + 1) % 2
-        opponent = self.players[non_current_index]
-        to_positions = self.get_valid_moves(opponent)
-        if self.current_player == Color.WHITE:
-            king_position = self.board.find_kings_position(Color.WHITE)
-        else:
-            king_position = self.board.find_kings_position(Color.BLACK)
-        if king_position == None:
-            return True
-        for position in to_positions:
-            if position.x == king_position.x and position.y == king_position.y:
-                return True
-        return False
-
-    def is_checkmate(self) -> bool:
-        """Determines if the current player is in checkmate."""
-        if self.board.find_kings_position(self.current_player.color) == None:
-            self.game_status = GameStatus.CHECKMATE
+        """Determines if the current player's king is attacked, or missing."""
+        color = color_index(self.current_player.color)
+        king_square = self.board.bitboard.king_square(color)
+        if king_square < 0:
             return True
-        if not self.is_check():
-            return False
+        opponent = Color.BLACK if color == 0 else Color.WHITE
+        return bool(self.board.attacked_squares(opponent) >> king_square & 1)
 
-        # Try all possible moves for the current player
-        color_to_check = None
-        if self.current_player.color == Color.WHITE:
-            color_to_check = Color.BLACK
-        else:
-            color_to_check = Color.WHITE
-        pieces = self.board.get_pieces(color_to_check)
-        for piece in pieces:
-            from_position = piece.position
-            valid_moves = piece.get_valid_moves(self.board)
-
-            for to_position in valid_moves:
-                captured_piece = self.board.get_piece_at(to_position)
-                move = Move(from_position, to_position, piece, captured_piece)
-                move.execute(self.board)
-
-                # Check if this move gets out of check
-                is_still_in_check = self.is_check()
-
-                move.undo(self.board)
+    def legal_moves(self, color: Color = None) -> List[Move]:
+        """Returns the legal moves of a color, the current player's by default."""
+        if color == None:
+            color = self.current_player.color
+        codes = generate_legal_moves(self.board.bitboard, color_index(color))
+        return [Move.from_code(code, self.board) for code in codes]
 
-                if not is_still_in_check:
-                    return False
-        else:
+    def is_checkmate(self, color: Color = None) -> bool:
+        """Determines if a player, the current player by default, is checkmated."""
+        if color == None:
+            color = self.current_player.color
+        index = color_index(color)
+        bitboard = self.board.bitboard
+        if bitboard.king_square(index) < 0 or (in_check(bitboard, index) and
+                                                not generate_legal_moves(bitboard, index)):
             self.game_status = GameStatus.CHECKMATE
             return True
-        
-                        
-    def in_check_valid_moves(self) -> List[Move]:
-        move_list = []
-        pieces = self.board.get_pieces(self.current_player.color)
-        for piece in pieces:
-            from_position = piece.position
-            valid_moves = piece.get_valid_moves(self.board)
-
-            for to_position in valid_moves:
-                captured_piece = self.board.get_piece_at(to_position)
-                move = Move(from_position, to_position, piece, captured_piece)
-                move.execute(self.board)
-
-                # Check if this move gets out of check
-                is_still_in_check = self.self_check()
-
-                move.undo(self.board)
-
-                if not is_still_in_check:
-                    move_list.append(move)
-        return move_list
-                    
+        return False
 
-            
-            
+    def in_check_valid_moves(self) -> List[Move]:
+        """Returns the current player's moves that get out of check."""
+        return self.legal_moves()
 
     def is_stalemate(self) -> bool:
         """Determines if the game is a stalemate."""
-        if len(self.current_player.get_available_moves(self.board)) == 0:
-            if not self.is_check():
-                self.game_status = GameStatus.STALEMATE
-                return True
-        else:
-            return False
+        color = color_index(self.current_player.color)
+        if not generate_legal_moves(self.board.bitboard, color) and not in_check(self.board.bitboard, color):
+            self.game_status = GameStatus.STALEMATE
+            return True
+        return False
 
     def get_valid_moves(self, player=None) -> List[Position]:
         """Retrieves all valid moves for the current player."""
@@ -1,11 +1,58 @@
 from typing import TYPE_CHECKING, Optional
-from src.game.position import Position
+from src.game.position import Position, SQUARE_POSITIONS
+from src.game.bitboard import piece_index
 
 if TYPE_CHECKING:
     from src.game.board import Board
     from src.pieces.piece import Piece
 
+# Compact move encoding used by the move generator and the search:
+# bits 0-5 from square, bits 6-11 to square, bits 12-14 moved piece type,
+# bits 15-17 captured piece type + 1 (0 when nothing is captured).
+NO_CAPTURE = -1
+
+
+def encode_move(from_square: int, to_square: int, piece_type: int, captured_type: int = NO_CAPTURE) -> int:
+    """Packs a move into a single int."""
+    return from_square | (to_square << 6) | (piece_type << 12) | ((captured_type + 1) << 15)
+
+
+def move_from(code: int) -> int:
+    """Returns the from square of an encoded move."""
+    return code & 63
+
+
+def move_to(code: int) -> int:
+    """Returns the to square of an encoded move."""
+    return (code >> 6) & 63
+
+
+def move_piece(code: int) -> int:
+    """Returns the moved piece type of an encoded move."""
+    return (code >> 12) & 7
+
+
+def move_captured(code: int) -> int:
+    """Returns the captured piece type of an encoded move, or NO_CAPTURE."""
+    return ((code >> 15) & 7) - 1
+
+
+def square_name(square: int) -> str:
+    """Returns the lowercase name of a square index, e.g. 28 -> e4."""
+    return 'abcdefgh'[square & 7] + str((square >> 3) + 1)
+
+
+def move_name(code: int) -> str:
+    """Returns an encoded move in coordinate notation for display, e.g. e2e4."""
+    return square_name(code & 63) + square_name((code >> 6) & 63)
+
+
 class Move:
+    # Fixed attributes: no per-instance dict for the objects the search creates at every node.
+    # previous_has_moved and previous_key are the undo record filled in by execute.
+    __slots__ = ('from_position', 'to_position', 'piece_moved', 'piece_captured', 'executed',
+                 'previous_has_moved', 'previous_key', 'captured_index')
+
     def __init__(self, 
                  from_position: Position, 
                  to_position: Position,
@@ -16,27 +63,59 @@ class Move:
         self.piece_moved = piece_moved
         self.piece_captured = piece_captured
         self.executed = False
+        self.previous_has_moved = False
+        self.previous_key = 0
+        # Where the captured piece stood in the board's piece list, so undo puts it back in place
+        self.captured_index = -1
 
     def execute(self, board: 'Board'):
-        """Executes the move on the board."""
+        """Executes the move on the board, moving the piece object with it.
+
+        The piece's previous has_moved flag is kept on the move so undo can
+        restore it; the board records the move on its undo stack.
+        """
         if not self.executed:
+            piece = self.piece_moved
+            self.previous_has_moved = piece.has_moved
             from_square = board.squares[self.from_position.x][self.from_position.y]
             from_square.remove_piece()
             to_square = board.squares[self.to_position.x][self.to_position.y]
-            to_square.set_piece(self.piece_moved)
+            to_square.set_piece(piece)
+            piece.position = self.to_position
+            piece.has_moved = True
+            board.apply_move_state(self)
             self.executed = True
         
 
     def undo(self, board: 'Board'):
-        """Reverts the move."""
+        """Reverts the move, restoring the piece's position and has_moved flag."""
         if self.executed:
+            piece = self.piece_moved
             to_square = board.squares[self.to_position.x][self.to_position.y]
             to_square.set_piece(self.piece_captured)
             from_square = board.squares[self.from_position.x][self.from_position.y]
-            from_square.set_piece(self.piece_moved)
+            from_square.set_piece(piece)
+            piece.position = self.from_position
+            piece.has_moved = self.previous_has_moved
+            board.revert_move_state(self)
             self.executed = False
         
 
+    @classmethod
+    def from_code(cls, code: int, board: 'Board') -> 'Move':
+        """Builds a Move for the pieces currently on the board from an encoded move."""
+        from_position = SQUARE_POSITIONS[code & 63]
+        to_position = SQUARE_POSITIONS[(code >> 6) & 63]
+        squares = board.squares
+        return cls(from_position, to_position, squares[from_position.x][from_position.y].piece,
+                   squares[to_position.x][to_position.y].piece)
+
+    def encode(self) -> int:
+        """Packs this move into the compact int form used by the search."""
+        captured_type = NO_CAPTURE if self.piece_captured is None else piece_index(self.piece_captured)
+        return encode_move(self.from_position.square, self.to_position.square,
+                           piece_index(self.piece_moved), captured_type)
+
     def __eq__(self, other):
         if isinstance(other, Move):
             return (self.from_position == other.from_position and
@@ -0,0 +1,330 @@
+from typing import Dict, List
+from src.game.bitboard import BitBoard, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, WHITE, BLACK, iter_bits
+from src.game.move import encode_move
+
+# Ray directions as (dx, dy); the first four increase the square index,
+# so their nearest blocker is the lowest set bit, the last four the highest.
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (-1, 1),
+              (0, -1), (-1, 0), (-1, -1), (1, -1)]
+
+KNIGHT_DELTAS = [(-1, 2), (1, 2), (-2, 1), (2, 1), (-2, -1), (2, -1), (-1, -2), (1, -2)]
+KING_DELTAS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def _leaper_table(deltas) -> List[int]:
+    """Builds the attack mask of a single-step piece for every square."""
+    table = []
+    for square in range(64):
+        x, y = square & 7, square >> 3
+        mask = 0
+        for dx, dy in deltas:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < 8 and 0 <= ny < 8:
+                mask |= 1 << (ny * 8 + nx)
+        table.append(mask)
+    return table
+
+
+def _ray_table(dx: int, dy: int) -> List[int]:
+    """Builds the empty-board ray in one direction for every square."""
+    table = []
+    for square in range(64):
+        x, y = (square & 7) + dx, (square >> 3) + dy
+        mask = 0
+        while 0 <= x < 8 and 0 <= y < 8:
+            mask |= 1 << (y * 8 + x)
+            x += dx
+            y += dy
+        table.append(mask)
+    return table
+
+
+KNIGHT_ATTACKS = _leaper_table(KNIGHT_DELTAS)
+KING_ATTACKS = _leaper_table(KING_DELTAS)
+# Squares a pawn of each color attacks, indexed [color][square]
+PAWN_ATTACKS = [_leaper_table([(-1, 1), (1, 1)]), _leaper_table([(-1, -1), (1, -1)])]
+RAYS = [_ray_table(dx, dy) for dx, dy in DIRECTIONS]
+
+# Directions along ranks and files; the others are diagonals
+STRAIGHT_DIRECTIONS = (0, 1, 4, 5)
+
+PAWN_START_RANK = (1, 6)
+PAWN_STEP = (8, -8)
+
+
+def _nearest(direction: int, blockers: int) -> int:
+    """Returns the blocker square closest to the origin of a ray."""
+    if direction < 4:
+        return (blockers & -blockers).bit_length() - 1
+    return blockers.bit_length() - 1
+
+
+def ray_attacks(direction: int, square: int, occupied: int) -> int:
+    """Returns the squares attacked along one ray, up to and including the first blocker."""
+    ray = RAYS[direction][square]
+    blockers = ray & occupied
+    if blockers:
+        ray ^= RAYS[direction][_nearest(direction, blockers)]
+    return ray
+
+
+def bishop_attacks(square: int, occupied: int) -> int:
+    """Returns the diagonal attacks from a square."""
+    return (ray_attacks(2, square, occupied) | ray_attacks(3, square, occupied) |
+            ray_attacks(6, square, occupied) | ray_attacks(7, square, occupied))
+
+
+def rook_attacks(square: int, occupied: int) -> int:
+    """Returns the rank and file attacks from a square."""
+    return (ray_attacks(0, square, occupied) | ray_attacks(1, square, occupied) |
+            ray_attacks(4, square, occupied) | ray_attacks(5, square, occupied))
+
+
+def attacks_from(piece_type: int, color: int, square: int, occupied: int) -> int:
+    """Returns the squares a piece attacks from a square given the board occupancy."""
+    if piece_type == KNIGHT:
+        return KNIGHT_ATTACKS[square]
+    if piece_type == KING:
+        return KING_ATTACKS[square]
+    if piece_type == PAWN:
+        return PAWN_ATTACKS[color][square]
+    if piece_type == BISHOP:
+        return bishop_attacks(square, occupied)
+    if piece_type == ROOK:
+        return rook_attacks(square, occupied)
+    return bishop_attacks(square, occupied) | rook_attacks(square, occupied)
+
+
+def is_square_attacked(bitboard: BitBoard, square: int, by_color: int) -> bool:
+    """Probes outward from a square to see whether any piece of by_color attacks it."""
+    pieces = bitboard.pieces[by_color]
+    if KNIGHT_ATTACKS[square] & pieces[KNIGHT]:
+        return True
+    if KING_ATTACKS[square] & pieces[KING]:
+        return True
+    # A pawn of by_color attacks this square if a pawn of the other color here would attack it
+    if PAWN_ATTACKS[1 - by_color][square] & pieces[PAWN]:
+        return True
+    occupied = bitboard.occupied
+    diagonal = pieces[BISHOP] | pieces[QUEEN]
+    if diagonal and bishop_attacks(square, occupied) & diagonal:
+        return True
+    straight = pieces[ROOK] | pieces[QUEEN]
+    return bool(straight and rook_attacks(square, occupied) & straight)
+
+
+def attack_map(bitboard: BitBoard, color: int) -> int:
+    """Returns the mask of every square a color's pieces attack."""
+    occupied = bitboard.occupied
+    attacked = 0
+    for piece_type, pieces in enumerate(bitboard.pieces[color]):
+        for square in iter_bits(pieces):
+            attacked |= attacks_from(piece_type, color, square, occupied)
+    return attacked
+
+
+def attackers_to(bitboard: BitBoard, square: int, by_color: int, occupied: int) -> int:
+    """Returns the mask of by_color's pieces attacking a square, given an occupancy to block sliders."""
+    pieces = bitboard.pieces[by_color]
+    attackers = ((KNIGHT_ATTACKS[square] & pieces[KNIGHT]) | (KING_ATTACKS[square] & pieces[KING]) |
+                 (PAWN_ATTACKS[1 - by_color][square] & pieces[PAWN]))
+    diagonal = pieces[BISHOP] | pieces[QUEEN]
+    if diagonal:
+        attackers |= bishop_attacks(square, occupied) & diagonal
+    straight = pieces[ROOK] | pieces[QUEEN]
+    if straight:
+        attackers |= rook_attacks(square, occupied) & straight
+    return attackers
+
+
+def in_check(bitboard: BitBoard, color: int) -> bool:
+    """Returns whether a color's king is attacked; a side without a king is never in check."""
+    king = bitboard.king_square(color)
+    return king >= 0 and is_square_attacked(bitboard, king, 1 - color)
+
+
+def _captured_type(enemy_pieces: List[int], bit: int) -> int:
+    """Returns the type of the enemy piece on a single-bit mask."""
+    for piece_type in range(6):
+        if enemy_pieces[piece_type] & bit:
+            return piece_type
+    return -1
+
+
+def generate_moves(bitboard: BitBoard, color: int, captures_only: bool = False) -> List[int]:
+    """Generates the encoded pseudo-legal moves for a color.
+
+    Follows the rules the piece classes implement: pawns push one or two
+    squares and capture diagonally, and there is no castling, en passant or
+    promotion. Moves that leave the king attacked are included.
+    """
+    moves = []
+    append = moves.append
+    own_pieces = bitboard.pieces[color]
+    enemy_pieces = bitboard.pieces[1 - color]
+    enemy = bitboard.occupancy[1 - color]
+    occupied = bitboard.occupied
+    targets_mask = enemy if captures_only else ~bitboard.occupancy[color]
+
+    for piece_type in (KNIGHT, BISHOP, ROOK, QUEEN, KING):
+        for square in iter_bits(own_pieces[piece_type]):
+            targets = attacks_from(piece_type, color, square, occupied) & targets_mask
+            while targets:
+                bit = targets & -targets
+                targets ^= bit
+                captured = _captured_type(enemy_pieces, bit) if bit & enemy else -1
+                append(encode_move(square, bit.bit_length() - 1, piece_type, captured))
+
+    step = PAWN_STEP[color]
+    start_rank = PAWN_START_RANK[color]
+    pawn_attacks = PAWN_ATTACKS[color]
+    for square in iter_bits(own_pieces[PAWN]):
+        targets = pawn_attacks[square] & enemy
+        while targets:
+            bit = targets & -targets
+            targets ^= bit
+            append(encode_move(square, bit.bit_length() - 1, PAWN, _captured_type(enemy_pieces, bit)))
+        if captures_only:
+            continue
+        forward = square + step
+        if 0 <= forward < 64 and not occupied & (1 << forward):
+            append(encode_move(square, forward, PAWN))
+            double = forward + step
+            if square >> 3 == start_rank and not occupied & (1 << double):
+                append(encode_move(square, double, PAWN))
+
+    return moves
+
+
+def between(square: int, target: int) -> int:
+    """Returns the squares strictly after square up to and including target on a shared line, else 0."""
+    bit = 1 << target
+    for direction in range(8):
+        ray = RAYS[direction][square]
+        if ray & bit:
+            return ray ^ RAYS[direction][target]
+    return 0
+
+
+def pinned_pieces(bitboard: BitBoard, color: int, king: int) -> Dict[int, int]:
+    """Maps each piece pinned to its king to the squares it may still move to along the pin."""
+    pins = {}
+    own = bitboard.occupancy[color]
+    enemy_pieces = bitboard.pieces[1 - color]
+    straight = enemy_pieces[ROOK] | enemy_pieces[QUEEN]
+    diagonal = enemy_pieces[BISHOP] | enemy_pieces[QUEEN]
+    occupied = bitboard.occupied
+    for direction in range(8):
+        sliders = straight if direction in STRAIGHT_DIRECTIONS else diagonal
+        ray = RAYS[direction][king]
+        if not ray & sliders:
+            continue
+        blockers = ray & occupied
+        first = _nearest(direction, blockers)
+        if not own & (1 << first):
+            continue
+        blockers ^= 1 << first
+        if not blockers:
+            continue
+        second = _nearest(direction, blockers)
+        if sliders & (1 << second):
+            pins[first] = ray ^ RAYS[direction][second]
+    return pins
+
+
+def generate_legal_moves(bitboard: BitBoard, color: int, captures_only: bool = False) -> List[int]:
+    """Generates the encoded legal moves for a color.
+
+    Checkers and pinned pieces are found once for the position, so no move
+    has to be played to see whether it leaves the king attacked. A side
+    without a king gets its pseudo-legal moves.
+    """
+    king = bitboard.king_square(color)
+    if king < 0:
+        return generate_moves(bitboard, color, captures_only)
+
+    moves = []
+    append = moves.append
+    enemy_color = 1 - color
+    own_pieces = bitboard.pieces[color]
+    enemy_pieces = bitboard.pieces[enemy_color]
+    enemy = bitboard.occupancy[enemy_color]
+    occupied = bitboard.occupied
+    allowed = enemy if captures_only else ~bitboard.occupancy[color]
+
+    # The king is lifted off the board so it cannot shield the square behind it from a slider
+    without_king = occupied ^ (1 << king)
+    targets = KING_ATTACKS[king] & allowed
+    while targets:
+        bit = targets & -targets
+        targets ^= bit
+        square = bit.bit_length() - 1
+        if not attackers_to(bitboard, square, enemy_color, without_king):
+            captured = _captured_type(enemy_pieces, bit) if bit & enemy else -1
+            append(encode_move(king, square, KING, captured))
+
+    checkers = attackers_to(bitboard, king, enemy_color, occupied)
+    if checkers & (checkers - 1):
+        # Double check: only the king can move
+        return moves
+    if checkers:
+        # Capture the checker or block its line
+        allowed &= between(king, checkers.bit_length() - 1) | checkers
+    pins = pinned_pieces(bitboard, color, king)
+
+    for piece_type in (KNIGHT, BISHOP, ROOK, QUEEN):
+        for square in iter_bits(own_pieces[piece_type]):
+            targets = attacks_from(piece_type, color, square, occupied) & allowed
+            if square in pins:
+                targets &= pins[square]
+            while targets:
+                bit = targets & -targets
+                targets ^= bit
+                captured = _captured_type(enemy_pieces, bit) if bit & enemy else -1
+                append(encode_move(square, bit.bit_length() - 1, piece_type, captured))
+
+    step = PAWN_STEP[color]
+    start_rank = PAWN_START_RANK[color]
+    pawn_attacks = PAWN_ATTACKS[color]
+    for square in iter_bits(own_pieces[PAWN]):
+        limit = allowed & pins[square] if square in pins else allowed
+        targets = pawn_attacks[square] & enemy & limit
+        while targets:
+            bit = targets & -targets
+            targets ^= bit
+            append(encode_move(square, bit.bit_length() - 1, PAWN, _captured_type(enemy_pieces, bit)))
+        if captures_only:
+            continue
+        forward = square + step
+        if 0 <= forward < 64 and not occupied & (1 << forward):
+            if limit & (1 << forward):
+                append(encode_move(square, forward, PAWN))
+            double = forward + step
+            if square >> 3 == start_rank and not occupied & (1 << double) and limit & (1 << double):
+                append(encode_move(square, double, PAWN))
+
+    return moves
+
+
+def make_move(bitboard: BitBoard, code: int):
+    """Applies an encoded move to a bitboard."""
+    from_square = code & 63
+    to_square = (code >> 6) & 63
+    piece_type = (code >> 12) & 7
+    captured = ((code >> 15) & 7) - 1
+    color = WHITE if bitboard.occupancy[WHITE] & (1 << from_square) else BLACK
+    if captured >= 0:
+        bitboard.remove_piece(1 - color, captured, to_square)
+    bitboard.move_piece(color, piece_type, from_square, to_square)
+
+
+def unmake_move(bitboard: BitBoard, code: int):
+    """Reverts an encoded move previously applied with make_move."""
+    from_square = code & 63
+    to_square = (code >> 6) & 63
+    piece_type = (code >> 12) & 7
+    captured = ((code >> 15) & 7) - 1
+    color = WHITE if bitboard.occupancy[WHITE] & (1 << to_square) else BLACK
+    bitboard.move_piece(color, piece_type, to_square, from_square)
+    if captured >= 0:
+        bitboard.add_piece(1 - color, captured, to_square)
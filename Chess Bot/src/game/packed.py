@@ -0,0 +1,40 @@
+from typing import List, Tuple
+from src.game.bitboard import BitBoard, iter_bits
+
+# 8 bytes of occupancy, one nibble per occupied square (at most 32) and a side-to-move byte
+PACKED_SIZE = 25
+MAX_PIECES = 32
+
+
+def pack_position(bitboard: BitBoard, side: int) -> bytes:
+    """Packs a position into PACKED_SIZE bytes.
+
+    The occupancy mask says which squares hold a piece; each of those
+    squares, lowest first, then gets a nibble of color << 3 | piece type.
+    """
+    occupied = bitboard.occupied
+    squares = list(iter_bits(occupied))
+    if len(squares) > MAX_PIECES:
+        raise ValueError(f"Cannot pack more than {MAX_PIECES} pieces")
+    nibbles = bytearray(MAX_PIECES // 2)
+    for index, square in enumerate(squares):
+        color, piece_type = bitboard.piece_at(square)
+        nibbles[index >> 1] |= (color << 3 | piece_type) << ((index & 1) * 4)
+    return occupied.to_bytes(8, 'little') + bytes(nibbles) + bytes((side,))
+
+
+def unpack_position(data: bytes) -> Tuple[List[Tuple[int, int, int]], int]:
+    """Unpacks pack_position output into (square, color, piece type) placements and the color to move."""
+    if len(data) != PACKED_SIZE:
+        raise ValueError(f"Packed position must be {PACKED_SIZE} bytes")
+    occupied = int.from_bytes(data[:8], 'little')
+    placement = []
+    for index, square in enumerate(iter_bits(occupied)):
+        nibble = (data[8 + (index >> 1)] >> ((index & 1) * 4)) & 15
+        if nibble & 7 > 5:
+            raise ValueError("Invalid piece type in packed position")
+        placement.append((square, nibble >> 3, nibble & 7))
+    side = data[24]
+    if side > 1:
+        raise ValueError("Invalid side to move in packed position")
+    return placement, side
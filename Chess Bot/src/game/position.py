@@ -1,4 +1,7 @@
 class Position:
+    # Fixed attributes: no per-instance dict, as moves create positions by the thousand
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -9,6 +12,20 @@ class Position:
                 return True
         return False
 
+    @property
+    def square(self) -> int:
+        """Returns the 0-63 square index of this position (A1 = 0, H8 = 63)."""
+        return self.y * 8 + self.x
+
+    @staticmethod
+    def at(x: int, y: int) -> 'Position':
+        """Returns the shared Position of an on-board square instead of allocating one.
+
+        Positions are never modified once created, so one instance per square
+        can be handed out everywhere.
+        """
+        return SQUARE_POSITIONS[y * 8 + x]
+
     def __eq__(self, other):
         if isinstance(other, Position):
             return self.x == other.x and self.y == other.y
@@ -18,4 +35,8 @@ class Position:
         return hash((self.x, self.y))
 
     def __repr__(self):
-        return f"Position(x={self.x}, y={self.y})"
\ No newline at end of file
+        return f"Position(x={self.x}, y={self.y})"
+
+
+# Shared Position of every square index
+SQUARE_POSITIONS = [Position(square & 7, square >> 3) for square in range(64)]
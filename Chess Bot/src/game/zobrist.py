@@ -0,0 +1,27 @@
+import random
+from src.game.bitboard import BitBoard, iter_bits
+
+# Fixed seed so keys are identical across runs and processes, which keeps
+# hashes stored on disk or sent between workers meaningful.
+_random = random.Random(0x5A0B1157)
+
+# PIECE_KEYS[color][piece_type][square]
+PIECE_KEYS = [[[_random.getrandbits(64) for _ in range(64)] for _ in range(6)] for _ in range(2)]
+# XORed into the key when black is to move, indexed by color
+SIDE_KEYS = (0, _random.getrandbits(64))
+
+
+def compute_key(bitboard: BitBoard) -> int:
+    """Computes the placement key of a bitboard from scratch."""
+    key = 0
+    for color in range(2):
+        for piece_type in range(6):
+            keys = PIECE_KEYS[color][piece_type]
+            for square in iter_bits(bitboard.pieces[color][piece_type]):
+                key ^= keys[square]
+    return key
+
+
+def position_key(placement_key: int, color: int) -> int:
+    """Combines a placement key with the side to move."""
+    return placement_key ^ SIDE_KEYS[color]
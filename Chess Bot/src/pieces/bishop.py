@@ -3,25 +3,24 @@ from src.game.position import Position
 from typing import List
 
 class Bishop(Piece):
-    def get_valid_moves(self, board) -> List[Position]:
-        """Gets list of available moves."""
+    DIRECTIONS = (
+        (-1,-1),        (-1,1),
 
-        directions = [
-            (-1,-1),        (-1,1),
+        (1,-1),         (1,1)
+    )
 
-            (1,-1),         (1,1)
-        ]
+    def get_valid_moves(self, board) -> List[Position]:
+        """Gets list of available moves."""
 
         valid_moves = []
 
-        for dx,dy in directions:
+        for dx,dy in self.DIRECTIONS:
             x = self.position.x
             y = self.position.y
 
             while True:
                 x += dx
                 y += dy
-                new_pos = Position(x,y)
 
                 # Checks new position is within board bounds
                 if 0 <=x < 8 and 0 <= y < 8:
@@ -29,10 +28,10 @@ class Bishop(Piece):
                     piece_at_pos = target_square.piece
                     # Adds position if square is empty
                     if not piece_at_pos:
-                        valid_moves.append(new_pos)
+                        valid_moves.append(Position.at(x, y))
                     # Adds position if enemy piece present
                     elif piece_at_pos.color != self.color:
-                        valid_moves.append(new_pos)
+                        valid_moves.append(Position.at(x, y))
                         break
                     else:
                         break
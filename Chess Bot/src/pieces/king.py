@@ -3,18 +3,18 @@ from src.game.position import Position
 from typing import List
 
 class King(Piece):
+    DIRECTIONS = (
+        (-1,-1), (-1,0), (-1,1),
+        (0,-1),          (0,1),
+        (1,-1), (1,0), (1,1)
+    )
+
     def get_valid_moves(self, board) -> List[Position]:
         """Gets list of available moves."""
 
-        directions = [
-            (-1,-1), (-1,0), (-1,1),
-            (0,-1),          (0,1),
-            (1,-1), (1,0), (1,1)
-        ]
-
         valid_moves = []
 
-        for dx,dy in directions:
+        for dx,dy in self.DIRECTIONS:
             new_x = self.position.x + dx
             new_y = self.position.y + dy
 
@@ -23,7 +23,7 @@ class King(Piece):
                 target_square = board.squares[new_x][new_y]
 
                 if not target_square.is_occupied() or target_square.piece.color !=self.color:
-                    valid_moves.append(Position(new_x,new_y))
+                    valid_moves.append(Position.at(new_x, new_y))
 
         return valid_moves
 
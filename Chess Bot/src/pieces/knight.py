@@ -3,19 +3,19 @@ from src.game.position import Position
 from typing import List
 
 class Knight(Piece):
+    DIRECTIONS = (
+              (-1,2),    (1,2),
+        (-2,1),                (2,1),
+        (-2,-1),               (2,-1),
+              (-1,-2),   (1,-2)
+    )
+
     def get_valid_moves(self, board) -> List[Position]:
         """Gets list of available moves."""
 
-        directions = [
-                  (-1,2),    (1,2),
-            (-2,1),                (2,1),
-            (-2,-1),               (2,-1),
-                  (-1,-2),   (1,-2)
-        ]
-
         valid_moves = []
 
-        for dx,dy in directions:
+        for dx,dy in self.DIRECTIONS:
             new_x = self.position.x + dx
             new_y = self.position.y + dy
 
@@ -24,6 +24,6 @@ class Knight(Piece):
                 target_square = board.squares[new_x][new_y]
 
                 if not target_square.is_occupied() or target_square.piece.color !=self.color:
-                    valid_moves.append(Position(new_x,new_y))
+                    valid_moves.append(Position.at(new_x, new_y))
 
         return valid_moves
\ No newline at end of file
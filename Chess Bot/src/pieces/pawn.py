@@ -17,21 +17,25 @@ class Pawn(Piece):
         direction = 1 if self.color == Color.WHITE else -1  # White moves up, Black moves down
         starting_row = 1 if self.color == Color.WHITE else 6
 
+        forward_y = self.position.y + direction
+        if not 0 <= forward_y < 8:
+            return valid_moves
+
         # One square move (checks promotion)
-        forward_pos = Position(self.position.x, self.position.y + direction)
-        if 0 <= forward_pos.y < 8 and not board.get_piece_at(forward_pos):
+        forward_pos = Position.at(self.position.x, forward_y)
+        if not board.get_piece_at(forward_pos):
                 valid_moves.append(forward_pos)
 
         # Move two squares (first turn)
         if not self.has_moved and self.position.y == starting_row:
-            double_forward_pos = Position(self.position.x, self.position.y + 2 * direction)
+            double_forward_pos = Position.at(self.position.x, self.position.y + 2 * direction)
             if not board.get_piece_at(forward_pos) and not board.get_piece_at(double_forward_pos):
                 valid_moves.append(double_forward_pos)
 
         # Capturing moves (diagonal)
         for dx in [-1, 1]:
-            capture_pos = Position(self.position.x + dx, self.position.y + direction)
-            if 0 <= capture_pos.x < 8 and 0 <= capture_pos.y < 8:
+            if 0 <= self.position.x + dx < 8:
+                capture_pos = Position.at(self.position.x + dx, forward_y)
                 piece_at_capture = board.get_piece_at(capture_pos)
                 if piece_at_capture and piece_at_capture.color != self.color:  # Capture an opponent's piece
                     valid_moves.append(capture_pos)
@@ -3,24 +3,24 @@ from src.game.position import Position
 from typing import List
 
 class Queen(Piece):
+    DIRECTIONS = (
+        (-1,-1), (-1,0), (-1,1),
+        (0,-1),          (0,1),
+        (1,-1), (1,0), (1,1)
+    )
+
     def get_valid_moves(self, board) -> List[Position]:
         """Gets list of available moves."""
 
-        directions = [
-            (-1,-1), (-1,0), (-1,1),
-            (0,-1),          (0,1),
-            (1,-1), (1,0), (1,1)
-        ]
-
         valid_moves = []
         x, y = self.position.x, self.position.y
 
-        for dx, dy in directions:
+        for dx, dy in self.DIRECTIONS:
             nx, ny = x + dx, y + dy  # Start moving in the current direction
 
             # Traverse in the current direction
             while 0 <= nx < 8 and 0 <= ny < 8:  # Ensure within bounds
-                new_pos = Position(nx, ny)  # Create a position object for the target square
+                new_pos = Position.at(nx, ny)  # Shared position object of the target square
                 target_piece = board.get_piece_at(new_pos)  # Check what's on the target square
 
                 if target_piece is None:  # Empty square
@@ -3,24 +3,24 @@ from src.game.position import Position
 from typing import List
 
 class Rook(Piece):
+    DIRECTIONS = (
+        (0, 1),  # Right
+        (-1, 0),         (1, 0),  # Up, Down
+        (0, -1)  # Left
+    )
+
     def get_valid_moves(self, board) -> List[Position]:
         """Gets list of available moves."""
-        directions = [
-            (0, 1),  # Right
-            (-1, 0),         (1, 0),  # Up, Down
-            (0, -1)  # Left
-        ]
-
         valid_moves = []
         x, y = self.position.x, self.position.y
 
-        for dx, dy in directions:
+        for dx, dy in self.DIRECTIONS:
             nx = x + dx
             ny = y + dy
 
         # Check if the position is within bounds
             while 0 <= nx < 8 and 0 <= ny < 8:
-                new_pos = Position(nx, ny)
+                new_pos = Position.at(nx, ny)
                 target_square = board.squares[nx][ny]
 
                 if target_square.is_occupied():
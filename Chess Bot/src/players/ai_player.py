@@ -1,11 +1,76 @@
-from src.game.position import Position
+from src.game.bitboard import PIECE_TYPES, KNIGHT, BISHOP, ROOK, QUEEN, color_index
+from src.game.movegen import generate_legal_moves, in_check
+from src.game.piece_square_tables import MATERIAL_VALUES
+from src.game.zobrist import position_key
+from src.search.transposition_table import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from src.search.options import SearchOptions
+from src.search.move_ordering import MoveOrderer
+from src.search.opening_book import OpeningBook, default_book
+from src.search.tablebase import Tablebase, DRAW
+from src.search.stats import SearchStats
 from src.players.player import Player
 from src.enums.color import Color
-from src.game.move import Move
+from src.game.move import Move, move_name
 from src.game.game import Game
 from src.enums.game_status import GameStatus
-from typing import Optional, List
-import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import copy
+import multiprocessing
+import threading
+from typing import Callable, Optional, List, TextIO, Tuple
+import time
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the move's time budget has run out."""
+
+
+# Per-process search state of a parallel search worker, set by _init_worker
+_worker_player: Optional['AIPlayer'] = None
+_worker_game: Optional[Game] = None
+
+
+def _init_worker(color: Color, options: SearchOptions, stop_event=None):
+    """Creates the worker's own player and game; its transposition table lives as long as the process.
+
+    stop_event is the parent's shared flag, set to abort the tasks in progress.
+    """
+    global _worker_player, _worker_game
+    # Every option carries over; the root move is given, so no book, nested pool or pondering
+    worker_options = copy.copy(options)
+    worker_options.book = False
+    worker_options.workers = 1
+    worker_options.ponder = False
+    _worker_player = AIPlayer("worker", color, worker_options)
+    _worker_player.stop_event = stop_event
+    _worker_game = Game()
+
+
+def _search_root_move(packed: bytes, history: List[Tuple[int, int]], code: int, depth: int,
+                      budget: float) -> Tuple[Optional[float], SearchStats]:
+    """Scores one root move in a worker process; returns (score, statistics), score None if stopped in time.
+
+    history is the root board's repetition_history, so the worker sees repetitions of earlier positions.
+    budget is the seconds left when the task was submitted; perf_counter
+    has no common reference point across processes, so the worker turns it
+    into its own deadline. The parent enforces its deadline as well.
+    """
+    player = _worker_player
+    board = _worker_game.board
+    board.load_packed(packed)
+    board.prior_keys = history
+    move = Move.from_code(code, board)
+    player.stats = SearchStats()
+    player.deadline = time.perf_counter() + budget
+    move.execute(board)
+    try:
+        score = player.minimax(depth, _worker_game, float('-inf'), float('inf'), False, 1)
+    except SearchTimeout:
+        score = None
+    finally:
+        move.undo(board)
+        player.deadline = None
+    return score, player.stats
 
 class AIPlayer(Player):
 
@@ -18,6 +83,88 @@ class AIPlayer(Player):
         'King': 100
     }
 
+    # Score of being checkmated at the root; mates further away score slightly less
+    MATE_SCORE = 99999
+    # Scores beyond this are forced mates, whose distance is counted in plies from the root
+    MATE_BOUND = MATE_SCORE - 1000
+
+    # Pawns added to a capture's gain before delta pruning gives up on it in quiescence
+    DELTA_MARGIN = 2
+
+    # Width of the zero windows used by principal variation search and null-move pruning
+    # (one centipawn, the evaluation's resolution)
+    NULL_WINDOW = 0.01
+    # Extra plies a null move's search is reduced by
+    NULL_MOVE_REDUCTION = 2
+    # Late move reductions apply from this many moves into a node at this depth or more
+    LMR_MIN_MOVES = 3
+    LMR_MIN_DEPTH = 3
+    # Seconds between checks for a stop while waiting on parallel search workers
+    STOP_POLL_SECONDS = 0.005
+
+    def __init__(self, name: str, color: Color, options: Optional[SearchOptions] = None):
+        super().__init__(name, color)
+        self.options = options if options is not None else SearchOptions()
+        # Kept between moves so later searches can reuse earlier results
+        self.transposition_table = TranspositionTable(self.options.tt_size)
+        # perf_counter() time at which the current search must stop, if any
+        self.deadline: Optional[float] = None
+        self.move_orderer = MoveOrderer([self.PIECE_VALUES[name] for name in PIECE_TYPES])
+        # Statistics of the latest move decision, replaced at the start of each one
+        self.stats = SearchStats()
+        # Receives each move's statistics as a JSON line when set
+        self.stats_stream: Optional[TextIO] = None
+        # Called with the statistics and best move after every completed iteration
+        self.on_iteration: Optional[Callable[[SearchStats, Move], None]] = None
+        # Set from another thread by stop() to end the current search early
+        self.stop_requested = False
+        # Flag shared with the parallel search processes; in a worker, the parent's flag to stop
+        self.stop_event: Optional['multiprocessing.synchronize.Event'] = None
+        # Background search of the position after the opponent's predicted reply, see start_pondering
+        self.ponder_thread: Optional[threading.Thread] = None
+        self.ponder_move: Optional[int] = None
+        self.ponder_key: Optional[int] = None
+        # (best move, statistics, seconds) of the finished ponder search
+        self.ponder_result: Optional[Tuple[Optional[int], SearchStats, float]] = None
+        # Worker processes for parallel root search, started on first use
+        self.pool: Optional[ProcessPoolExecutor] = None
+        # Announces each chosen move when True; headless runs turn it off
+        self.verbose = True
+        self.opening_book: Optional[OpeningBook] = None
+        if self.options.book:
+            self.opening_book = (OpeningBook.load(self.options.book_path) if self.options.book_path
+                                 else default_book())
+        self.tablebase: Optional[Tablebase] = None
+        if self.options.tablebase_dir:
+            self.tablebase = Tablebase.load_dir(self.options.tablebase_dir)
+
+    @property
+    def nodes(self) -> int:
+        """Nodes visited by the latest search."""
+        return self.stats.nodes
+
+    @nodes.setter
+    def nodes(self, value: int):
+        self.stats.nodes = value
+
+    @property
+    def qnodes(self) -> int:
+        """Positions the latest search's quiescence reached beyond the horizon, counted apart from nodes."""
+        return self.stats.qnodes
+
+    @qnodes.setter
+    def qnodes(self, value: int):
+        self.stats.qnodes = value
+
+    @property
+    def completed_depth(self) -> int:
+        """Deepest iteration the latest search completed; 0 for book and table moves."""
+        return self.stats.depth
+
+    @completed_depth.setter
+    def completed_depth(self, value: int):
+        self.stats.depth = value
+
     @staticmethod
     def _convert_to_chess_notation(position) -> str:
         """Converts x,y coordinates to chess notation (e.g., 0,0 -> A1)"""
@@ -33,9 +180,9 @@ class AIPlayer(Player):
         if game.game_status != GameStatus.ONGOING:
             return None
 
-        selected_move = self.minimax_root(3, game, True)
+        selected_move, _ = self.choose_move(game)
         
-        if selected_move:
+        if selected_move and self.verbose:
             # Format the move announcement using chess notation
             piece_type = selected_move.piece_moved.__class__.__name__
             from_pos = self._convert_to_chess_notation(selected_move.from_position)
@@ -46,36 +193,281 @@ class AIPlayer(Player):
             
         return selected_move
     
-    def move_check(self, game: Game):
-            
-        if game.self_check():
-            valid_moves = game.in_check_valid_moves()
-        else:
-            valid_moves = self.get_available_moves(game.board)
-        random.shuffle(valid_moves)
-        return valid_moves
+    def choose_move(self, game: Game, time_limit: Optional[float] = None,
+                    max_depth: Optional[int] = None) -> Tuple[Optional[Move], SearchStats]:
+        """Picks a move from the book, the endgame tables or the search, and returns it with its statistics.
+
+        time_limit and max_depth override the search options for this move.
+        The statistics are also written to stats_stream as a JSON line when one is set.
+        """
+        start = time.perf_counter()
+        pondered = self.stop_pondering()
+        selected_move = self.book_move(game)
+        if selected_move is None:
+            selected_move = self.tablebase_move(game)
+        if selected_move is None and pondered is not None:
+            selected_move, time_limit = self.ponder_hit(game, pondered, time_limit, max_depth)
+        if selected_move is None:
+            selected_move = self.iterative_deepening(game, time_limit, max_depth)
+        stats = self.stats
+        stats.seconds = time.perf_counter() - start
+        stats.move = move_name(selected_move.encode()) if selected_move is not None else None
+        if self.stats_stream is not None:
+            self.stats_stream.write(stats.to_json() + '\n')
+            self.stats_stream.flush()
+        return selected_move, stats
+
+    def after_move(self, game: Game):
+        """Starts pondering on the opponent's time when the ponder option is on."""
+        if self.options.ponder and game.game_status == GameStatus.ONGOING:
+            self.start_pondering(game)
+
+    def start_pondering(self, game: Game):
+        """Searches the position after the opponent's most likely reply in a background thread.
 
-    def minimax_root(self, depth: int, game: Game, is_maximizing_player: bool) -> Optional[Move]:
+        The reply is the transposition table's best move for the opponent,
+        usually the second move of the last principal variation. The search
+        runs on a copy of the game and shares this player's transposition
+        table, so the table is warm when the real search starts.
+        """
+        self.stop_pondering()
+        board = game.board
+        opponent = 1 - color_index(self.color)
+        codes = generate_legal_moves(board.bitboard, opponent)
+        if not codes:
+            return
+        entry = self.transposition_table.probe(position_key(board.zobrist_key, opponent))
+        hash_move = entry.best_move if entry is not None else None
+        self.ponder_move = self.move_orderer.order(codes, hash_move, 0, opponent)[0]
+
+        ponder_game = Game()
+        ponder_game.verbose = False
+        ponder_game.board.load_packed(board.pack(self.opponent_color()))
+        ponder_game.board.prior_keys = board.repetition_history()
+        ponder_game.board.make_move(Move.from_code(self.ponder_move, ponder_game.board))
+        self.ponder_key = position_key(ponder_game.board.zobrist_key, color_index(self.color))
+        self.ponder_result = None
+        self.stop_requested = False
+        self.ponder_thread = threading.Thread(target=self._ponder, args=(ponder_game,), daemon=True)
+        self.ponder_thread.start()
+
+    def _ponder(self, ponder_game: Game):
+        """Body of the ponder thread: searches until stopped or max_depth is reached."""
+        start = time.perf_counter()
+        move = self.iterative_deepening(ponder_game, time_limit=float('inf'))
+        self.ponder_result = (move.encode() if move is not None else None, self.stats,
+                              time.perf_counter() - start)
+
+    def stop_pondering(self) -> Optional[Tuple[int, Tuple[Optional[int], SearchStats, float]]]:
+        """Stops the ponder search, if any, and returns (pondered position key, result)."""
+        if self.ponder_thread is None:
+            return None
+        self.stop()
+        self.ponder_thread.join()
+        self.ponder_thread = None
+        self.stop_requested = False
+        return self.ponder_key, self.ponder_result
+
+    def ponder_hit(self, game: Game, pondered, time_limit: Optional[float],
+                   max_depth: Optional[int]) -> Tuple[Optional[Move], Optional[float]]:
+        """Uses a ponder search if the opponent played the predicted reply.
+
+        Returns the pondered move if it was searched for at least the move's
+        time budget or to max_depth; otherwise no move and the budget left for
+        the search, which then starts from the warm transposition table.
+        """
+        key, result = pondered
+        if time_limit is None:
+            time_limit = self.options.time_limit
+        if max_depth is None:
+            max_depth = self.options.max_depth
+        if key != position_key(game.board.zobrist_key, color_index(self.color)) or result is None:
+            return None, time_limit
+        code, stats, seconds = result
+        if code is None or stats.depth == 0:
+            return None, time_limit
+        if seconds >= time_limit or stats.depth >= max_depth:
+            stats.source = 'ponder'
+            self.stats = stats
+            return Move.from_code(code, game.board), time_limit
+        return None, time_limit - seconds
+
+    def book_move(self, game: Game) -> Optional[Move]:
+        """Returns the opening book's move for the position, or None when out of book."""
+        if self.opening_book is None:
+            return None
+        board = game.board
+        side = color_index(self.color)
+        code = self.opening_book.probe(position_key(board.zobrist_key, side),
+                                       generate_legal_moves(board.bitboard, side))
+        if code is None:
+            return None
+        # No search ran for this move
+        self.stats = SearchStats('book')
+        return Move.from_code(code, board)
+
+    def tablebase_move(self, game: Game) -> Optional[Move]:
+        """Returns the move keeping the best endgame table result, or None if no table covers the position.
+
+        Wins are converted by the shortest mate, losses delayed by the longest.
+        """
+        if self.tablebase is None:
+            return None
+        board = game.board
+        side = color_index(self.color)
+        if self.tablebase.probe(board.bitboard, side) is None:
+            return None
+        self.stats = SearchStats('tablebase')
+        best_move = None
+        best_value = float('-inf')
+        for code in generate_legal_moves(board.bitboard, side):
+            move = Move.from_code(code, board)
+            move.execute(board)
+            try:
+                entry = self.tablebase.probe(board.bitboard, 1 - side)
+            finally:
+                move.undo(board)
+            # Capturing the last piece leaves bare kings, which no table covers: a draw
+            value = -self.tablebase_score(entry, 1) if entry is not None else 0
+            if value > best_value:
+                best_value = value
+                best_move = move
+        self.stats.score = best_value
+        return best_move
+
+    def tablebase_score(self, entry: int, ply: int) -> float:
+        """Converts a table entry for the side to move at ply into a search score."""
+        if entry == DRAW:
+            return 0
+        if entry % 2:
+            return self.MATE_SCORE - (ply + entry)
+        return -(self.MATE_SCORE - (ply + entry))
+
+    def score_to_table(self, value: float, ply: int) -> float:
+        """Converts a score for storing at ply, counting mate distances from that node instead of the root."""
+        if value > self.MATE_BOUND:
+            return value + ply
+        if value < -self.MATE_BOUND:
+            return value - ply
+        return value
+
+    def score_from_table(self, value: float, ply: int) -> float:
+        """Converts a stored score back for a node at ply, the inverse of score_to_table."""
+        if value > self.MATE_BOUND:
+            return value - ply
+        if value < -self.MATE_BOUND:
+            return value + ply
+        return value
+
+    def move_check(self, game: Game, hash_move: Optional[int] = None) -> List[Move]:
+        """Returns the AI's moves from the current game position, best candidates first."""
+        return self.search_moves(game, self.color, hash_move, 0)
+
+    def search_moves(self, game: Game, color: Color, hash_move: Optional[int] = None, ply: int = 0) -> List[Move]:
+        """Generates and orders the legal moves for either side inside the search from the bitboards."""
+        board = game.board
+        index = color_index(color)
+        codes = self.move_orderer.order(generate_legal_moves(board.bitboard, index), hash_move, ply, index)
+        return [Move.from_code(code, board) for code in codes]
+
+    def opponent_color(self) -> Color:
+        """Returns the color the AI is playing against."""
+        return Color.BLACK if self.color == Color.WHITE else Color.WHITE
+
+    def iterative_deepening(self, game: Game, time_limit: Optional[float] = None,
+                            max_depth: Optional[int] = None) -> Optional[Move]:
+        """Searches depth 1, 2, 3... until the time budget runs out.
+
+        Returns the best move of the deepest iteration that completed; an
+        iteration cut off by the deadline is discarded.
+        """
+        if time_limit is None:
+            time_limit = self.options.time_limit
+        if max_depth is None:
+            max_depth = self.options.max_depth
+
+        self.stats = stats = SearchStats()
+        self.transposition_table.reset_stats()
+        self.transposition_table.new_search()
+        self.move_orderer.new_search()
+        best_move = None
+        timed_out = False
+        root_search = self.parallel_root if self.options.workers > 1 else self.minimax_root
+        start = time.perf_counter()
+        self.deadline = start + time_limit
+        try:
+            for depth in range(1, max_depth + 1):
+                move = root_search(depth, game, True, best_move)
+                if move is None:
+                    break
+                best_move = move
+                stats.depth = depth
+                if self.on_iteration is not None:
+                    self.on_iteration(stats, best_move)
+        except SearchTimeout:
+            timed_out = True
+        finally:
+            self.deadline = None
+            stats.seconds = time.perf_counter() - start
+            stats.tt = self.transposition_table.stats()
+
+        if best_move is None and timed_out:
+            # Not even depth 1 finished in time; any legal move beats forfeiting
+            available_moves = self.move_check(game)
+            best_move = available_moves[0] if available_moves else None
+        return best_move
+
+    def check_time(self):
+        """Aborts the search once the deadline has passed or a stop was requested."""
+        if (self.stop_requested or (self.deadline is not None and time.perf_counter() >= self.deadline)
+                or (self.stop_event is not None and self.stop_event.is_set())):
+            raise SearchTimeout()
+
+    def stop(self):
+        """Asks a search running in another thread to finish with the deepest completed iteration.
+
+        The request stays in effect until stop_requested is cleared before the next search.
+        """
+        self.stop_requested = True
+
+    def minimax_root(self, depth: int, game: Game, is_maximizing_player: bool,
+                     previous_best: Optional[Move] = None) -> Optional[Move]:
         """Find the best move by evaluating all possible moves at the root level."""
         if depth < 0:
             raise ValueError("Depth cannot be negative")
             
-        available_moves = self.move_check(game)
+        key = position_key(game.board.zobrist_key, color_index(self.color))
+        entry = self.transposition_table.probe(key)
+        if previous_best is not None:
+            hash_move = previous_best.encode()
+        else:
+            hash_move = entry.best_move if entry is not None else None
+
+        available_moves = self.move_check(game, hash_move)
         if not available_moves:
             return None
+        self.stats.nodes += 1
 
         best_move = None
         best_value = float('-inf')
         alpha = float('-inf')
         beta = float('inf')
+        board = game.board
 
-        for move in available_moves:
+        for index, move in enumerate(available_moves):
             # Make move
-            move.execute(game.board)
-            # Evaluate position
-            value = self.minimax(depth - 1, game, alpha, beta, False)
-            # Undo move
-            move.undo(game.board)
+            move.execute(board)
+            try:
+                # Evaluate position, later moves first with a zero window when PVS is on
+                if index > 0 and self.options.pvs:
+                    value = self.minimax(depth - 1, game, alpha, alpha + self.NULL_WINDOW, False, 1)
+                    if value > alpha:
+                        value = self.minimax(depth - 1, game, alpha, beta, False, 1)
+                else:
+                    value = self.minimax(depth - 1, game, alpha, beta, False, 1)
+            finally:
+                # Undo move, even when the search is aborted
+                move.undo(board)
 
             if value > best_value:
                 best_value = value
@@ -85,75 +477,265 @@ class AIPlayer(Player):
             if beta <= alpha:
                 break
 
+        if best_move is not None:
+            self.transposition_table.store(key, depth, best_value, EXACT, best_move.encode())
+            self.stats.score = best_value
         return best_move
 
-    def minimax(self, depth: int, game: Game, alpha: float, beta: float, is_maximizing_player: bool) -> float:
-        """Implementation of minimax algorithm with alpha-beta pruning."""
-        if depth == 0 or game.game_status != GameStatus.ONGOING:
-            return self.evaluate_position(game, is_maximizing_player)
+    def parallel_root(self, depth: int, game: Game, is_maximizing_player: bool,
+                      previous_best: Optional[Move] = None) -> Optional[Move]:
+        """Searches the root moves in worker processes, one task per move.
 
+        Each worker scores its move with a full window, so the result does not
+        depend on which task finishes first: the highest score wins and ties go
+        to the move ordered earlier. A stop or the deadline reaches the workers
+        through a shared flag, so they abort mid-iteration like the serial search.
+        """
+        if depth < 0:
+            raise ValueError("Depth cannot be negative")
+        self.check_time()
+
+        hash_move = previous_best.encode() if previous_best is not None else None
+        available_moves = self.move_check(game, hash_move)
+        if not available_moves:
+            return None
+        self.stats.nodes += 1
+
+        if self.pool is None:
+            # Forking while another thread blocks on standard input, as the UCI loop does,
+            # can deadlock the child, so the workers start as fresh interpreters
+            context = multiprocessing.get_context('spawn')
+            self.stop_event = context.Event()
+            self.pool = ProcessPoolExecutor(self.options.workers, mp_context=context, initializer=_init_worker,
+                                            initargs=(self.color, self.options, self.stop_event))
+        packed = game.board.pack(self.color)
+        history = game.board.repetition_history()
+        budget = self.deadline - time.perf_counter() if self.deadline is not None else float('inf')
+        futures = [self.pool.submit(_search_root_move, packed, history, move.encode(), depth - 1, budget)
+                   for move in available_moves]
+        self.wait_for_workers(futures)
+
+        best_move = None
+        best_value = float('-inf')
+        timed_out = False
+        for move, future in zip(available_moves, futures):
+            value, stats = future.result()
+            self.stats.merge(stats)
+            if value is None:
+                timed_out = True
+            elif value > best_value:
+                best_value = value
+                best_move = move
+        if timed_out:
+            raise SearchTimeout()
+
+        key = position_key(game.board.zobrist_key, color_index(self.color))
+        self.transposition_table.store(key, depth, best_value, EXACT, best_move.encode())
+        self.stats.score = best_value
+        return best_move
+
+    def wait_for_workers(self, futures: list):
+        """Waits for the root move tasks, stopping the workers early on stop() or the deadline.
+
+        On a stop the shared flag aborts the running tasks, the queued ones
+        are cancelled, and SearchTimeout is raised once the workers are idle.
+        """
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, timeout=self.STOP_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            try:
+                self.check_time()
+            except SearchTimeout:
+                self.stop_event.set()
+                for future in pending:
+                    future.cancel()
+                wait(pending)
+                self.stop_event.clear()
+                raise
+
+    def close(self):
+        """Stops pondering and the parallel search worker processes, if any were started."""
+        self.stop_pondering()
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+            self.stop_event = None
+
+    def minimax(self, depth: int, game: Game, alpha: float, beta: float, is_maximizing_player: bool,
+                ply: int = 1) -> float:
+        """Implementation of minimax algorithm with alpha-beta pruning.
+
+        Scores from the AI's point of view; the search itself runs in negamax
+        form, so this flips the window and score for the opponent's turns.
+        """
+        own = color_index(self.color)
         if is_maximizing_player:
-            max_eval = float('-inf')
-            moves = self.move_check(game)
-            
-            for move in moves:
-                move.execute(game.board)
-                eval = self.minimax(depth - 1, game, alpha, beta, False)
-                move.undo(game.board)
-                
-                max_eval = max(max_eval, eval)
-                alpha = max(alpha, eval)
+            return self.negamax(depth, game, alpha, beta, own, ply)
+        return -self.negamax(depth, game, -beta, -alpha, 1 - own, ply)
+
+    def negamax(self, depth: int, game: Game, alpha: float, beta: float, side: int, ply: int,
+                allow_null: bool = True) -> float:
+        """Alpha-beta search scoring the position for side, the color index to move.
+
+        Depending on the search options, moves after the first are tried with
+        a zero window and re-searched only if they beat alpha (principal
+        variation search), a null move can prune the node outright, and late
+        quiet moves are searched one ply shallower first.
+        """
+        self.check_time()
+        self.stats.nodes += 1
+        if game.game_status != GameStatus.ONGOING:
+            return self.evaluate_for(game, side)
+        # A repetition inside the search is scored as the draw it could be repeated into
+        if game.board.repetitions(side):
+            return 0
+        if self.tablebase is not None:
+            entry = self.tablebase.probe(game.board.bitboard, side)
+            if entry is not None:
+                return self.tablebase_score(entry, ply)
+        if depth <= 0:
+            return self.quiescence(game, alpha, beta, side, ply)
+
+        board = game.board
+        key = position_key(board.zobrist_key, side)
+        entry = self.transposition_table.probe(key)
+        hash_move = None
+        if entry is not None:
+            if entry.depth >= depth:
+                value = self.score_from_table(entry.value, ply)
+                if entry.flag == EXACT:
+                    return value
+                if entry.flag == LOWER_BOUND:
+                    alpha = max(alpha, value)
+                elif entry.flag == UPPER_BOUND:
+                    beta = min(beta, value)
                 if beta <= alpha:
-                    break
-            return max_eval
+                    return value
+            hash_move = entry.best_move
+        original_alpha = alpha
+
+        options = self.options
+        checked = in_check(board.bitboard, side)
+        if (options.null_move and allow_null and not checked and depth > self.NULL_MOVE_REDUCTION
+                and beta != float('inf') and self.has_pieces(board, side)):
+            # Pass the turn: if the opponent still cannot get below beta, a real move will not either
+            value = -self.negamax(depth - 1 - self.NULL_MOVE_REDUCTION, game, -beta, -beta + self.NULL_WINDOW,
+                                  1 - side, ply + 1, False)
+            if value >= beta:
+                return beta
+
+        color = self.color if side == color_index(self.color) else self.opponent_color()
+        moves = self.search_moves(game, color, hash_move, ply)
+        if not moves:
+            # Checkmate, preferring the quickest mate and the slowest defeat, or stalemate
+            return -(self.MATE_SCORE - ply) if checked else 0
+
+        def search(search_depth: int, lower: float, upper: float) -> float:
+            return -self.negamax(search_depth, game, -upper, -lower, 1 - side, ply + 1)
+
+        best_move = None
+        best_value = float('-inf')
+        for index, move in enumerate(moves):
+            move.execute(board)
+            try:
+                if index == 0:
+                    value = search(depth - 1, alpha, beta)
+                else:
+                    reduction = 0
+                    if (options.lmr and index >= self.LMR_MIN_MOVES and depth >= self.LMR_MIN_DEPTH
+                            and not checked and move.piece_captured is None
+                            and not in_check(board.bitboard, 1 - side)):
+                        reduction = 1
+                    upper = alpha + self.NULL_WINDOW if options.pvs else beta
+                    value = search(depth - 1 - reduction, alpha, upper)
+                    if value > alpha and (reduction or upper < beta):
+                        value = search(depth - 1, alpha, beta)
+            finally:
+                move.undo(board)
+
+            if value > best_value:
+                best_value = value
+                best_move = move
+            alpha = max(alpha, value)
+            if beta <= alpha:
+                self.move_orderer.record_cutoff(move.encode(), depth, ply, side)
+                self.stats.beta_cutoffs += 1
+                if index == 0:
+                    self.stats.first_move_cutoffs += 1
+                break
+
+        if best_value <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_value >= beta:
+            flag = LOWER_BOUND
         else:
-            min_eval = float('inf')
-            moves = self.move_check(game) 
-            
-            for move in moves:
-                move.execute(game.board)
-                eval = self.minimax(depth - 1, game, alpha, beta, True)
-                move.undo(game.board)
-                
-                min_eval = min(min_eval, eval)
-                beta = min(beta, eval)
-                if beta <= alpha:
-                    break
-            return min_eval
-        
-    
+            flag = EXACT
+        self.transposition_table.store(key, depth, self.score_to_table(best_value, ply), flag,
+                                       best_move.encode() if best_move is not None else None)
+        return best_value
 
-    def evaluate_position(self, game: Game, player) -> int:
-        """
-        Position evaluation based on material count.
-        Uses standard chess piece values.
+    def quiescence(self, game: Game, alpha: float, beta: float, side: int, ply: int) -> float:
+        """Searches captures only until the position is quiet, so leaves are not scored mid-exchange.
+
+        The side to move may stand pat on the static evaluation instead of
+        capturing, and captures that could not lift the score to alpha even
+        with DELTA_MARGIN to spare are skipped. In check every evasion is searched.
+        The position itself was counted by negamax; qnodes counts the ones
+        reached beyond it.
         """
-        
-        if self.color == Color.WHITE:
-            opponent_color = Color.BLACK
-        else:
-            opponent_color = Color.WHITE
-
-        score = 0
-        for row in range(8):
-            for col in range(8):
-                piece = game.board.get_piece_at(Position(row, col))
-                if piece:
-                    value = self.PIECE_VALUES.get(piece.__class__.__name__, 0)
-                    if piece.color == self.color:
-                        score -= value
-                    else:
-                        score += value
-        if game.is_check(self.color):
-            score += 7
-        elif game.is_check(opponent_color):
-            score -= 7
-        if player:
-            if game.is_checkmate():
-                score -= 99999
+        self.check_time()
+        board = game.board
+        checked = in_check(board.bitboard, side)
+
+        if checked:
+            best_value = stand_pat = float('-inf')
         else:
-            if game.is_checkmate():
-                score += 99999
-        # Bonus/malus for checkmate or check
+            stand_pat = best_value = self.evaluate_for(game, side)
+            if stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+
+        codes = generate_legal_moves(board.bitboard, side, captures_only=not checked)
+        if checked and not codes:
+            return -(self.MATE_SCORE - ply)
+
+        for code in self.move_orderer.order(codes, None, ply, side):
+            if not checked and stand_pat + MATERIAL_VALUES[((code >> 15) & 7) - 1] / 100 + self.DELTA_MARGIN <= alpha:
+                continue
+            move = Move.from_code(code, board)
+            move.execute(board)
+            self.stats.qnodes += 1
+            try:
+                value = -self.quiescence(game, -beta, -alpha, 1 - side, ply + 1)
+            finally:
+                move.undo(board)
+
+            best_value = max(best_value, value)
+            alpha = max(alpha, value)
+            if beta <= alpha:
+                break
+        return best_value
+
+    @staticmethod
+    def has_pieces(board, side: int) -> bool:
+        """Returns whether a side has a piece besides pawns and king, making zugzwang unlikely."""
+        pieces = board.bitboard.pieces[side]
+        return bool(pieces[KNIGHT] | pieces[BISHOP] | pieces[ROOK] | pieces[QUEEN])
+
+    def evaluate_for(self, game: Game, side: int) -> float:
+        """Returns evaluate_position from the point of view of side, the color index to move."""
+        self.stats.evaluations += 1
+        value = self.evaluate_position(game)
+        return value if side == color_index(self.color) else -value
 
-        return score
\ No newline at end of file
+    def evaluate_position(self, game: Game) -> float:
+        """
+        Position evaluation in pawns from the AI's point of view: material
+        plus piece-square bonuses. The board keeps both totals up to date on
+        every executed or undone move, so this does not scan the squares.
+        """
+        board = game.board
+        own = color_index(self.color)
+        opponent = 1 - own
+        return (board.material[own] - board.material[opponent]
+                + board.positional[own] - board.positional[opponent]) / 100
@@ -7,11 +7,8 @@ from src.game.board import Board
 
 class HumanPlayer(Player):
     def make_move(self, game: Game) -> Optional[Move]:
-        if game.self_check():
-            valid_moves = game.in_check_valid_moves()
-        else:
-            valid_moves = self.get_available_moves(game.board)
-        
+        valid_moves = game.legal_moves(self.color)
+
         if not valid_moves:
             print(f"\nNo valid moves available for {self.name}")
             return None
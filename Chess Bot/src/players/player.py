@@ -15,40 +15,50 @@ class Player(ABC):
         """Executes a move within the game."""
         pass
 
+    def after_move(self, game):
+        """Called once the player's move is on the board and the opponent is to move."""
+        pass
+
     def get_available_moves(self, board: Board) -> List[Move]:
         if board is None:
             raise ValueError("Board cannot be None")
             
         available_moves = []
         
-        # Iterate through board and collect all potential moves
-        for x in range(8):
-            for y in range(8):
-                piece = board.get_piece_at(Position(x, y))
-                if piece and piece.color == self.color:
-                    # Get potential positions this piece could move to
-                    possible_positions = piece.get_valid_moves(board)
+        # Collect the potential moves of the player's pieces from the board's piece list
+        for piece in board.get_pieces(self.color):
+            from_position = Position.at(piece.position.x, piece.position.y)
+            # Get potential positions this piece could move to
+            possible_positions = piece.get_valid_moves(board)
+            
+            # Create Move objects for each position
+            for to_position in possible_positions:
+                captured_piece = board.get_piece_at(to_position)
+                # Add check to skip moves that would capture same color pieces
+                if captured_piece and captured_piece.color == self.color:
+                    continue
                     
-                    # Create Move objects for each position
-                    for to_position in possible_positions:
-                        captured_piece = board.get_piece_at(to_position)
-                        # Add check to skip moves that would capture same color pieces
-                        if captured_piece and captured_piece.color == self.color:
-                            continue
-                            
-                        move = Move(
-                            from_position=Position(x, y),
-                            to_position=to_position,
-                            piece_moved=piece,
-                            piece_captured=captured_piece if captured_piece and captured_piece.color != self.color else None
-                        )
-                        available_moves.append(move)
+                move = Move(
+                    from_position=from_position,
+                    to_position=to_position,
+                    piece_moved=piece,
+                    piece_captured=captured_piece
+                )
+                available_moves.append(move)
         
         return available_moves
 
     @staticmethod
     def create_player(color: Color) -> 'Player':
-        """Factory method to create a player."""
+        """Factory method to create a player.
+
+        An AI can ponder, searching on the opponent's time; that is offered
+        here as it pays off when the opponent is a human thinking at the prompt.
+        """
+        # Imported here as both modules import this one
+        from src.players.human_player import HumanPlayer
+        from src.players.ai_player import AIPlayer
+        from src.search.options import SearchOptions
         while True:
             choice = input(f"Enter player type for {color.name} (1 for Human, 2 for AI): ").strip()
             if choice not in ['1', '2']:
@@ -64,4 +74,5 @@ class Player(ABC):
                         continue
                     return HumanPlayer(name, color)
             else:
-                return AIPlayer(f"AI_{color.name}", color)
\ No newline at end of file
+                answer = input(f"Let AI_{color.name} think on the opponent's time? (Y/n): ").strip().lower()
+                return AIPlayer(f"AI_{color.name}", color, SearchOptions(ponder=answer not in ('n', 'no')))
\ No newline at end of file
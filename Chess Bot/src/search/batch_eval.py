@@ -0,0 +1,91 @@
+from typing import Iterable, List, Optional, Tuple
+from src.game.bitboard import BitBoard, WHITE
+from src.game.fen import parse_fen
+from src.game.piece_square_tables import MATERIAL_VALUES, SQUARE_VALUES
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for batch evaluation
+    np = None
+
+# Board arrays hold one int8 per square (square = y * 8 + x): 0 for empty,
+# piece type + 1 for a white piece and -(piece type + 1) for a black one.
+EMPTY = 0
+
+
+def _require_numpy():
+    """Raises ImportError with install instructions when NumPy is missing."""
+    if np is None:
+        raise ImportError("Batch evaluation needs NumPy: pip install numpy")
+
+
+def _score_table() -> 'np.ndarray':
+    """Builds the centipawn score of every (square code + 6, square) pair from white's point of view."""
+    table = np.zeros((13, 64), dtype=np.int32)
+    for piece_type, material in enumerate(MATERIAL_VALUES):
+        table[piece_type + 7] = [material + value for value in SQUARE_VALUES[WHITE][piece_type]]
+        table[5 - piece_type] = [-material - value for value in SQUARE_VALUES[1 - WHITE][piece_type]]
+    return table
+
+
+_table: Optional['np.ndarray'] = None
+
+
+def score_table() -> 'np.ndarray':
+    """Returns the lookup table used by evaluate_batch, building it on first use."""
+    global _table
+    _require_numpy()
+    if _table is None:
+        _table = _score_table()
+    return _table
+
+
+def encode_bitboard(bitboard: BitBoard, out: Optional['np.ndarray'] = None) -> 'np.ndarray':
+    """Writes a position into a 64-entry int8 board array, a new one unless out is given."""
+    _require_numpy()
+    board = np.zeros(64, dtype=np.int8) if out is None else out
+    board[:] = EMPTY
+    for color in range(2):
+        sign = 1 if color == WHITE else -1
+        for piece_type, pieces in enumerate(bitboard.pieces[color]):
+            while pieces:
+                bit = pieces & -pieces
+                pieces ^= bit
+                board[bit.bit_length() - 1] = sign * (piece_type + 1)
+    return board
+
+
+def load_fens(fens: Iterable[str]) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Parses FEN strings into an N x 64 int8 board array and an array of the color indexes to move."""
+    _require_numpy()
+    fens = list(fens)
+    boards = np.zeros((len(fens), 64), dtype=np.int8)
+    sides = np.zeros(len(fens), dtype=np.int8)
+    for row, fen in enumerate(fens):
+        placement, side = parse_fen(fen)
+        for square, color, piece_type in placement:
+            boards[row, square] = piece_type + 1 if color == WHITE else -(piece_type + 1)
+        sides[row] = side
+    return boards, sides
+
+
+def evaluate_batch(boards: 'np.ndarray', sides: Optional['np.ndarray'] = None) -> 'np.ndarray':
+    """Scores N x 64 board arrays in pawns with material and piece-square bonuses, in one pass.
+
+    Scores are from white's point of view, or from the side to move's when
+    sides is given; they match AIPlayer.evaluate_position for that color.
+    """
+    table = score_table()
+    boards = np.asarray(boards, dtype=np.int8)
+    if boards.ndim != 2 or boards.shape[1] != 64:
+        raise ValueError(f"Expected an N x 64 board array, got shape {boards.shape}")
+    scores = table[boards.astype(np.intp) + 6, np.arange(64)].sum(axis=1) / 100
+    if sides is not None:
+        scores = np.where(np.asarray(sides) == WHITE, scores, -scores)
+    return scores
+
+
+def evaluate_fens(fens: List[str]) -> 'np.ndarray':
+    """Scores FEN positions for their side to move."""
+    boards, sides = load_fens(fens)
+    return evaluate_batch(boards, sides)
@@ -0,0 +1,68 @@
+from typing import List, Optional, Sequence
+
+# Score bands: the hash move first, then captures, killers and finally quiet moves by history
+HASH_MOVE_SCORE = 10_000_000
+CAPTURE_SCORE = 1_000_000
+KILLER_SCORES = (900_000, 800_000)
+
+
+class MoveOrderer:
+    """Ranks encoded moves so alpha-beta meets its cutoffs as early as possible.
+
+    Order: the transposition table's move, captures by MVV-LVA (most valuable
+    victim, then least valuable attacker), the two killer moves of the ply,
+    and remaining quiet moves by history score.
+    """
+
+    def __init__(self, piece_values: Sequence[int], max_ply: int = 128):
+        # Piece values indexed by piece type, used for MVV-LVA
+        self.piece_values = list(piece_values)
+        self.max_ply = max_ply
+        self.clear()
+
+    def clear(self):
+        """Forgets all killer moves and history scores."""
+        self.killers: List[List[Optional[int]]] = [[None, None] for _ in range(self.max_ply)]
+        # history[color][from | to << 6], the low 12 bits of the move code
+        self.history = [[0] * 4096, [0] * 4096]
+
+    def new_search(self):
+        """Drops killers from the previous move and halves history so it adapts to the new position."""
+        self.killers = [[None, None] for _ in range(self.max_ply)]
+        for table in self.history:
+            for index, value in enumerate(table):
+                if value:
+                    table[index] = value >> 1
+
+    def score_move(self, code: int, hash_move: Optional[int], ply: int, color: int) -> int:
+        """Returns the ordering score of an encoded move; higher is searched first."""
+        if code == hash_move:
+            return HASH_MOVE_SCORE
+        captured = ((code >> 15) & 7) - 1
+        if captured >= 0:
+            return CAPTURE_SCORE + self.piece_values[captured] * 1000 - self.piece_values[(code >> 12) & 7]
+        if ply < self.max_ply:
+            killers = self.killers[ply]
+            if code == killers[0]:
+                return KILLER_SCORES[0]
+            if code == killers[1]:
+                return KILLER_SCORES[1]
+        return min(self.history[color][code & 4095], KILLER_SCORES[1] - 1)
+
+    def order(self, codes: List[int], hash_move: Optional[int], ply: int, color: int) -> List[int]:
+        """Sorts encoded moves best-first in place and returns them."""
+        score_move = self.score_move
+        codes.sort(key=lambda code: score_move(code, hash_move, ply, color), reverse=True)
+        return codes
+
+    def record_cutoff(self, code: int, depth: int, ply: int, color: int):
+        """Rewards a quiet move that caused a beta cutoff."""
+        if (code >> 15) & 7:
+            # Captures are already ordered by MVV-LVA
+            return
+        if ply < self.max_ply:
+            killers = self.killers[ply]
+            if killers[0] != code:
+                killers[1] = killers[0]
+                killers[0] = code
+        self.history[color][code & 4095] += depth * depth
@@ -0,0 +1,144 @@
+import random
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.game.bitboard import color_index
+from src.game.board import Board
+from src.game.movegen import generate_legal_moves, make_move
+from src.game.zobrist import compute_key, position_key
+from src.game.fen import STARTING_FEN
+
+# Book file: a magic header, then (position key, from | to << 6, weight) records sorted by key
+BOOK_MAGIC = b'CBK1'
+RECORD = struct.Struct('>QHH')
+
+# Main lines in coordinate notation, within the game's rules (no castling)
+DEFAULT_LINES = [
+    "e2e4 e7e5 g1f3 b8c6 f1b5 a7a6 b5a4 g8f6",
+    "e2e4 e7e5 g1f3 b8c6 f1c4 f8c5 c2c3 g8f6",
+    "e2e4 e7e5 g1f3 b8c6 d2d4 e5d4 f3d4 g8f6",
+    "e2e4 c7c5 g1f3 d7d6 d2d4 c5d4 f3d4 g8f6 b1c3 a7a6",
+    "e2e4 c7c5 g1f3 b8c6 d2d4 c5d4 f3d4 g8f6 b1c3 e7e5",
+    "e2e4 e7e6 d2d4 d7d5 b1c3 g8f6 c1g5 f8e7",
+    "e2e4 c7c6 d2d4 d7d5 b1c3 d5e4 c3e4 c8f5",
+    "d2d4 d7d5 c2c4 e7e6 b1c3 g8f6 c1g5 f8e7",
+    "d2d4 d7d5 c2c4 c7c6 g1f3 g8f6 b1c3 d5c4",
+    "d2d4 g8f6 c2c4 e7e6 b1c3 f8b4 e2e3",
+    "d2d4 g8f6 c2c4 g7g6 b1c3 f8g7 e2e4 d7d6",
+    "c2c4 e7e5 b1c3 g8f6 g1f3 b8c6",
+    "g1f3 d7d5 d2d4 g8f6 c2c4 e7e6",
+]
+
+
+def parse_square(name: str) -> int:
+    """Converts a square name such as e4 to its 0-63 index."""
+    if len(name) != 2 or name[0] not in 'abcdefgh' or name[1] not in '12345678':
+        raise ValueError(f"Invalid square: {name}")
+    return (int(name[1]) - 1) * 8 + ord(name[0]) - ord('a')
+
+
+class OpeningBook:
+    """Known good moves indexed by position key (Zobrist placement key and side to move).
+
+    Moves are stored as from | to << 6 and matched against the legal moves
+    when probed, so a hash collision can never produce an illegal move.
+    """
+
+    def __init__(self):
+        # entries[key] = [(from | to << 6, weight), ...]
+        self.entries: Dict[int, List[Tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, key: int, move: int, weight: int = 1):
+        """Adds weight to a move of a position, creating the entry if needed."""
+        moves = self.entries.setdefault(key, [])
+        for index, (book_move, book_weight) in enumerate(moves):
+            if book_move == move:
+                moves[index] = (move, min(book_weight + weight, 0xFFFF))
+                return
+        moves.append((move, min(weight, 0xFFFF)))
+
+    def add_line(self, line: str, fen: str = STARTING_FEN, max_plies: Optional[int] = None):
+        """Adds every position of a game given as coordinate moves (e.g. "e2e4 e7e5").
+
+        Move numbers such as "1." and results such as "1-0" are skipped.
+        """
+        board = Board()
+        side = color_index(board.load_fen(fen))
+        bitboard = board.bitboard
+        key = compute_key(bitboard)
+        tokens = [token for token in line.split()
+                  if not token.endswith('.') and token not in ('1-0', '0-1', '1/2-1/2', '*')]
+        for ply, token in enumerate(tokens):
+            if max_plies is not None and ply >= max_plies:
+                break
+            token = token.lower().split('.')[-1]
+            move = parse_square(token[:2]) | parse_square(token[2:4]) << 6
+            code = next((code for code in generate_legal_moves(bitboard, side) if code & 4095 == move), None)
+            if code is None:
+                raise ValueError(f"Illegal book move {token} in line: {line}")
+            self.add(position_key(key, side), move)
+            make_move(bitboard, code)
+            key = compute_key(bitboard)
+            side ^= 1
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], max_plies: Optional[int] = None) -> 'OpeningBook':
+        """Builds a book from lines of coordinate moves from the starting position."""
+        book = cls()
+        for line in lines:
+            if line.strip() and not line.lstrip().startswith('#'):
+                book.add_line(line, max_plies=max_plies)
+        return book
+
+    def moves(self, key: int) -> List[Tuple[int, int]]:
+        """Returns the (from | to << 6, weight) moves stored for a position."""
+        return self.entries.get(key, [])
+
+    def probe(self, key: int, legal_codes: List[int], rng: Optional[random.Random] = None) -> Optional[int]:
+        """Returns the encoded legal move the book plays in a position, or None if out of book.
+
+        Without rng the heaviest move is chosen (the first added on ties);
+        with rng moves are drawn in proportion to their weights.
+        """
+        by_move = {code & 4095: code for code in legal_codes}
+        candidates = [(move, weight) for move, weight in self.moves(key) if move in by_move]
+        if not candidates:
+            return None
+        if rng is None:
+            move = max(candidates, key=lambda candidate: candidate[1])[0]
+        else:
+            move = rng.choices([move for move, _ in candidates], [weight for _, weight in candidates])[0]
+        return by_move[move]
+
+    def save(self, path: str):
+        """Writes the book in its binary format."""
+        with open(path, 'wb') as file:
+            file.write(BOOK_MAGIC)
+            for key in sorted(self.entries):
+                for move, weight in self.entries[key]:
+                    file.write(RECORD.pack(key, move, weight))
+
+    @classmethod
+    def load(cls, path: str) -> 'OpeningBook':
+        """Reads a book written by save."""
+        with open(path, 'rb') as file:
+            data = file.read()
+        if data[:len(BOOK_MAGIC)] != BOOK_MAGIC or (len(data) - len(BOOK_MAGIC)) % RECORD.size:
+            raise ValueError(f"Not an opening book file: {path}")
+        book = cls()
+        for key, move, weight in RECORD.iter_unpack(data[len(BOOK_MAGIC):]):
+            book.entries.setdefault(key, []).append((move, weight))
+        return book
+
+
+_default_book: Optional[OpeningBook] = None
+
+
+def default_book() -> OpeningBook:
+    """Returns the book built from DEFAULT_LINES, building it on first use."""
+    global _default_book
+    if _default_book is None:
+        _default_book = OpeningBook.from_lines(DEFAULT_LINES)
+    return _default_book
@@ -0,0 +1,46 @@
+from typing import Optional
+
+
+class SearchOptions:
+    """Limits and feature switches for AIPlayer's search."""
+
+    def __init__(self,
+                 time_limit: float = 2.0,
+                 max_depth: int = 32,
+                 tt_size: int = 1 << 16,
+                 workers: int = 1,
+                 pvs: bool = True,
+                 null_move: bool = True,
+                 lmr: bool = True,
+                 book: bool = True,
+                 book_path: Optional[str] = None,
+                 tablebase_dir: Optional[str] = None,
+                 ponder: bool = False):
+        if time_limit <= 0:
+            raise ValueError("Time limit must be positive")
+        if max_depth < 1:
+            raise ValueError("Max depth must be at least 1")
+        if workers < 1:
+            raise ValueError("Workers must be at least 1")
+        # Seconds each move may spend in iterative deepening
+        self.time_limit = time_limit
+        # Deepest iteration to start, even if time remains
+        self.max_depth = max_depth
+        # Transposition table slots (rounded up to a power of two)
+        self.tt_size = tt_size
+        # Processes searching root moves in parallel; 1 searches in this process
+        self.workers = workers
+        # Zero-window search of moves after the first (principal variation search)
+        self.pvs = pvs
+        # Null-move pruning
+        self.null_move = null_move
+        # Late move reductions of quiet moves
+        self.lmr = lmr
+        # Play opening book moves before searching
+        self.book = book
+        # Book file written by the build_book tool; None uses the built-in main lines
+        self.book_path = book_path
+        # Directory of endgame tables written by the build_tablebase tool; None disables probing
+        self.tablebase_dir = tablebase_dir
+        # Search the predicted reply's position in a background thread during the opponent's turn
+        self.ponder = ponder
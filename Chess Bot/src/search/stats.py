@@ -0,0 +1,70 @@
+import json
+from typing import Optional
+
+
+class SearchStats:
+    """Counters and results of one move decision, for profiling and regression tests.
+
+    Filled in by AIPlayer while it searches; source says whether the move
+    came from the search, a ponder search, the opening book or the endgame
+    tables.
+    """
+
+    def __init__(self, source: str = 'search'):
+        self.source = source
+        # Chosen move in coordinate notation and its score in pawns for the mover, once known
+        self.move: Optional[str] = None
+        self.score: Optional[float] = None
+        # Deepest iteration that completed
+        self.depth = 0
+        # Positions visited by the main search, horizon included, and by quiescence beyond it
+        self.nodes = 0
+        self.qnodes = 0
+        # Static evaluations of leaf positions
+        self.evaluations = 0
+        # Nodes whose move loop failed high, and how many of those on the first move tried
+        self.beta_cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.seconds = 0.0
+        # Transposition table counters for this search
+        self.tt: dict = {}
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Returns the share of beta cutoffs produced by the first move, a measure of move ordering."""
+        return self.first_move_cutoffs / self.beta_cutoffs if self.beta_cutoffs else 0.0
+
+    @property
+    def nps(self) -> float:
+        """Returns the main search and quiescence nodes per second."""
+        return (self.nodes + self.qnodes) / self.seconds if self.seconds > 0 else 0.0
+
+    def merge(self, other: 'SearchStats'):
+        """Adds another search's counters, e.g. a parallel worker's, to these."""
+        self.nodes += other.nodes
+        self.qnodes += other.qnodes
+        self.evaluations += other.evaluations
+        self.beta_cutoffs += other.beta_cutoffs
+        self.first_move_cutoffs += other.first_move_cutoffs
+
+    def to_dict(self) -> dict:
+        """Returns the statistics as a JSON-serializable dict."""
+        return {
+            'source': self.source,
+            'move': self.move,
+            'score': self.score,
+            'depth': self.depth,
+            'nodes': self.nodes,
+            'qnodes': self.qnodes,
+            'evaluations': self.evaluations,
+            'beta_cutoffs': self.beta_cutoffs,
+            'first_move_cutoffs': self.first_move_cutoffs,
+            'first_move_cutoff_rate': round(self.first_move_cutoff_rate, 4),
+            'seconds': round(self.seconds, 6),
+            'nps': round(self.nps),
+            'tt': self.tt,
+        }
+
+    def to_json(self) -> str:
+        """Returns the statistics as one line of JSON."""
+        return json.dumps(self.to_dict())
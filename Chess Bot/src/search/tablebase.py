@@ -0,0 +1,193 @@
+import os
+from array import array
+from typing import Dict, Iterator, Optional
+from src.game.bitboard import BitBoard, PAWN, KING, WHITE, BLACK
+from src.game.fen import PIECE_LETTERS
+from src.game.movegen import KING_ATTACKS, attacks_from, generate_legal_moves, in_check
+
+# Table entries: plies to mate with the side to move mated after an even
+# number and mating after an odd number, or DRAW. ILLEGAL marks index
+# combinations that are not reachable positions.
+DRAW = 255
+ILLEGAL = 254
+
+# Side to move, white king, white piece and black king squares
+TABLE_SIZE = 2 * 64 * 64 * 64
+TABLE_MAGIC = b'CTB1'
+
+# Sentinel move count for positions where the lone king can capture its way to a draw
+NO_LOSS = 0xFFFF
+
+
+def table_name(piece_type: int) -> str:
+    """Returns the material name of a king and piece against king table, e.g. KQK."""
+    return f"K{PIECE_LETTERS[piece_type].upper()}K"
+
+
+def table_index(side: int, white_king: int, white_piece: int, black_king: int) -> int:
+    """Returns the entry of a position with white holding the extra piece."""
+    return ((side * 64 + white_king) * 64 + white_piece) * 64 + black_king
+
+
+def _place(bitboard: BitBoard, piece_type: int, white_king: int, white_piece: int, black_king: int):
+    """Sets a bitboard to the three pieces of a table position."""
+    white = [0] * 6
+    white[KING] = 1 << white_king
+    white[piece_type] |= 1 << white_piece
+    black = [0] * 6
+    black[KING] = 1 << black_king
+    bitboard.pieces = [white, black]
+    bitboard.occupancy = [white[KING] | 1 << white_piece, black[KING]]
+    bitboard.occupied = bitboard.occupancy[WHITE] | bitboard.occupancy[BLACK]
+
+
+def _predecessors(index: int, piece_type: int) -> Iterator[int]:
+    """Yields the entries one move earlier: the side not to move takes back a non-capturing move."""
+    side = index >> 18
+    white_king = (index >> 12) & 63
+    white_piece = (index >> 6) & 63
+    black_king = index & 63
+    previous = 1 - side
+    empty = ~((1 << white_king) | (1 << white_piece) | (1 << black_king))
+
+    if previous == BLACK:
+        targets = KING_ATTACKS[black_king] & empty
+        while targets:
+            bit = targets & -targets
+            targets ^= bit
+            yield table_index(BLACK, white_king, white_piece, bit.bit_length() - 1)
+        return
+
+    targets = KING_ATTACKS[white_king] & empty
+    while targets:
+        bit = targets & -targets
+        targets ^= bit
+        yield table_index(WHITE, bit.bit_length() - 1, white_piece, black_king)
+    if piece_type == PAWN:
+        origin = white_piece - 8
+        if origin >= 8 and empty & (1 << origin):
+            yield table_index(WHITE, white_king, origin, black_king)
+            if white_piece >> 3 == 3 and empty & (1 << (origin - 8)):
+                yield table_index(WHITE, white_king, origin - 8, black_king)
+        return
+    targets = attacks_from(piece_type, WHITE, white_piece, ~empty) & empty
+    while targets:
+        bit = targets & -targets
+        targets ^= bit
+        yield table_index(WHITE, white_king, bit.bit_length() - 1, black_king)
+
+
+def build_table(piece_type: int) -> bytearray:
+    """Solves king and piece against king by retrograde analysis.
+
+    Every position without legal moves is scored first (mate or stalemate).
+    Then, ply by ply, positions one move before a loss become wins, and
+    positions whose every move reaches a win for the opponent become losses.
+    Captures of the lone piece lead to bare kings, a draw.
+    """
+    values = bytearray([ILLEGAL]) * TABLE_SIZE
+    remaining = array('H', bytes(2 * TABLE_SIZE))
+    bitboard = BitBoard()
+    frontier = []
+    # White pawns never stand on the first rank
+    piece_squares = range(8, 64) if piece_type == PAWN else range(64)
+    for white_king in range(64):
+        for white_piece in piece_squares:
+            if white_piece == white_king:
+                continue
+            for black_king in range(64):
+                if black_king == white_king or black_king == white_piece:
+                    continue
+                _place(bitboard, piece_type, white_king, white_piece, black_king)
+                for side in (WHITE, BLACK):
+                    if in_check(bitboard, 1 - side):
+                        continue
+                    index = table_index(side, white_king, white_piece, black_king)
+                    moves = generate_legal_moves(bitboard, side)
+                    if not moves:
+                        if in_check(bitboard, side):
+                            values[index] = 0
+                            frontier.append(index)
+                        else:
+                            values[index] = DRAW
+                        continue
+                    values[index] = DRAW
+                    if any((code >> 15) & 7 for code in moves):
+                        remaining[index] = NO_LOSS
+                    else:
+                        remaining[index] = len(moves)
+
+    plies = 0
+    while frontier:
+        following = []
+        for index in frontier:
+            for previous in _predecessors(index, piece_type):
+                if values[previous] != DRAW:
+                    continue
+                if plies % 2 == 0:
+                    # Moving here mates the opponent in plies
+                    values[previous] = plies + 1
+                    following.append(previous)
+                else:
+                    remaining[previous] -= 1
+                    if remaining[previous] == 0:
+                        values[previous] = plies + 1
+                        following.append(previous)
+        frontier = following
+        plies += 1
+    return values
+
+
+def save_table(path: str, values: bytearray):
+    """Writes a table built by build_table."""
+    with open(path, 'wb') as file:
+        file.write(TABLE_MAGIC)
+        file.write(values)
+
+
+class Tablebase:
+    """Exact results of king and one piece against a lone king.
+
+    Tables are stored with white holding the piece; positions where black
+    holds it are mirrored vertically with colors swapped before probing.
+    """
+
+    def __init__(self):
+        # tables[piece_type] = entries indexed by table_index
+        self.tables: Dict[int, bytes] = {}
+
+    @classmethod
+    def load_dir(cls, directory: str) -> 'Tablebase':
+        """Loads every table file (KQK.tb, KRK.tb, ...) present in a directory."""
+        tablebase = cls()
+        for piece_type in range(KING):
+            path = os.path.join(directory, table_name(piece_type) + '.tb')
+            if not os.path.exists(path):
+                continue
+            with open(path, 'rb') as file:
+                data = file.read()
+            if data[:len(TABLE_MAGIC)] != TABLE_MAGIC or len(data) != len(TABLE_MAGIC) + TABLE_SIZE:
+                raise ValueError(f"Not a tablebase file: {path}")
+            tablebase.tables[piece_type] = data[len(TABLE_MAGIC):]
+        return tablebase
+
+    def probe(self, bitboard: BitBoard, side: int) -> Optional[int]:
+        """Returns the entry for the position with side to move, or None if no table covers it."""
+        if not self.tables or bitboard.occupied.bit_count() != 3:
+            return None
+        strong = WHITE if bitboard.occupancy[WHITE].bit_count() == 2 else BLACK
+        pieces = bitboard.pieces[strong]
+        piece_type = next((piece_type for piece_type in range(KING) if pieces[piece_type]), None)
+        table = self.tables.get(piece_type)
+        if table is None or not pieces[KING] or not bitboard.pieces[1 - strong][KING]:
+            return None
+        strong_king = bitboard.king_square(strong)
+        piece = pieces[piece_type].bit_length() - 1
+        weak_king = bitboard.king_square(1 - strong)
+        if strong == BLACK:
+            strong_king ^= 56
+            piece ^= 56
+            weak_king ^= 56
+            side = 1 - side
+        value = table[table_index(side, strong_king, piece, weak_king)]
+        return None if value == ILLEGAL else value
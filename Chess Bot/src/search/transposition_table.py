@@ -0,0 +1,74 @@
+from collections import namedtuple
+from typing import Optional
+
+# Bound types stored with each entry
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+TTEntry = namedtuple('TTEntry', ['key', 'depth', 'value', 'flag', 'best_move', 'generation'])
+
+
+class TranspositionTable:
+    """Fixed-size hash table of search results keyed by Zobrist key.
+
+    Each slot holds one entry. A new result replaces the stored one when the
+    slot is empty, holds the same position, was written during an earlier
+    search, or was searched no deeper than the new result.
+    """
+
+    def __init__(self, size: int = 1 << 16):
+        if size <= 0:
+            raise ValueError("Transposition table size must be positive")
+        # Round up to a power of two so the slot is a mask of the key
+        self.size = 1 << (size - 1).bit_length()
+        self.mask = self.size - 1
+        self.entries = [None] * self.size
+        self.generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zeroes the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def new_search(self):
+        """Marks existing entries as belonging to an earlier search."""
+        self.generation += 1
+
+    def clear(self):
+        """Removes every entry."""
+        self.entries = [None] * self.size
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        """Returns the entry stored for a key, or None."""
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key: int, depth: int, value: float, flag: int, best_move: Optional[int]):
+        """Saves a search result, subject to the replacement policy."""
+        slot = key & self.mask
+        current = self.entries[slot]
+        if current is not None:
+            if (current.key != key and current.generation == self.generation
+                    and current.depth > depth):
+                return
+            if current.key != key:
+                self.overwrites += 1
+        self.entries[slot] = TTEntry(key, depth, value, flag, best_move, self.generation)
+        self.stores += 1
+
+    def stats(self) -> dict:
+        """Returns the table counters."""
+        probes = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / probes if probes else 0.0,
+            'stores': self.stores,
+            'overwrites': self.overwrites,
+        }
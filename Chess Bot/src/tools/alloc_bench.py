@@ -0,0 +1,137 @@
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+from src.game.game import Game
+from src.game.move import Move
+from src.game.position import Position
+from src.players.ai_player import AIPlayer
+from src.search.options import SearchOptions
+
+DEFAULT_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w - - 0 1"
+
+
+class _DictPosition:
+    """Position as it would be without __slots__, for comparing instance sizes."""
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+
+class _DictMove:
+    """Move as it would be without __slots__, for comparing instance sizes."""
+
+    def __init__(self, from_position, to_position, piece_moved, piece_captured=None):
+        self.from_position = from_position
+        self.to_position = to_position
+        self.piece_moved = piece_moved
+        self.piece_captured = piece_captured
+        self.executed = False
+
+
+def instance_bytes(instance) -> int:
+    """Returns the memory of an object including its attribute dict, if it has one."""
+    size = sys.getsizeof(instance)
+    if hasattr(instance, '__dict__'):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+def instance_sizes() -> Dict[str, int]:
+    """Compares slotted Position and Move instances with dict-based equivalents."""
+    return {
+        'Position': instance_bytes(Position(0, 0)),
+        'Position (dict)': instance_bytes(_DictPosition(0, 0)),
+        'Move': instance_bytes(Move(Position(0, 0), Position(0, 1), None)),
+        'Move (dict)': instance_bytes(_DictMove(_DictPosition(0, 0), _DictPosition(0, 1), None)),
+    }
+
+
+def measure(function: Callable[[], list], repeat: int) -> Dict:
+    """Runs function repeat times under tracemalloc.
+
+    Reports the time, the peak traced memory, garbage collections, and the
+    bytes and garbage-collected objects one call's result keeps alive per item.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects_before = len(gc.get_objects())
+    retained_before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    retained = tracemalloc.get_traced_memory()[0] - retained_before
+    # Less the result list itself
+    objects = len(gc.get_objects()) - objects_before - 1
+    items = len(result) if result else 0
+    del result
+    tracemalloc.reset_peak()
+    collections = sum(stat['collections'] for stat in gc.get_stats())
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'calls': repeat,
+        'seconds': round(elapsed, 4),
+        'peak_kib': round(peak / 1024, 1),
+        'collections': sum(stat['collections'] for stat in gc.get_stats()) - collections,
+        'items': items,
+        'bytes_per_item': round(retained / items) if items else 0,
+        'objects_per_item': round(objects / items, 2) if items else 0,
+    }
+
+
+def scenarios(fen: str, depth: int) -> Dict[str, Callable[[], list]]:
+    """Builds the measured workloads on one position."""
+    game = Game()
+    color = game.board.load_fen(fen)
+    ai_player = AIPlayer("bench", color, SearchOptions(time_limit=3600, book=False))
+    ai_player.verbose = False
+
+    def search() -> list:
+        ai_player.transposition_table.clear()
+        ai_player.iterative_deepening(game, max_depth=depth)
+        return []
+
+    return {
+        'available_moves': lambda: ai_player.get_available_moves(game.board),
+        'legal_moves': lambda: game.legal_moves(color),
+        f'search depth {depth}': search,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the memory and allocation cost of move objects.")
+    parser.add_argument('--fen', default=DEFAULT_FEN, help="position to measure (default a busy middlegame)")
+    parser.add_argument('--repeat', type=int, default=200, help="calls per move generation workload (default 200)")
+    parser.add_argument('--depth', type=int, default=2, help="depth of the search workload (default 2)")
+    parser.add_argument('--json', help="write the results as JSON to this path")
+    args = parser.parse_args(argv)
+    if args.repeat < 1 or args.depth < 1:
+        parser.error("repeat and depth must be at least 1")
+
+    sizes = instance_sizes()
+    for name, size in sizes.items():
+        print(f"{name}: {size} bytes")
+    results = {}
+    for name, function in scenarios(args.fen, args.depth).items():
+        repeat = 1 if name.startswith('search') else args.repeat
+        results[name] = result = measure(function, repeat)
+        per_item = (f", {result['bytes_per_item']} bytes and {result['objects_per_item']} objects per move"
+                    if result['items'] else "")
+        print(f"{name}: {result['calls']} calls in {result['seconds']:.3f}s, peak {result['peak_kib']} KiB, "
+              f"{result['collections']} collections{per_item}")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'instance_bytes': sizes, 'workloads': results}, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,255 @@
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, TextIO
+from src.enums.color import Color
+from src.game.bitboard import color_index
+from src.game.fen import STARTING_FEN
+from src.game.game import Game
+from src.game.move import Move, move_name
+from src.game.movegen import generate_legal_moves
+from src.players.ai_player import AIPlayer
+from src.search.opening_book import parse_square
+from src.search.options import SearchOptions
+
+
+class Analyzer:
+    """A game and one AI player per color whose caches stay warm across requests."""
+
+    def __init__(self, options: SearchOptions):
+        self.options = options
+        self.players = {color: AIPlayer(f"AI_{color.name}", color, options) for color in Color}
+        for player in self.players.values():
+            player.verbose = False
+        self.game = Game()
+        self.game.verbose = False
+        self.game.setup_players(self.players[Color.WHITE], self.players[Color.BLACK])
+
+    def analyze(self, request: Dict, received: float) -> Dict:
+        """Searches the position of one request and returns the response, an error message if invalid.
+
+        A request holds an optional id, fen (default the starting position),
+        moves in coordinate notation played from it, time_limit and max_depth.
+        """
+        started = time.perf_counter()
+        response = {'id': request.get('id')}
+        try:
+            time_limit, max_depth = self.limits(request)
+            self.set_position(request.get('fen', STARTING_FEN), request.get('moves', []))
+        except (TypeError, ValueError) as error:
+            response['error'] = str(error)
+            return response
+        player = self.players[self.game.side_to_move()]
+        move, stats = player.choose_move(self.game, time_limit, max_depth)
+        finished = time.perf_counter()
+        response.update({
+            'move': move_name(move.encode()) if move is not None else None,
+            'score': stats.score,
+            'depth': stats.depth,
+            'source': stats.source,
+            'stats': stats.to_dict(),
+            'queue_seconds': round(started - received, 6),
+            'search_seconds': round(finished - started, 6),
+            'latency_seconds': round(finished - received, 6),
+        })
+        return response
+
+    def limits(self, request: Dict):
+        """Returns the request's (time limit, max depth), the server's options where not given."""
+        time_limit = float(request.get('time_limit', self.options.time_limit))
+        max_depth = int(request.get('max_depth', self.options.max_depth))
+        if time_limit <= 0 or max_depth < 1:
+            raise ValueError("time_limit must be positive and max_depth at least 1")
+        return time_limit, max_depth
+
+    def set_position(self, fen: str, moves: List[str]):
+        """Loads a FEN and plays moves such as e2e4 from it."""
+        game = self.game
+        game.load_fen(fen)
+        for token in moves:
+            side = color_index(game.side_to_move())
+            target = parse_square(token[:2]) | parse_square(token[2:4]) << 6
+            code = next((code for code in generate_legal_moves(game.board.bitboard, side)
+                         if code & 4095 == target), None)
+            if code is None:
+                raise ValueError(f"Illegal move {token}")
+            game.board.make_move(Move.from_code(code, game.board))
+            game.switch_turn()
+
+    def close(self):
+        """Stops the players' parallel search processes, if any."""
+        for player in self.players.values():
+            player.close()
+
+
+# Per-process analyzer of a worker process, set by _init_analyzer
+_analyzer: Optional[Analyzer] = None
+
+
+def _init_analyzer(options: SearchOptions):
+    global _analyzer
+    _analyzer = Analyzer(options)
+
+
+def _analyze(request: Dict, received: float) -> Dict:
+    return _analyzer.analyze(request, received)
+
+
+class AnalysisServer:
+    """Answers JSON-lines analysis requests from a bounded queue with a pool of warm workers.
+
+    With one worker requests are searched in this process; with more, each
+    worker thread hands its requests to its own process, whose analyzer
+    keeps its transposition tables between requests. A full queue blocks
+    the reader, so clients are slowed down instead of dropped. Responses
+    carry the request id and may arrive out of order.
+    """
+
+    def __init__(self, output: TextIO = sys.stdout, options: Optional[SearchOptions] = None,
+                 workers: int = 1, queue_size: int = 16):
+        if workers < 1 or queue_size < 1:
+            raise ValueError("Workers and queue size must be at least 1")
+        self.output = output
+        self.options = options if options is not None else SearchOptions()
+        self.output_lock = threading.Lock()
+        self.requests: queue.Queue = queue.Queue(maxsize=queue_size)
+        # Latencies of answered requests and the number of errors, for the stats command
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.analyzer = Analyzer(self.options) if workers == 1 else None
+        self.pools = [] if workers == 1 else [ProcessPoolExecutor(1, initializer=_init_analyzer,
+                                                                  initargs=(self.options,))
+                                              for _ in range(workers)]
+        self.threads = [threading.Thread(target=self.work, args=(index,), daemon=True) for index in range(workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def send(self, response: Dict):
+        """Writes one response line."""
+        with self.output_lock:
+            self.output.write(json.dumps(response) + '\n')
+            self.output.flush()
+
+    def handle(self, line: str) -> bool:
+        """Queues one request line, or answers a command; returns False on quit."""
+        received = time.perf_counter()
+        if not line.strip():
+            return True
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+        except ValueError as error:
+            self.record_error()
+            self.send({'id': None, 'error': f"Invalid request: {error}"})
+            return True
+        command = request.get('command')
+        if command == 'quit':
+            return False
+        if command == 'stats':
+            self.send({'id': request.get('id'), **self.summary()})
+        elif command is not None:
+            self.record_error()
+            self.send({'id': request.get('id'), 'error': f"Unknown command: {command}"})
+        else:
+            self.requests.put((request, received))
+        return True
+
+    def work(self, index: int):
+        """Body of a worker thread: answers queued requests until it takes None."""
+        while True:
+            item = self.requests.get()
+            if item is None:
+                return
+            request, received = item
+            try:
+                if self.analyzer is not None:
+                    response = self.analyzer.analyze(request, received)
+                else:
+                    response = self.pools[index].submit(_analyze, request, received).result()
+            except Exception as error:
+                # One bad request must not take the worker down with it
+                response = {'id': request.get('id'), 'error': f"{type(error).__name__}: {error}"}
+            with self.output_lock:
+                if 'error' in response:
+                    self.errors += 1
+                else:
+                    self.latencies.append(response['latency_seconds'])
+            self.send(response)
+
+    def record_error(self):
+        with self.output_lock:
+            self.errors += 1
+
+    def summary(self) -> Dict:
+        """Returns the number of answered requests and their latency so far."""
+        with self.output_lock:
+            latencies = sorted(self.latencies)
+            errors = self.errors
+        count = len(latencies)
+        return {
+            'requests': count,
+            'errors': errors,
+            'queued': self.requests.qsize(),
+            'mean_latency': round(sum(latencies) / count, 6) if count else 0,
+            'median_latency': latencies[count // 2] if count else 0,
+            'max_latency': latencies[-1] if count else 0,
+        }
+
+    def close(self):
+        """Answers the requests still queued, then stops the workers."""
+        for _ in self.threads:
+            self.requests.put(None)
+        for thread in self.threads:
+            thread.join()
+        if self.analyzer is not None:
+            self.analyzer.close()
+        for pool in self.pools:
+            pool.shutdown()
+
+
+def serve(input_stream: TextIO, output: TextIO, options: SearchOptions, workers: int = 1,
+          queue_size: int = 16) -> Dict:
+    """Answers requests from input_stream until it ends or a quit command; returns the final summary."""
+    server = AnalysisServer(output, options, workers, queue_size)
+    try:
+        for line in input_stream:
+            if not server.handle(line):
+                break
+    finally:
+        server.close()
+    return server.summary()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Analyze positions sent as JSON lines on standard input "
+                                                 "with warm engines, one JSON response line per request.")
+    parser.add_argument('--workers', type=int, default=1, help="positions searched in parallel (default 1)")
+    parser.add_argument('--queue-size', type=int, default=16,
+                        help="requests waiting before reading pauses (default 16)")
+    parser.add_argument('--time-limit', type=float, default=1.0, help="default seconds per request (default 1.0)")
+    parser.add_argument('--max-depth', type=int, default=32, help="default deepest iteration (default 32)")
+    parser.add_argument('--tt-size', type=int, default=1 << 18,
+                        help="transposition table slots per engine (default 262144)")
+    parser.add_argument('--no-book', action='store_true', help="always search, even in book positions")
+    parser.add_argument('--tablebase-dir', help="directory of endgame tables to probe")
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.queue_size < 1:
+        parser.error("workers and queue size must be at least 1")
+    try:
+        options = SearchOptions(time_limit=args.time_limit, max_depth=args.max_depth, tt_size=args.tt_size,
+                                book=not args.no_book, tablebase_dir=args.tablebase_dir)
+    except ValueError as error:
+        parser.error(str(error))
+    summary = serve(sys.stdin, sys.stdout, options, args.workers, args.queue_size)
+    print(f"{summary['requests']} requests, {summary['errors']} errors, "
+          f"mean latency {summary['mean_latency']:.3f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,31 @@
+import argparse
+import sys
+from typing import List, Optional
+from src.search.opening_book import DEFAULT_LINES, OpeningBook
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build a binary opening book from games in coordinate notation.")
+    parser.add_argument('output', help="book file to write")
+    parser.add_argument('lines', nargs='?',
+                        help="text file with one game per line, e.g. '1. e2e4 e7e5 2. g1f3' (default built-in lines)")
+    parser.add_argument('--max-plies', type=int, default=12, help="plies of each game to keep (default 12)")
+    args = parser.parse_args(argv)
+
+    if args.lines:
+        with open(args.lines) as file:
+            lines = file.readlines()
+    else:
+        lines = DEFAULT_LINES
+    try:
+        book = OpeningBook.from_lines(lines, args.max_plies)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+    book.save(args.output)
+    print(f"Wrote {len(book)} positions to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+from src.search.tablebase import DRAW, ILLEGAL, build_table, save_table, table_name
+from src.game.fen import PIECE_LETTERS
+
+DEFAULT_TABLES = ['KQK', 'KRK', 'KPK']
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build king and piece against king endgame tables.")
+    parser.add_argument('directory', help="directory to write the .tb files to")
+    parser.add_argument('--tables', nargs='+', default=DEFAULT_TABLES,
+                        help="tables to build, e.g. KQK KRK KBK KNK KPK (default KQK KRK KPK)")
+    args = parser.parse_args(argv)
+
+    piece_types = []
+    for name in args.tables:
+        name = name.upper()
+        if len(name) != 3 or name[0] != 'K' or name[2] != 'K' or name[1].lower() not in PIECE_LETTERS[:5]:
+            parser.error(f"unknown table {name}")
+        piece_types.append(PIECE_LETTERS.index(name[1].lower()))
+
+    os.makedirs(args.directory, exist_ok=True)
+    for piece_type in piece_types:
+        start = time.perf_counter()
+        values = build_table(piece_type)
+        elapsed = time.perf_counter() - start
+        path = os.path.join(args.directory, table_name(piece_type) + '.tb')
+        save_table(path, values)
+        decisive = [value for value in values if value < ILLEGAL]
+        wins = sum(value % 2 for value in decisive)
+        longest = max(decisive, default=0)
+        print(f"{table_name(piece_type)}: {wins} wins, {len(decisive) - wins} losses, {values.count(DRAW)} draws, "
+              f"longest mate {longest} plies, built in {elapsed:.1f}s -> {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
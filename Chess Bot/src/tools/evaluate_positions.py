@@ -0,0 +1,71 @@
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional
+from src.enums.color import Color
+from src.game.game import Game
+from src.players.ai_player import AIPlayer
+from src.search import batch_eval
+
+
+def evaluate_one_by_one(fens: List[str]) -> List[float]:
+    """Scores positions for their side to move with AIPlayer.evaluate_position, for comparison."""
+    game = Game()
+    players = {color: AIPlayer("eval", color) for color in Color}
+    scores = []
+    for fen in fens:
+        color = game.board.load_fen(fen)
+        scores.append(players[color].evaluate_position(game))
+    return scores
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Score many FEN positions at once with the NumPy batch evaluator.")
+    parser.add_argument('positions', nargs='?', help="file with one FEN per line (default standard input)")
+    parser.add_argument('--json', help="write the scores as JSON to this path")
+    parser.add_argument('--compare', action='store_true',
+                        help="also score every position with AIPlayer.evaluate_position and report both timings")
+    parser.add_argument('--quiet', action='store_true', help="print only the summary, not one line per position")
+    args = parser.parse_args(argv)
+    if batch_eval.np is None:
+        print("Batch evaluation needs NumPy: pip install numpy", file=sys.stderr)
+        return 1
+
+    if args.positions:
+        with open(args.positions) as file:
+            lines = file.readlines()
+    else:
+        lines = sys.stdin.readlines()
+    fens = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+    try:
+        start = time.perf_counter()
+        boards, sides = batch_eval.load_fens(fens)
+        loaded = time.perf_counter()
+        scores = batch_eval.evaluate_batch(boards, sides)
+        evaluated = time.perf_counter()
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        for fen, score in zip(fens, scores):
+            print(f"{score:+.2f} {fen}")
+    print(f"{len(fens)} positions: loaded in {loaded - start:.4f}s, evaluated in {evaluated - loaded:.4f}s")
+    report = {'positions': len(fens), 'load_seconds': round(loaded - start, 6),
+              'evaluate_seconds': round(evaluated - loaded, 6)}
+    if args.compare:
+        start = time.perf_counter()
+        expected = evaluate_one_by_one(fens)
+        report['one_by_one_seconds'] = round(time.perf_counter() - start, 6)
+        report['max_difference'] = max((abs(score - value) for score, value in zip(scores, expected)), default=0.0)
+        print(f"one by one: {report['one_by_one_seconds']:.4f}s, "
+              f"largest difference {report['max_difference']:.6f}")
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({**report, 'scores': [round(float(score), 4) for score in scores]}, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
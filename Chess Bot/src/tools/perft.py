@@ -0,0 +1,139 @@
+import argparse
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+from src.game.bitboard import color_index
+from src.game.board import Board
+from src.game.fen import STARTING_FEN
+from src.game.move import Move
+from src.game.movegen import generate_legal_moves, in_check, make_move, unmake_move
+from src.enums.color import Color
+from src.players.human_player import HumanPlayer
+
+# Reference positions with leaf counts by depth under this game's rules
+# (no castling, en passant or promotion). The start position matches the
+# standard figures; the others differ from published ones where those rules apply.
+SUITE = [
+    ("start", STARTING_FEN, [20, 400, 8902, 197281]),
+    ("endgame", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", [14, 191, 2810, 43087]),
+    ("middlegame", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w - - 0 1",
+     [46, 1865, 86585, 3488552]),
+    ("pin", "3k4/8/1b2r3/8/4B3/2N5/3P4/4K3 w - - 0 1", [12, 258, 3996, 91494]),
+]
+
+
+def perft_bitboard(board: Board, color: Color, depth: int) -> int:
+    """Counts leaf nodes with the bitboard legal move generator."""
+    return _perft_codes(board.bitboard, color_index(color), depth)
+
+
+def _perft_codes(bitboard, color: int, depth: int) -> int:
+    moves = generate_legal_moves(bitboard, color)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for code in moves:
+        make_move(bitboard, code)
+        nodes += _perft_codes(bitboard, 1 - color, depth - 1)
+        unmake_move(bitboard, code)
+    return nodes
+
+
+def legal_object_moves(board: Board, color: Color) -> List[Move]:
+    """Returns the moves of Player.get_available_moves that do not leave the king attacked."""
+    index = color_index(color)
+    legal = []
+    for move in HumanPlayer("perft", color).get_available_moves(board):
+        with_piece_moved(board, move, lambda: None if in_check(board.bitboard, index) else legal.append(move))
+    return legal
+
+
+def with_piece_moved(board: Board, move: Move, action: Callable):
+    """Plays a move on the piece objects, runs action and restores the position."""
+    board.make_move(move)
+    try:
+        return action()
+    finally:
+        board.unmake_move()
+
+
+def perft_objects(board: Board, color: Color, depth: int) -> int:
+    """Counts leaf nodes with Player.get_available_moves and the piece classes."""
+    moves = legal_object_moves(board, color)
+    if depth == 1:
+        return len(moves)
+    opponent = Color.BLACK if color == Color.WHITE else Color.WHITE
+    return sum(with_piece_moved(board, move, lambda: perft_objects(board, opponent, depth - 1))
+               for move in moves)
+
+
+BACKENDS = {'bitboard': perft_bitboard, 'objects': perft_objects}
+
+
+def divide(board: Board, color: Color, depth: int, backend: str = 'bitboard') -> Dict[str, int]:
+    """Returns the leaf count below each root move, keyed by move in coordinate notation."""
+    count = BACKENDS[backend]
+    opponent = Color.BLACK if color == Color.WHITE else Color.WHITE
+    counts = {}
+    for move in legal_object_moves(board, color):
+        name = (Board.convert_to_chess_notation(move.from_position) +
+                Board.convert_to_chess_notation(move.to_position)).lower()
+        counts[name] = (1 if depth == 1 else
+                        with_piece_moved(board, move, lambda: count(board, opponent, depth - 1)))
+    return counts
+
+
+def run(fen: str, depth: int, backend: str = 'bitboard') -> Tuple[int, float]:
+    """Loads a FEN position and returns the leaf count to depth and the seconds it took."""
+    board = Board()
+    color = board.load_fen(fen)
+    start = time.perf_counter()
+    nodes = BACKENDS[backend](board, color, depth)
+    return nodes, time.perf_counter() - start
+
+
+def report(label: str, nodes: int, elapsed: float) -> str:
+    """Formats one perft result line with the nodes per second."""
+    nps = nodes / elapsed if elapsed > 0 else 0
+    return f"{label}: {nodes} nodes in {elapsed:.3f}s ({nps:,.0f} nps)"
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Count move generation leaf nodes to a fixed depth.")
+    parser.add_argument('--depth', type=int, default=3, help="plies to search (default 3)")
+    parser.add_argument('--fen', action='append', help="position to count from; repeatable (default start position)")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='bitboard',
+                        help="bitboard generator or Player.get_available_moves")
+    parser.add_argument('--divide', action='store_true', help="print the count below each root move")
+    parser.add_argument('--suite', action='store_true', help="verify the reference positions up to --depth")
+    args = parser.parse_args(argv)
+    if args.depth < 1:
+        parser.error("depth must be at least 1")
+
+    if args.suite:
+        failures = 0
+        for name, fen, counts in SUITE:
+            for depth, expected in enumerate(counts[:args.depth], start=1):
+                nodes, elapsed = run(fen, depth, args.backend)
+                status = "ok" if nodes == expected else f"FAILED, expected {expected}"
+                failures += nodes != expected
+                print(f"{report(f'{name} depth {depth}', nodes, elapsed)} {status}")
+        return 1 if failures else 0
+
+    for fen in args.fen or [STARTING_FEN]:
+        print(fen)
+        if args.divide:
+            board = Board()
+            color = board.load_fen(fen)
+            counts = divide(board, color, args.depth, args.backend)
+            for name in sorted(counts):
+                print(f"{name}: {counts[name]}")
+            print(f"Moves: {len(counts)}, nodes: {sum(counts.values())}")
+        else:
+            nodes, elapsed = run(fen, args.depth, args.backend)
+            print(report(f"Depth {args.depth}", nodes, elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
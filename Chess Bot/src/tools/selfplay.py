@@ -0,0 +1,205 @@
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from src.game.bitboard import BitBoard, color_index
+from src.game.board import Board
+from src.game.fen import STARTING_FEN
+from src.game.game import Game
+from src.game.move import move_name
+from src.game.movegen import generate_legal_moves
+from src.game.zobrist import compute_key
+from src.players.ai_player import AIPlayer
+from src.search.options import SearchOptions
+from src.enums.color import Color
+from src.enums.game_status import GameStatus
+
+CSV_FIELDS = ['game', 'ply', 'color', 'move', 'nodes', 'qnodes', 'depth', 'seconds', 'nps']
+
+
+def board_errors(board: Board) -> List[str]:
+    """Returns the inconsistencies between the squares, the pieces and the incremental board state."""
+    errors = []
+    expected = BitBoard()
+    for x in range(8):
+        for y in range(8):
+            piece = board.squares[x][y].piece
+            if piece is None:
+                continue
+            if piece.position.x != x or piece.position.y != y:
+                errors.append(f"{piece.__class__.__name__} on {x},{y} thinks it is on "
+                              f"{piece.position.x},{piece.position.y}")
+            expected.add_piece(color_index(piece.color), Board.PIECE_CLASSES.index(type(piece)), y * 8 + x)
+    if expected.pieces != board.bitboard.pieces:
+        errors.append("bitboards do not match the squares")
+    if compute_key(expected) != board.zobrist_key:
+        errors.append("zobrist key does not match the squares")
+    for color in range(2):
+        if expected.king_square(color) < 0:
+            errors.append(f"{'white' if color == 0 else 'black'} king is missing")
+    return errors
+
+
+def play_random_move(game: Game, rng: random.Random) -> bool:
+    """Plays a random legal move for the current player; returns False if there is none."""
+    moves = game.legal_moves()
+    if not moves:
+        return False
+    move = rng.choice(moves)
+    game.board.make_move(move)
+    game.switch_turn()
+    return True
+
+
+def play_game(index: int, fen: str, options: SearchOptions, max_plies: int, random_plies: int,
+              seed: int) -> Dict:
+    """Plays one headless AI-vs-AI game and returns its record."""
+    white = AIPlayer("AI_WHITE", Color.WHITE, options)
+    black = AIPlayer("AI_BLACK", Color.BLACK, options)
+    for player in (white, black):
+        player.verbose = False
+    game = Game()
+    game.verbose = False
+    game.start_game(white, black)
+    game.load_fen(fen)
+
+    # Random opening moves so deterministic players do not repeat the same game
+    rng = random.Random(seed + index)
+    for _ in range(random_plies):
+        if not play_random_move(game, rng):
+            break
+
+    record = {'game': index, 'start_fen': game.to_fen(), 'moves': [], 'result': None, 'winner': None, 'error': None}
+    while game.game_status == GameStatus.ONGOING and len(record['moves']) < max_plies:
+        player = game.current_player
+        side = color_index(player.color)
+        legal = set(generate_legal_moves(game.board.bitboard, side))
+        start = time.perf_counter()
+        move = game.play_turn()
+        elapsed = time.perf_counter() - start
+        if move is None:
+            if game.game_status == GameStatus.ONGOING:
+                record['error'] = f"{player.name} found no move but the game is not over"
+            break
+        nodes = player.nodes + player.qnodes
+        record['moves'].append({
+            'ply': len(record['moves']) + 1,
+            'color': player.color.name.lower(),
+            'move': move_name(move.encode()),
+            'nodes': player.nodes,
+            'qnodes': player.qnodes,
+            'depth': player.completed_depth,
+            'seconds': round(elapsed, 6),
+            'nps': round(nodes / elapsed) if elapsed > 0 else 0,
+            'stats': player.stats.to_dict(),
+        })
+        errors = board_errors(game.board)
+        if move.encode() not in legal:
+            errors.insert(0, f"illegal move {move_name(move.encode())}")
+        if errors:
+            record['error'] = f"ply {len(record['moves'])}: " + "; ".join(errors)
+            break
+
+    if game.game_status == GameStatus.CHECKMATE:
+        record['result'] = 'checkmate'
+        record['winner'] = 'black' if game.current_player.color == Color.WHITE else 'white'
+    elif game.game_status == GameStatus.STALEMATE:
+        record['result'] = 'stalemate'
+    elif game.game_status == GameStatus.DRAW:
+        record['result'] = game.draw_reason
+    elif record['error'] is None:
+        record['result'] = 'move limit'
+    record['plies'] = len(record['moves'])
+    record['end_fen'] = game.to_fen()
+    return record
+
+
+def summarize(records: List[Dict], wall_seconds: float) -> Dict:
+    """Totals nodes and search time over all games."""
+    moves = [move for record in records for move in record['moves']]
+    nodes = sum(move['nodes'] + move['qnodes'] for move in moves)
+    search_seconds = sum(move['seconds'] for move in moves)
+    latencies = sorted(move['seconds'] for move in moves)
+    return {
+        'games': len(records),
+        'errors': sum(record['error'] is not None for record in records),
+        'moves': len(moves),
+        'nodes': nodes,
+        'search_seconds': round(search_seconds, 3),
+        'wall_seconds': round(wall_seconds, 3),
+        'nps': round(nodes / search_seconds) if search_seconds > 0 else 0,
+        'mean_latency': round(search_seconds / len(moves), 6) if moves else 0,
+        'max_latency': latencies[-1] if latencies else 0,
+        'results': {result: sum(record['result'] == result for record in records)
+                    for result in sorted({str(record['result']) for record in records})},
+    }
+
+
+def write_csv(path: str, records: List[Dict]):
+    """Writes one row per move played."""
+    with open(path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for record in records:
+            for move in record['moves']:
+                writer.writerow({'game': record['game'], **move})
+
+
+def write_stats(path: str, records: List[Dict]):
+    """Writes each move's search statistics as one JSON line."""
+    with open(path, 'w') as file:
+        for record in records:
+            for move in record['moves']:
+                file.write(json.dumps({'game': record['game'], 'ply': move['ply'], 'color': move['color'],
+                                       **move['stats']}) + '\n')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Play AI-vs-AI games headlessly and report engine throughput.")
+    parser.add_argument('--games', type=int, default=4, help="number of games (default 4)")
+    parser.add_argument('--workers', type=int, default=1, help="games played in parallel processes (default 1)")
+    parser.add_argument('--time-limit', type=float, default=0.5, help="seconds per move (default 0.5)")
+    parser.add_argument('--max-depth', type=int, default=32, help="deepest search iteration (default 32)")
+    parser.add_argument('--max-plies', type=int, default=200, help="plies before a game is stopped (default 200)")
+    parser.add_argument('--random-plies', type=int, default=4, help="random opening plies per game (default 4)")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the random openings")
+    parser.add_argument('--fen', default=STARTING_FEN, help="start position (default the standard one)")
+    parser.add_argument('--json', help="write the full report as JSON to this path")
+    parser.add_argument('--csv', help="write one row per move as CSV to this path")
+    parser.add_argument('--stats', help="write each move's search statistics as JSON lines to this path")
+    args = parser.parse_args(argv)
+    if args.games < 1 or args.workers < 1:
+        parser.error("games and workers must be at least 1")
+
+    options = SearchOptions(time_limit=args.time_limit, max_depth=args.max_depth)
+    jobs = [(index, args.fen, options, args.max_plies, args.random_plies, args.seed) for index in range(args.games)]
+    start = time.perf_counter()
+    if args.workers == 1:
+        records = [play_game(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(args.workers) as pool:
+            records = list(pool.map(play_game, *zip(*jobs)))
+    summary = summarize(records, time.perf_counter() - start)
+
+    for record in records:
+        outcome = record['error'] or f"{record['result']}" + (f", {record['winner']} wins" if record['winner'] else "")
+        print(f"game {record['game']}: {record['plies']} plies, {outcome}")
+    print(f"{summary['moves']} moves, {summary['nodes']} nodes, {summary['nps']} nps, "
+          f"mean {summary['mean_latency']:.3f}s per move, {summary['errors']} errors")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'summary': summary, 'games': records}, file, indent=2)
+    if args.csv:
+        write_csv(args.csv, records)
+    if args.stats:
+        write_stats(args.stats, records)
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,271 @@
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, TextIO, Tuple
+from src.game.bitboard import color_index
+from src.game.fen import STARTING_FEN
+from src.game.game import Game
+from src.game.move import Move, move_name
+from src.game.movegen import generate_legal_moves
+from src.players.ai_player import AIPlayer
+from src.search.opening_book import parse_square
+from src.search.options import SearchOptions
+from src.search.stats import SearchStats
+from src.enums.color import Color
+
+ENGINE_NAME = "Chess Bot"
+
+# Options announced to the GUI: name -> (UCI type and default, SearchOptions attribute)
+UCI_OPTIONS = {
+    'Threads': ('spin default 1 min 1 max 64', 'workers'),
+    'OwnBook': ('check default true', 'book'),
+    'BookFile': ('string default <empty>', 'book_path'),
+    'TablebasePath': ('string default <empty>', 'tablebase_dir'),
+}
+
+# Moves assumed left in the game when the GUI does not send movestogo
+DEFAULT_MOVES_TO_GO = 30
+# Seconds kept back from every clock-based budget for move transmission
+MOVE_OVERHEAD = 0.05
+MIN_TIME_LIMIT = 0.01
+
+
+def search_limits(tokens: List[str], side: Color, options: SearchOptions) -> Tuple[float, int, bool]:
+    """Turns the arguments of a go command into (time limit, max depth, infinite)."""
+    values: Dict[str, int] = {}
+    infinite = False
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token == 'infinite':
+            infinite = True
+        elif token in ('depth', 'movetime', 'wtime', 'btime', 'winc', 'binc', 'movestogo', 'nodes', 'mate'):
+            if index + 1 < len(tokens):
+                values[token] = int(tokens[index + 1])
+                index += 1
+        index += 1
+
+    max_depth = values.get('depth', options.max_depth)
+    if infinite:
+        return float('inf'), options.max_depth, True
+    if 'movetime' in values:
+        return max(values['movetime'] / 1000 - MOVE_OVERHEAD, MIN_TIME_LIMIT), max_depth, False
+    clock, increment = ('wtime', 'winc') if side == Color.WHITE else ('btime', 'binc')
+    if clock in values:
+        remaining = values[clock] / 1000
+        budget = remaining / values.get('movestogo', DEFAULT_MOVES_TO_GO) + values.get(increment, 0) / 1000 * 0.75
+        # Never spend more than half of what is left on one move
+        budget = min(budget, remaining / 2) - MOVE_OVERHEAD
+        return max(budget, MIN_TIME_LIMIT), max_depth, False
+    if 'depth' in values:
+        return float('inf'), max_depth, False
+    return options.time_limit, max_depth, False
+
+
+def info_line(stats: SearchStats, move: Move, seconds: float) -> str:
+    """Formats a UCI info line for a completed iteration."""
+    score = stats.score if stats.score is not None else 0
+    mate_plies = AIPlayer.MATE_SCORE - abs(score)
+    if mate_plies < 1000:
+        moves = (round(mate_plies) + 1) // 2
+        score_text = f"mate {moves if score > 0 else -moves}"
+    else:
+        score_text = f"cp {round(score * 100)}"
+    nodes = stats.nodes + stats.qnodes
+    nps = round(nodes / seconds) if seconds > 0 else 0
+    return (f"info depth {stats.depth} score {score_text} nodes {nodes} nps {nps} "
+            f"time {round(seconds * 1000)} pv {move_name(move.encode())}")
+
+
+class UciEngine:
+    """Answers UCI commands for the AI players of one game.
+
+    Searches run in a background thread so stop, isready and quit are heard
+    while the engine thinks; output lines are written under a lock.
+    """
+
+    def __init__(self, output: TextIO = sys.stdout, options: Optional[SearchOptions] = None):
+        self.output = output
+        self.options = options if options is not None else SearchOptions()
+        self.output_lock = threading.Lock()
+        self.search_thread: Optional[threading.Thread] = None
+        # Set by stop; an infinite search waits for it before sending bestmove
+        self.stop_event = threading.Event()
+        self.search_infinite = False
+        self.players: Dict[Color, AIPlayer] = {}
+        self.game: Optional[Game] = None
+        self.new_game()
+
+    def send(self, line: str):
+        """Writes one line to the GUI."""
+        with self.output_lock:
+            self.output.write(line + '\n')
+            self.output.flush()
+
+    def new_game(self):
+        """Creates fresh players, clearing what they learned, on the starting position."""
+        self.close_players()
+        self.players = {color: AIPlayer(f"AI_{color.name}", color, self.options) for color in Color}
+        self.game = Game()
+        self.game.verbose = False
+        for player in self.players.values():
+            player.verbose = False
+        self.game.setup_players(self.players[Color.WHITE], self.players[Color.BLACK])
+        self.game.load_fen(STARTING_FEN)
+
+    def close_players(self):
+        """Stops any parallel search processes of the players."""
+        for player in self.players.values():
+            player.close()
+
+    def handle(self, line: str) -> bool:
+        """Executes one command; returns False once the engine should quit."""
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, arguments = tokens[0], tokens[1:]
+        if command in ('ucinewgame', 'setoption', 'position', 'go', 'd'):
+            self.finish_search()
+        if command == 'quit':
+            self.stop()
+            self.close_players()
+            return False
+        if command == 'uci':
+            self.send(f"id name {ENGINE_NAME}")
+            self.send("id author Chess Bot developers")
+            for name, (description, _) in UCI_OPTIONS.items():
+                self.send(f"option name {name} type {description}")
+            self.send("uciok")
+        elif command == 'isready':
+            self.send("readyok")
+        elif command == 'stop':
+            self.stop()
+        elif command == 'ucinewgame':
+            self.new_game()
+        elif command == 'setoption':
+            self.set_option(arguments)
+        elif command == 'position':
+            self.set_position(arguments)
+        elif command == 'go':
+            self.go(arguments)
+        elif command == 'd':
+            self.send(f"info string fen {self.game.to_fen()}")
+        else:
+            self.send(f"info string unknown command {command}")
+        return True
+
+    def set_option(self, arguments: List[str]):
+        """Handles setoption name <name> value <value>; players are rebuilt with the new options."""
+        if 'name' not in arguments:
+            return
+        value_index = arguments.index('value') if 'value' in arguments else len(arguments)
+        name = ' '.join(arguments[arguments.index('name') + 1:value_index])
+        value = ' '.join(arguments[value_index + 1:])
+        if name not in UCI_OPTIONS:
+            self.send(f"info string unknown option {name}")
+            return
+        attribute = UCI_OPTIONS[name][1]
+        if attribute == 'workers':
+            self.options.workers = max(1, int(value))
+        elif attribute == 'book':
+            self.options.book = value.lower() == 'true'
+        else:
+            setattr(self.options, attribute, value if value and value != '<empty>' else None)
+        self.new_game()
+
+    def set_position(self, arguments: List[str]):
+        """Handles position startpos|fen <fen> [moves <move>...]."""
+        moves_index = arguments.index('moves') if 'moves' in arguments else len(arguments)
+        if arguments and arguments[0] == 'fen':
+            fen = ' '.join(arguments[1:moves_index])
+        else:
+            fen = STARTING_FEN
+        try:
+            self.game.load_fen(fen)
+        except ValueError as error:
+            self.send(f"info string invalid fen: {error}")
+            return
+        for token in arguments[moves_index + 1:]:
+            if not self.play(token):
+                self.send(f"info string illegal move {token}")
+                return
+
+    def play(self, token: str) -> bool:
+        """Plays a move given in coordinate notation, e.g. e2e4; returns False if it is not legal."""
+        game = self.game
+        try:
+            move = parse_square(token[:2]) | parse_square(token[2:4]) << 6
+        except ValueError:
+            return False
+        side = color_index(game.side_to_move())
+        code = next((code for code in generate_legal_moves(game.board.bitboard, side) if code & 4095 == move), None)
+        if code is None:
+            return False
+        selected = Move.from_code(code, game.board)
+        game.board.make_move(selected)
+        game.switch_turn()
+        return True
+
+    def go(self, arguments: List[str]):
+        """Starts searching the current position in the background."""
+        player = self.players[self.game.side_to_move()]
+        try:
+            time_limit, max_depth, infinite = search_limits(arguments, player.color, self.options)
+        except ValueError:
+            self.send(f"info string invalid go arguments: {' '.join(arguments)}")
+            return
+        self.stop_event.clear()
+        self.search_infinite = infinite
+        player.stop_requested = False
+        self.search_thread = threading.Thread(target=self.search, args=(player, time_limit, max_depth, infinite),
+                                              daemon=True)
+        self.search_thread.start()
+
+    def search(self, player: AIPlayer, time_limit: float, max_depth: int, infinite: bool):
+        """Runs one search and reports it; the body of the search thread."""
+        start = time.perf_counter()
+        player.on_iteration = lambda stats, move: self.send(info_line(stats, move, time.perf_counter() - start))
+        try:
+            move, stats = player.choose_move(self.game, time_limit, max_depth)
+        finally:
+            player.on_iteration = None
+        if stats.source != 'search' and move is not None:
+            self.send(f"info string {stats.source} move")
+        if infinite:
+            # The GUI decides when an infinite search ends
+            self.stop_event.wait()
+        self.send(f"bestmove {move_name(move.encode()) if move is not None else '0000'}")
+
+    def stop(self):
+        """Ends the running search, if any, and waits for its bestmove."""
+        self.stop_event.set()
+        for player in self.players.values():
+            player.stop()
+        self.wait()
+
+    def finish_search(self):
+        """Lets a timed search end on its own, or stops an infinite one, before the game changes."""
+        if self.search_infinite:
+            self.stop()
+        else:
+            self.wait()
+
+    def wait(self):
+        """Blocks until the running search, if any, has sent its bestmove."""
+        if self.search_thread is not None:
+            self.search_thread.join()
+            self.search_thread = None
+
+
+def main(input_stream: TextIO = sys.stdin, output: TextIO = sys.stdout) -> int:
+    engine = UciEngine(output)
+    for line in input_stream:
+        if not engine.handle(line):
+            return 0
+    engine.stop()
+    engine.close_players()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
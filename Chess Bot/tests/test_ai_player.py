@@ -1,3 +1,5 @@
+import threading
+import time
 import unittest
 from unittest.mock import Mock, patch
 from src.players.ai_player import AIPlayer
@@ -8,6 +10,16 @@ from src.game.board import Board
 from src.game.position import Position
 from src.pieces.piece import Piece
 from src.enums.game_status import GameStatus
+from src.search.options import SearchOptions
+from src.game.movegen import generate_legal_moves
+from src.players.player import Player
+from src.game.zobrist import position_key
+from src.game.bitboard import BitBoard
+from src.game.piece_square_tables import SQUARE_VALUES
+from src.pieces.queen import Queen
+from src.pieces.pawn import Pawn
+from src.pieces.king import King
+from src.pieces.rook import Rook
 
 class TestAIPlayer(unittest.TestCase):
     def setUp(self):
@@ -17,6 +29,10 @@ class TestAIPlayer(unittest.TestCase):
         self.board = Mock(spec=Board)
         self.game.board = self.board
         self.game.game_status = GameStatus.ONGOING
+        self.game.self_check.return_value = False
+        self.board.zobrist_key = 0
+        self.board.repetitions.return_value = 0
+        self.board.bitboard = BitBoard()
 
     # Helper Methods
     def create_mock_piece(self, piece_type: str, color: Color) -> Mock:
@@ -36,8 +52,11 @@ class TestAIPlayer(unittest.TestCase):
         self.board.get_piece_at.side_effect = get_piece_at
 
     def create_mock_moves(self, count: int) -> list:
-        """Creates specified number of mock moves."""
-        return [Mock(spec=Move) for _ in range(count)]
+        """Creates specified number of mock moves with distinct quiet move encodings."""
+        moves = [Mock(spec=Move) for _ in range(count)]
+        for index, move in enumerate(moves):
+            move.encode.return_value = index
+        return moves
 
     def setup_evaluation_counter(self) -> tuple:
         """Sets up a counter for evaluation calls."""
@@ -77,13 +96,13 @@ class TestAIPlayer(unittest.TestCase):
     # Minimax Root Tests
     def test_minimax_root_no_available_moves(self):
         """Test minimax_root returns None when no moves are available."""
-        with patch.object(self.ai_player, 'get_available_moves', return_value=[]):
+        with patch.object(self.ai_player, 'search_moves', return_value=[]):
             self.assertIsNone(self.ai_player.minimax_root(3, self.game, True))
 
     def test_minimax_root_finds_best_move(self):
         """Test minimax_root selects the best move."""
         moves = self.create_mock_moves(2)
-        with patch.object(self.ai_player, 'get_available_moves', return_value=moves):
+        with patch.object(self.ai_player, 'search_moves', return_value=moves):
             with patch.object(self.ai_player, 'minimax', side_effect=[10, 5]):
                 result = self.ai_player.minimax_root(3, self.game, True)
         self.assertEqual(result, moves[0])
@@ -100,6 +119,37 @@ class TestAIPlayer(unittest.TestCase):
             result = self.ai_player.minimax(0, self.game, float('-inf'), float('inf'), True)
             self.assertEqual(result, 42)
 
+    def test_search_options_agree_on_value(self):
+        """Test PVS, null-move pruning and LMR keep the depth 4 result of plain alpha-beta on a tactic."""
+        fen = "3k4/8/1b2r3/8/4B3/2N5/3P4/4K3 w - - 0 1"
+        results = []
+        for enabled in (False, True):
+            game = Game()
+            game.load_fen(fen)
+            player = AIPlayer("AI", Color.WHITE, SearchOptions(time_limit=60, max_depth=4, pvs=enabled,
+                                                               null_move=enabled, lmr=enabled))
+            move = player.iterative_deepening(game)
+            results.append((move.encode(), player.nodes))
+        self.assertEqual(results[0][0], results[1][0])
+        self.assertLess(results[1][1], results[0][1])
+
+    def test_quiescence_avoids_defended_capture(self):
+        """Test the depth 1 search sees the recapture instead of grabbing a defended pawn."""
+        game = Game()
+        game.load_fen("4k3/8/2p5/3p4/8/8/8/3QK3 w - - 0 1")
+        move = self.ai_player.iterative_deepening(game, time_limit=60, max_depth=1)
+        self.assertNotEqual(move.to_position, Position(3, 4))
+        self.assertGreater(self.ai_player.qnodes, 0)
+
+    def test_quiescence_sees_capture_at_leaf(self):
+        """Test quiescence resolves a capture past the nominal depth."""
+        game = Game()
+        game.load_fen("4k3/8/8/3r4/8/8/8/3QK3 b - - 0 1")
+        static = self.ai_player.evaluate_position(game)
+        # Black to move at depth 0 takes the undefended queen
+        value = self.ai_player.minimax(0, game, float('-inf'), float('inf'), False)
+        self.assertLess(value, static)
+
     def test_minimax_game_not_ongoing(self):
         """Test minimax returns evaluation when game is not ongoing."""
         self.game.game_status = GameStatus.STALEMATE
@@ -110,7 +160,9 @@ class TestAIPlayer(unittest.TestCase):
     def test_minimax_maximizing_player(self):
         """Test minimax when maximizing player."""
         moves = self.create_mock_moves(2)
-        with patch.object(self.ai_player, 'get_available_moves', return_value=moves):
+        # Plain alpha-beta: a zero-window re-search would evaluate the leaves again
+        self.ai_player.options = SearchOptions(pvs=False)
+        with patch.object(self.ai_player, 'search_moves', return_value=moves):
             with patch.object(self.ai_player, 'evaluate_position', side_effect=[10, 20]):
                 result = self.ai_player.minimax(1, self.game, float('-inf'), float('inf'), True)
                 self.assertEqual(result, 20)
@@ -118,41 +170,90 @@ class TestAIPlayer(unittest.TestCase):
     def test_minimax_minimizing_player(self):
         """Test minimax when minimizing player."""
         moves = self.create_mock_moves(2)
-        with patch.object(self.ai_player, 'get_available_moves', return_value=moves):
+        # Plain alpha-beta: a zero-window re-search would evaluate the leaves again
+        self.ai_player.options = SearchOptions(pvs=False)
+        with patch.object(self.ai_player, 'search_moves', return_value=moves):
             with patch.object(self.ai_player, 'evaluate_position', side_effect=[10, 5]):
                 result = self.ai_player.minimax(1, self.game, float('-inf'), float('inf'), False)
                 self.assertEqual(result, 5)
 
     # Position Evaluation Tests
+    def create_game_with_pieces(self, pieces: list) -> Game:
+        """Creates a real game whose board holds only the given pieces."""
+        game = Game()
+        for piece in pieces:
+            game.board.squares[piece.position.x][piece.position.y].piece = piece
+        game.board.sync_bitboard()
+        return game
+
+    def square_bonus(self, piece_type: int, color: int, x: int, y: int) -> float:
+        """Returns the piece-square bonus in pawns."""
+        return SQUARE_VALUES[color][piece_type][y * 8 + x] / 100
+
     def test_evaluate_simple_position(self):
         """Test position evaluation with queen vs pawn."""
-        pieces = [
-            ((0, 0), self.create_mock_piece("Queen", Color.WHITE)),  # +9
-            ((1, 1), self.create_mock_piece("Pawn", Color.BLACK)),   # -1
-        ]
-        self.setup_board_with_pieces(pieces)
-        self.assertEqual(self.ai_player.evaluate_position(self.game), 8)
+        game = self.create_game_with_pieces([
+            Queen(Position(0, 0), Color.WHITE),   # +9
+            Pawn(Position(1, 1), Color.BLACK),    # -1
+        ])
+        expected = 8 + self.square_bonus(4, 0, 0, 0) - self.square_bonus(0, 1, 1, 1)
+        self.assertAlmostEqual(self.ai_player.evaluate_position(game), expected)
 
     def test_evaluate_position_empty_board(self):
         """Test position evaluation with empty board."""
-        self.board.get_piece_at.return_value = None
-        self.assertEqual(self.ai_player.evaluate_position(self.game), 0)
+        self.assertEqual(self.ai_player.evaluate_position(Game()), 0)
 
     def test_evaluate_position_unknown_piece(self):
         """Test evaluate_position with unknown piece type."""
-        piece = self.create_mock_piece("UnknownPiece", Color.WHITE)
-        self.board.get_piece_at.return_value = piece
-        self.assertEqual(self.ai_player.evaluate_position(self.game), 0)
+        game = Game()
+        game.board.squares[0][0].piece = self.create_mock_piece("UnknownPiece", Color.WHITE)
+        game.board.sync_bitboard()
+        self.assertEqual(self.ai_player.evaluate_position(game), 0)
 
     def test_evaluate_position_all_pieces(self):
         """Test evaluation with all piece types."""
-        pieces = [
-            ((0, 0), self.create_mock_piece("Queen", Color.WHITE)),   # +9
-            ((1, 0), self.create_mock_piece("King", Color.BLACK)),    # -100
-            ((2, 0), self.create_mock_piece("Rook", Color.WHITE)),    # +5
-        ]
-        self.setup_board_with_pieces(pieces)
-        self.assertEqual(self.ai_player.evaluate_position(self.game), -86)
+        game = self.create_game_with_pieces([
+            Queen(Position(0, 0), Color.WHITE),   # +9
+            King(Position(1, 0), Color.BLACK),    # -100
+            Rook(Position(2, 0), Color.WHITE),    # +5
+        ])
+        expected = (-86 + self.square_bonus(4, 0, 0, 0) + self.square_bonus(3, 0, 2, 0)
+                    - self.square_bonus(5, 1, 1, 0))
+        self.assertAlmostEqual(self.ai_player.evaluate_position(game), expected)
+
+    def test_evaluation_updated_incrementally(self):
+        """Test executing and undoing moves keeps the evaluation totals exact."""
+        game = Game()
+        game.board.initialize_board()
+        start = self.ai_player.evaluate_position(game)
+        self.assertEqual(start, 0)
+        pawn = game.board.get_piece_at(Position(4, 1))
+        move = Move(Position(4, 1), Position(4, 3), pawn)
+        move.execute(game.board)
+        self.assertAlmostEqual(self.ai_player.evaluate_position(game),
+                               self.square_bonus(0, 0, 4, 3) - self.square_bonus(0, 0, 4, 1))
+        move.undo(game.board)
+        self.assertEqual(self.ai_player.evaluate_position(game), start)
+
+    def test_minimax_detects_checkmate(self):
+        """Test a node with no legal moves while in check scores as mate."""
+        game = self.create_game_with_pieces([
+            King(Position(7, 7), Color.BLACK),
+            Rook(Position(0, 7), Color.WHITE),
+            Rook(Position(1, 6), Color.WHITE),
+            King(Position(0, 0), Color.WHITE),
+        ])
+        score = self.ai_player.minimax(2, game, float('-inf'), float('inf'), False)
+        self.assertEqual(score, AIPlayer.MATE_SCORE - 1)
+
+    def test_minimax_detects_stalemate(self):
+        """Test a node with no legal moves and no check scores as a draw."""
+        game = self.create_game_with_pieces([
+            King(Position(7, 7), Color.BLACK),
+            Queen(Position(5, 6), Color.WHITE),
+            King(Position(0, 0), Color.WHITE),
+        ])
+        self.assertEqual(self.ai_player.minimax(2, game, float('-inf'), float('inf'), False), 0)
 
     # Alpha-Beta Pruning Tests
     def test_alpha_beta_pruning(self):
@@ -161,7 +262,7 @@ class TestAIPlayer(unittest.TestCase):
         moves = self.create_mock_moves(4)
 
         # Test with and without pruning
-        with patch.object(self.ai_player, 'get_available_moves', return_value=moves):
+        with patch.object(self.ai_player, 'search_moves', return_value=moves):
             with patch.object(self.ai_player, 'evaluate_position', side_effect=count_evals):
                 self.ai_player.minimax(2, self.game, float('-inf'), 50, True)
         
@@ -172,12 +273,263 @@ class TestAIPlayer(unittest.TestCase):
         """Test that moves are executed and undone in correct order."""
         execution_order, mock_move = self.setup_move_tracking()
         
-        with patch.object(self.ai_player, 'get_available_moves', return_value=[mock_move]):
+        with patch.object(self.ai_player, 'search_moves', return_value=[mock_move]):
             with patch.object(self.ai_player, 'evaluate_position', return_value=0):
                 self.ai_player.minimax_root(1, self.game, True)
 
         for i in range(0, len(execution_order), 2):
             self.assertEqual(execution_order[i:i+2], ['execute', 'undo'])
 
+    # Transposition Table Tests
+    def test_transposition_table_reused_between_searches(self):
+        """Test a repeated search hits the entries stored by the first one."""
+        game = Game()
+        game.board.initialize_board()
+        game.self_check = Mock(return_value=False)
+        with patch.object(self.ai_player, 'evaluate_position', return_value=0):
+            self.ai_player.minimax_root(2, game, True)
+            hits_after_first = self.ai_player.transposition_table.hits
+            self.ai_player.minimax_root(2, game, True)
+        self.assertGreater(self.ai_player.transposition_table.hits, hits_after_first)
+        self.assertGreater(self.ai_player.transposition_table.stats()['stores'], 0)
+
+    # Iterative Deepening Tests
+    def create_started_game(self) -> Game:
+        """Creates a real game in the starting position with the AI to move."""
+        game = Game()
+        game.board.initialize_board()
+        game.self_check = Mock(return_value=False)
+        return game
+
+    def test_iterative_deepening_stops_at_max_depth(self):
+        """Test iterative deepening completes every depth up to max_depth."""
+        game = self.create_started_game()
+        with patch.object(self.ai_player, 'evaluate_position', return_value=0):
+            move = self.ai_player.iterative_deepening(game, time_limit=60, max_depth=2)
+        self.assertIsInstance(move, Move)
+        self.assertEqual(self.ai_player.completed_depth, 2)
+
+    def test_iterative_deepening_respects_time_budget(self):
+        """Test an exhausted budget still returns a move and restores the board."""
+        game = self.create_started_game()
+        key = game.board.zobrist_key
+        with patch('src.players.ai_player.time.perf_counter', side_effect=[0.0] + [10.0] * 1000):
+            with patch.object(self.ai_player, 'evaluate_position', return_value=0):
+                move = self.ai_player.iterative_deepening(game, time_limit=1, max_depth=5)
+        self.assertIsInstance(move, Move)
+        self.assertEqual(self.ai_player.completed_depth, 0)
+        self.assertEqual(game.board.zobrist_key, key)
+        self.assertIsNone(self.ai_player.deadline)
+
+    def test_iterative_deepening_counts_nodes(self):
+        """Test the node counter is reset per search and counts visited nodes."""
+        game = self.create_started_game()
+        with patch.object(self.ai_player, 'evaluate_position', return_value=0):
+            self.ai_player.iterative_deepening(game, time_limit=60, max_depth=1)
+            self.assertEqual(self.ai_player.nodes, 21)
+            self.ai_player.iterative_deepening(game, time_limit=60, max_depth=1)
+            self.assertEqual(self.ai_player.nodes, 21)
+
+    def test_horizon_nodes_counted_once(self):
+        """Test nodes and qnodes together count each position a depth 1 search visits once."""
+        game = Game()
+        game.load_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+        execute = Move.execute
+        with patch.object(Move, 'execute', autospec=True, side_effect=execute) as executed:
+            self.ai_player.iterative_deepening(game, time_limit=60, max_depth=1)
+        self.assertGreater(self.ai_player.qnodes, 0)
+        # The root and the position after every move made
+        self.assertEqual(self.ai_player.nodes + self.ai_player.qnodes, 1 + executed.call_count)
+
+    def test_mate_scores_adjusted_across_plies(self):
+        """Test a mate found at one ply is reported with the right distance when the TT hits at another."""
+        game = Game()
+        game.load_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+        far = self.ai_player.negamax(2, game, float('-inf'), float('inf'), 0, 5)
+        self.assertEqual(far, AIPlayer.MATE_SCORE - 6)
+        hits = self.ai_player.transposition_table.hits
+        near = self.ai_player.negamax(2, game, float('-inf'), float('inf'), 0, 1)
+        self.assertGreater(self.ai_player.transposition_table.hits, hits)
+        self.assertEqual(near, AIPlayer.MATE_SCORE - 2)
+        self.assertEqual(self.ai_player.score_from_table(self.ai_player.score_to_table(-far, 5), 3), -far - 2)
+        self.assertEqual(self.ai_player.score_to_table(1.5, 5), 1.5)
+
+    def test_search_options_validation(self):
+        """Test invalid search limits are rejected."""
+        with self.assertRaises(ValueError):
+            SearchOptions(time_limit=0)
+        with self.assertRaises(ValueError):
+            SearchOptions(max_depth=0)
+        with self.assertRaises(ValueError):
+            SearchOptions(workers=0)
+
+    def test_worker_keeps_search_options(self):
+        """Test parallel workers search with the parent's options, less the book and nested workers."""
+        from src.players import ai_player
+        options = SearchOptions(time_limit=3, max_depth=4, lmr=False, workers=2, tablebase_dir=None, ponder=True)
+        ai_player._init_worker(Color.WHITE, options)
+        worker_options = ai_player._worker_player.options
+        self.assertEqual((worker_options.time_limit, worker_options.max_depth, worker_options.lmr), (3, 4, False))
+        self.assertEqual((worker_options.book, worker_options.workers, worker_options.ponder), (False, 1, False))
+        self.assertEqual((options.book, options.workers), (True, 2))
+
+    def test_worker_deadline_from_budget(self):
+        """Test a root move task measures its time budget on the worker's own clock."""
+        from src.players import ai_player
+        ai_player._init_worker(Color.WHITE, SearchOptions(book=False))
+        game = Game()
+        game.load_fen("3k4/8/1b2r3/8/4B3/2N5/3P4/4K3 w - - 0 1")
+        packed = game.board.pack(Color.WHITE)
+        code = generate_legal_moves(game.board.bitboard, 0)[0]
+        score, _ = ai_player._search_root_move(packed, [], code, 1, 60)
+        self.assertIsNotNone(score)
+        self.assertIsNone(ai_player._search_root_move(packed, [], code, 1, 0)[0])
+        self.assertIsNone(ai_player._worker_player.deadline)
+
+    def test_parallel_root_matches_serial_search(self):
+        """Test the process pool picks the same move and score as the serial search."""
+        fen = "3k4/8/1b2r3/8/4B3/2N5/3P4/4K3 w - - 0 1"
+        results = []
+        for workers in (1, 2):
+            game = Game()
+            game.load_fen(fen)
+            player = AIPlayer("AI", Color.WHITE, SearchOptions(time_limit=60, max_depth=3, workers=workers))
+            try:
+                move = player.iterative_deepening(game)
+            finally:
+                player.close()
+            key = position_key(game.board.zobrist_key, 0)
+            results.append((move.encode(), player.transposition_table.probe(key).value))
+            self.assertEqual(player.completed_depth, 3)
+        self.assertEqual(results[0], results[1])
+
+    def test_stop_aborts_parallel_workers(self):
+        """Test stop() ends a parallel search without waiting for the iteration, and the pool stays usable."""
+        game = Game()
+        game.load_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+        player = AIPlayer("AI", Color.WHITE, SearchOptions(time_limit=60, max_depth=32, workers=2, book=False))
+        self.addCleanup(player.close)
+        started = threading.Event()
+        player.on_iteration = lambda stats, move: started.set()
+        thread = threading.Thread(target=player.iterative_deepening, args=(game, float('inf')))
+        thread.start()
+        self.assertTrue(started.wait(60))
+        stopped = time.perf_counter()
+        player.stop()
+        thread.join(60)
+        self.assertLess(time.perf_counter() - stopped, 0.5)
+        self.assertGreaterEqual(player.completed_depth, 1)
+        player.stop_requested = False
+        player.on_iteration = None
+        player.iterative_deepening(game, max_depth=1)
+        self.assertEqual(player.completed_depth, 1)
+
+    def test_repetition_scored_as_draw(self):
+        """Test the search scores a position repeated since the last irreversible move as 0."""
+        game = Game()
+        game.load_fen("4k1n1/8/8/8/8/8/8/3QK1N1 w - - 0 1")
+        board = game.board
+        self.assertGreater(self.ai_player.negamax(2, game, float('-inf'), float('inf'), 0, 4), 5)
+        for from_position, to_position in [(Position(6, 0), Position(5, 2)), (Position(6, 7), Position(5, 5)),
+                                           (Position(5, 2), Position(6, 0)), (Position(5, 5), Position(6, 7))]:
+            board.make_move(Move(from_position, to_position, board.get_piece_at(from_position)))
+        self.ai_player.transposition_table.clear()
+        self.assertEqual(self.ai_player.negamax(2, game, float('-inf'), float('inf'), 0, 4), 0)
+        # One ply earlier, black saves itself by repeating
+        board.unmake_move()
+        self.assertEqual(self.ai_player.negamax(2, game, float('-inf'), float('inf'), 1, 3), 0)
+
+    def play_shuffle(self, game: Game, moves: list):
+        """Plays (from, to) position pairs on a real game's board."""
+        for from_position, to_position in moves:
+            game.board.make_move(Move(from_position, to_position, game.board.get_piece_at(from_position)))
+
+    def test_parallel_root_sees_repetitions(self):
+        """Test worker processes score a repetition of a position before the root as a draw, like the serial search."""
+        results = []
+        for workers in (1, 2):
+            game = Game()
+            game.load_fen("k7/8/8/8/8/8/q7/6RK w - - 0 1")
+            self.play_shuffle(game, [(Position(6, 0), Position(6, 1)), (Position(0, 7), Position(1, 7)),
+                                     (Position(6, 1), Position(6, 0)), (Position(1, 7), Position(0, 7))])
+            player = AIPlayer("AI", Color.WHITE, SearchOptions(time_limit=60, max_depth=3, workers=workers,
+                                                               book=False))
+            try:
+                move = player.iterative_deepening(game)
+            finally:
+                player.close()
+            results.append((move.encode(), player.stats.score))
+        self.assertEqual(results[0][1], 0)
+        self.assertEqual(results[0], results[1])
+
+    # Pondering Tests
+    def create_pondering_game(self, replies: list) -> tuple:
+        """Sets up the AI as white with pondering against a player that plays the given replies.
+
+        A reply of None plays the move the AI predicted.
+        """
+        player = AIPlayer("AI", Color.WHITE, SearchOptions(time_limit=0.01, max_depth=2, book=False, ponder=True))
+        player.verbose = False
+        game = Game()
+        game.verbose = False
+
+        class ScriptedPlayer(Player):
+            def make_move(self, game):
+                reply = replies.pop(0)
+                code = player.ponder_move if reply is None else reply
+                player.ponder_thread.join()
+                return Move.from_code(code, game.board)
+
+        game.setup_players(player, ScriptedPlayer("Opponent", Color.BLACK))
+        game.load_fen("3k4/8/1b2r3/8/4B3/2N5/3P4/4K3 w - - 0 1")
+        self.addCleanup(player.close)
+        return player, game
+
+    def test_ponder_hit_answers_from_ponder_search(self):
+        """Test the predicted reply is answered with the move found while pondering."""
+        player, game = self.create_pondering_game([None])
+        game.play_turn()
+        self.assertIsNotNone(player.ponder_thread)
+        game.play_turn()
+        move, stats = player.choose_move(game)
+        self.assertEqual(stats.source, 'ponder')
+        self.assertEqual(stats.depth, 2)
+        self.assertIn(move.encode(), generate_legal_moves(game.board.bitboard, 0))
+
+    def test_ponder_miss_searches(self):
+        """Test another reply than the predicted one is searched normally."""
+        player, game = self.create_pondering_game([])
+        game.play_turn()
+        player.ponder_thread.join()
+        other = next(code for code in generate_legal_moves(game.board.bitboard, 1) if code != player.ponder_move)
+        game.current_player.make_move = lambda game: Move.from_code(other, game.board)
+        game.play_turn()
+        move, stats = player.choose_move(game)
+        self.assertEqual(stats.source, 'search')
+        self.assertIn(move.encode(), generate_legal_moves(game.board.bitboard, 0))
+
+    def test_ponder_game_keeps_repetition_history(self):
+        """Test the pondered position carries the game's positions since the last irreversible move."""
+        player, game = self.create_pondering_game([])
+        self.play_shuffle(game, [(Position(4, 0), Position(5, 0)), (Position(3, 7), Position(2, 7))])
+        with patch.object(player, '_ponder') as ponder:
+            player.start_pondering(game)
+            player.ponder_thread.join()
+        ponder_board = ponder.call_args[0][0].board
+        self.assertEqual(len(game.board.repetition_history()), 2)
+        self.assertEqual(ponder_board.prior_keys, game.board.repetition_history())
+
+    def test_close_stops_pondering(self):
+        """Test close ends an unbounded ponder search and leaves the board untouched."""
+        player, game = self.create_pondering_game([])
+        player.options.max_depth = 50
+        key = game.board.zobrist_key
+        player.start_pondering(game)
+        self.assertTrue(player.ponder_thread.is_alive())
+        player.close()
+        self.assertIsNone(player.ponder_thread)
+        self.assertFalse(player.stop_requested)
+        self.assertEqual(game.board.zobrist_key, key)
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from src.tools.alloc_bench import instance_sizes, main, measure
+
+
+class TestAllocBench(unittest.TestCase):
+
+    def test_slotted_instances_are_smaller(self):
+        sizes = instance_sizes()
+        self.assertLess(sizes['Position'], sizes['Position (dict)'])
+        self.assertLess(sizes['Move'], sizes['Move (dict)'])
+
+    def test_measure_counts_retained_objects(self):
+        result = measure(lambda: [object() for _ in range(10)], 3)
+        self.assertEqual(result['calls'], 3)
+        self.assertEqual(result['items'], 10)
+        self.assertEqual(result['objects_per_item'], 0)
+        result = measure(lambda: [[] for _ in range(10)], 3)
+        self.assertEqual(result['objects_per_item'], 1)
+
+    def test_main_reports_workloads(self):
+        with patch('sys.stdout', new_callable=StringIO) as output:
+            self.assertEqual(main(['--fen', '6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1', '--repeat', '1', '--depth', '1']), 0)
+        self.assertIn('available_moves: 1 calls', output.getvalue())
+        self.assertIn('search depth 1', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import unittest
+from io import StringIO
+from src.search.options import SearchOptions
+from src.tools.analysis_server import Analyzer, serve
+
+MATE_IN_ONE = "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+
+class TestAnalysisServer(unittest.TestCase):
+
+    def run_server(self, requests: list, workers: int = 1, queue_size: int = 4) -> tuple:
+        """Serves the requests, one JSON line each, and returns (responses by id, summary)."""
+        output = StringIO()
+        lines = [request if isinstance(request, str) else json.dumps(request) for request in requests]
+        summary = serve(StringIO('\n'.join(lines) + '\n'), output,
+                        SearchOptions(time_limit=5, max_depth=2, book=False), workers, queue_size)
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        return {response['id']: response for response in responses}, summary
+
+    def test_answers_requests_with_latency(self):
+        responses, summary = self.run_server([
+            {'id': 'mate', 'fen': MATE_IN_ONE},
+            {'id': 'opening', 'moves': ['e2e4', 'e7e5'], 'max_depth': 1},
+        ])
+        self.assertEqual(responses['mate']['move'], 'a1a8')
+        self.assertEqual(responses['opening']['depth'], 1)
+        for response in responses.values():
+            self.assertGreaterEqual(response['latency_seconds'], response['search_seconds'])
+            self.assertGreaterEqual(response['queue_seconds'], 0)
+        self.assertEqual(summary['requests'], 2)
+        self.assertEqual(summary['errors'], 0)
+
+    def test_invalid_requests_are_answered_with_errors(self):
+        responses, summary = self.run_server([
+            'not json',
+            {'id': 1, 'moves': ['e2e5']},
+            {'id': 2, 'fen': 'bad'},
+            {'id': 3, 'time_limit': 0},
+            {'id': 4, 'command': 'restart'},
+            {'id': 5, 'max_depth': 1},
+        ])
+        self.assertIn('Invalid request', responses[None]['error'])
+        self.assertEqual(responses[1]['error'], "Illegal move e2e5")
+        for request_id in (2, 3, 4):
+            self.assertIn('error', responses[request_id])
+        self.assertNotIn('error', responses[5])
+        self.assertEqual(summary['errors'], 5)
+
+    def test_queue_bound_and_quit(self):
+        responses, summary = self.run_server([{'id': index, 'max_depth': 1} for index in range(5)]
+                                             + [{'command': 'quit'}, {'id': 'late'}], queue_size=1)
+        self.assertEqual(sorted(responses, key=str), [0, 1, 2, 3, 4])
+        self.assertEqual(summary['queued'], 0)
+
+    def test_worker_processes(self):
+        responses, summary = self.run_server([{'id': index, 'fen': MATE_IN_ONE} for index in range(3)], workers=2)
+        self.assertEqual({response['move'] for response in responses.values()}, {'a1a8'})
+        self.assertEqual(summary['requests'], 3)
+
+    def test_transposition_table_stays_warm(self):
+        analyzer = Analyzer(SearchOptions(time_limit=5, max_depth=3, book=False))
+        first = analyzer.analyze({'moves': ['e2e4']}, 0)
+        second = analyzer.analyze({'moves': ['e2e4']}, 0)
+        self.assertGreater(second['stats']['tt']['hit_rate'], first['stats']['tt']['hit_rate'])
+        self.assertLess(second['stats']['nodes'], first['stats']['nodes'])
+
+
+if __name__ == '__main__':
+    unittest.main()
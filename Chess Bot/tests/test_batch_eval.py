@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from src.game.board import Board
+from src.game.fen import STARTING_FEN
+from src.search import batch_eval
+from src.tools.evaluate_positions import evaluate_one_by_one, main
+
+FENS = [
+    STARTING_FEN,
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w - - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R b - - 0 1",
+    "3k4/8/1b2r3/8/4B3/2N5/3P4/4K3 b - - 0 1",
+    "8/8/8/8/8/8/8/8 w - - 0 1",
+]
+
+
+@unittest.skipUnless(batch_eval.np is not None, "NumPy is not installed")
+class TestBatchEval(unittest.TestCase):
+
+    def test_matches_single_position_evaluation(self):
+        scores = batch_eval.evaluate_fens(FENS)
+        for score, expected in zip(scores, evaluate_one_by_one(FENS)):
+            self.assertAlmostEqual(score, expected)
+
+    def test_white_point_of_view_without_sides(self):
+        boards, sides = batch_eval.load_fens(FENS[1:3])
+        self.assertEqual(boards.shape, (2, 64))
+        self.assertEqual(list(sides), [0, 1])
+        white, black = batch_eval.evaluate_batch(boards)
+        self.assertEqual(white, black)
+        self.assertEqual(list(batch_eval.evaluate_batch(boards, sides)), [white, -white])
+
+    def test_encode_bitboard_matches_fen_loader(self):
+        board = Board()
+        board.load_fen(FENS[1])
+        boards, _ = batch_eval.load_fens(FENS[1:2])
+        self.assertEqual(list(batch_eval.encode_bitboard(board.bitboard)), list(boards[0]))
+
+    def test_rejects_wrong_shape(self):
+        with self.assertRaises(ValueError):
+            batch_eval.evaluate_batch(batch_eval.np.zeros((2, 63), dtype=batch_eval.np.int8))
+
+    def test_main_compares_with_single_evaluation(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'positions.txt')
+            with open(path, 'w') as file:
+                file.write('\n'.join(FENS) + '\n')
+            with patch('sys.stdout', new_callable=StringIO) as output:
+                self.assertEqual(main([path, '--compare', '--quiet']), 0)
+        self.assertIn('5 positions', output.getvalue())
+        self.assertIn('largest difference 0.000000', output.getvalue())
+
+
+class TestWithoutNumpy(unittest.TestCase):
+
+    def test_missing_numpy_is_reported(self):
+        with patch.object(batch_eval, 'np', None):
+            with self.assertRaises(ImportError):
+                batch_eval.load_fens(FENS)
+            with patch('sys.stderr', new_callable=StringIO) as errors:
+                self.assertEqual(main(['--quiet']), 1)
+        self.assertIn('pip install numpy', errors.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from src.game.bitboard import (BitBoard, PAWN, KNIGHT, KING, WHITE, BLACK,
+                               iter_bits, square_index, square_position)
+from src.game.board import Board
+from src.game.move import Move
+from src.game.position import Position
+from src.enums.color import Color
+
+
+class TestBitBoard(unittest.TestCase):
+
+    def test_square_index_round_trip(self):
+        for x in range(8):
+            for y in range(8):
+                self.assertEqual(square_position(square_index(x, y)), Position(x, y))
+
+    def test_iter_bits_lowest_first(self):
+        self.assertEqual(list(iter_bits((1 << 3) | (1 << 40) | 1)), [0, 3, 40])
+
+    def test_add_move_remove_piece(self):
+        bitboard = BitBoard()
+        bitboard.add_piece(WHITE, KNIGHT, 1)
+        self.assertEqual(bitboard.piece_at(1), (WHITE, KNIGHT))
+
+        bitboard.move_piece(WHITE, KNIGHT, 1, 18)
+        self.assertIsNone(bitboard.piece_at(1))
+        self.assertEqual(bitboard.piece_at(18), (WHITE, KNIGHT))
+        self.assertEqual(bitboard.occupied, 1 << 18)
+
+        bitboard.remove_piece(WHITE, KNIGHT, 18)
+        self.assertEqual(bitboard.occupied, 0)
+
+    def test_king_square_missing_king(self):
+        self.assertEqual(BitBoard().king_square(BLACK), -1)
+
+
+class TestBoardBitBoardSync(unittest.TestCase):
+
+    def setUp(self):
+        self.board = Board()
+        self.board.initialize_board()
+
+    def test_initial_counts(self):
+        bitboard = self.board.bitboard
+        self.assertEqual(bitboard.count(WHITE, PAWN), 8)
+        self.assertEqual(bitboard.count(BLACK, PAWN), 8)
+        self.assertEqual(bitboard.count(WHITE, KING), 1)
+        self.assertEqual(bitboard.king_square(WHITE), square_index(4, 0))
+        self.assertEqual(bitboard.king_square(BLACK), square_index(4, 7))
+        self.assertEqual(bitboard.occupied.bit_count(), 32)
+
+    def test_execute_and_undo_capture_keeps_bitboards_in_sync(self):
+        pawn = self.board.get_piece_at(Position(4, 1))
+        target = self.board.get_piece_at(Position(3, 6))
+        move = Move(Position(4, 1), Position(3, 6), pawn, target)
+
+        move.execute(self.board)
+        self.assertEqual(self.board.bitboard.piece_at(square_index(3, 6)), (WHITE, PAWN))
+        self.assertEqual(self.board.bitboard.count(BLACK, PAWN), 7)
+        self.assertEqual(self.board.get_captured_pieces(Color.BLACK), ['♟'])
+
+        move.undo(self.board)
+        self.assertEqual(self.board.bitboard.piece_at(square_index(3, 6)), (BLACK, PAWN))
+        self.assertEqual(self.board.bitboard.piece_at(square_index(4, 1)), (WHITE, PAWN))
+        self.assertEqual(self.board.get_captured_pieces(Color.BLACK), [])
+
+    def test_king_lookup_after_king_move(self):
+        king = self.board.get_piece_at(Position(4, 0))
+        self.board.squares[4][1].remove_piece()
+        self.board.sync_bitboard()
+        Move(Position(4, 0), Position(4, 1), king).execute(self.board)
+        self.assertEqual(self.board.find_kings_position(Color.WHITE), Position(4, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import patch, MagicMock
 from src.game.board import Board
 from src.game.position import Position
+from src.game.move import Move
+from src.game.zobrist import compute_key
 from src.enums.color import Color
 from src.pieces.piece import Piece
 from src.pieces.bishop import Bishop
@@ -90,10 +92,98 @@ class test_board(unittest.TestCase):
         board = Board()
         piece = board.get_piece_at(Position(5,5))
         self.assertEqual(None, piece)
-        
-    
-        
-        
 
+    def test_attacked_squares_cached_until_move(self):
+        board = Board()
+        board.initialize_board()
+        self.assertFalse(board.is_attacked(Position(4, 2), Color.BLACK))
+        self.assertIsNotNone(board.attack_maps[1])
+        pawn = board.get_piece_at(Position(3, 6))
+        board.make_move(Move(Position(3, 6), Position(3, 4), pawn))
+        self.assertEqual(board.attack_maps, [None, None])
+        board.make_move(Move(Position(3, 4), Position(3, 3), pawn))
+        self.assertTrue(board.is_attacked(Position(4, 2), Color.BLACK))
+        board.unmake_move()
+        self.assertFalse(board.is_attacked(Position(4, 2), Color.BLACK))
+
+    def test_piece_lists_follow_moves(self):
+        board = Board()
+        board.load_fen("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1")
+        black_pieces = board.get_pieces(Color.BLACK)
+        pawn = board.get_piece_at(Position(4, 3))
+        king = board.get_piece_at(Position(4, 0))
+        board.make_move(Move(Position(4, 3), Position(3, 4), pawn, board.get_piece_at(Position(3, 4))))
+        board.make_move(Move(Position(4, 0), Position(3, 1), king))
+        self.assertEqual(len(board.get_pieces(Color.BLACK)), 1)
+        self.assertEqual(board.find_kings_position(Color.WHITE), Position(3, 1))
+        board.unmake_move()
+        board.unmake_move()
+        self.assertEqual(board.get_pieces(Color.BLACK), black_pieces)
+        self.assertEqual(board.find_kings_position(Color.WHITE), Position(4, 0))
+
+    def test_halfmove_clock_and_repetitions(self):
+        board = Board()
+        board.load_fen("4k3/8/8/8/8/8/4P3/4K1N1 w - - 0 1")
+        knight = board.get_piece_at(Position(6, 0))
+        king = board.get_piece_at(Position(4, 7))
+        board.make_move(Move(Position(4, 1), Position(4, 2), board.get_piece_at(Position(4, 1))))
+        self.assertEqual(board.halfmove_clock(), 0)
+        board.make_move(Move(Position(4, 7), Position(3, 7), king))
+        board.make_move(Move(Position(6, 0), Position(5, 2), knight))
+        board.make_move(Move(Position(3, 7), Position(4, 7), king))
+        board.make_move(Move(Position(5, 2), Position(6, 0), knight))
+        self.assertEqual(board.halfmove_clock(), 4)
+        # Back to the position right after the pawn move, which the walk reaches but does not pass
+        self.assertEqual(board.repetitions(1), 1)
+        self.assertEqual(board.repetitions(0), 0)
+        board.make_move(Move(Position(4, 7), Position(3, 7), king))
+        self.assertEqual(board.repetitions(0), 1)
+        self.assertEqual(board.repetitions(1), 0)
+
+    def test_out_of_order_undo_keeps_state_consistent(self):
+        board = Board()
+        board.initialize_board()
+        knight = board.get_piece_at(Position(6, 0))
+        board.make_move(Move(Position(6, 0), Position(5, 2), knight))
+        board.make_move(Move(Position(1, 7), Position(2, 5), board.get_piece_at(Position(1, 7))))
+        board.make_move(Move(Position(5, 2), Position(4, 4), knight))
+        capture = Move(Position(2, 5), Position(4, 4), board.get_piece_at(Position(2, 5)),
+                       board.get_piece_at(Position(4, 4)))
+        board.make_move(capture)
+        board.make_move(Move(Position(4, 1), Position(4, 3), board.get_piece_at(Position(4, 1))))
+        board.make_move(Move(Position(3, 6), Position(3, 4), board.get_piece_at(Position(3, 6))))
+        # Take back the capture while the pawn moves after it stay on the board
+        capture.undo(board)
+        self.assertEqual(board.zobrist_key, compute_key(board.bitboard))
+        self.assertEqual(len(board.get_pieces(Color.WHITE)), 16)
+        self.assertIn(capture.piece_captured, board.get_pieces(Color.WHITE))
 
+    def test_undo_of_an_earlier_independent_move(self):
+        board = Board()
+        board.initialize_board()
+        white_knight = Move(Position(6, 0), Position(5, 2), board.get_piece_at(Position(6, 0)))
+        board.make_move(white_knight)
+        board.make_move(Move(Position(1, 7), Position(2, 5), board.get_piece_at(Position(1, 7))))
+        white_knight.undo(board)
+        self.assertEqual(board.zobrist_key, compute_key(board.bitboard))
+        self.assertEqual(len(board.undo_stack), 1)
 
+    def test_prior_keys_extend_the_history(self):
+        board = Board()
+        board.load_fen("4k3/8/8/8/8/8/8/4K1N1 w - - 0 1")
+        knight = board.get_piece_at(Position(6, 0))
+        start = board.zobrist_key
+        board.make_move(Move(Position(6, 0), Position(5, 2), knight))
+        history = board.repetition_history()
+        self.assertEqual(history, [(start, 0)])
+        copy = Board()
+        copy.load_packed(board.pack(Color.BLACK))
+        copy.prior_keys = history
+        copy.make_move(Move(Position(4, 7), Position(3, 7), copy.get_piece_at(Position(4, 7))))
+        copy.make_move(Move(Position(5, 2), Position(6, 0), copy.get_piece_at(Position(5, 2))))
+        copy.make_move(Move(Position(3, 7), Position(4, 7), copy.get_piece_at(Position(3, 7))))
+        self.assertEqual(copy.repetitions(0), 1)
+        self.assertEqual(copy.halfmove_clock(), 4)
+        self.assertEqual(len(copy.repetition_history()), 4)
+        copy.load_packed(board.pack(Color.BLACK))
+        self.assertEqual(copy.prior_keys, [])
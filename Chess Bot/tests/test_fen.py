@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import MagicMock
+from src.game.board import Board
+from src.game.fen import STARTING_FEN
+from src.game.game import Game
+from src.game.packed import PACKED_SIZE
+from src.game.position import Position
+from src.enums.color import Color
+from src.pieces.king import King
+from src.pieces.pawn import Pawn
+from src.players.player import Player
+
+POSITIONS = [
+    STARTING_FEN,
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R b - - 0 1",
+    "8/8/8/8/8/8/8/8 w - - 0 1",
+]
+
+
+class TestFen(unittest.TestCase):
+
+    def test_starting_fen_matches_initialize_board(self):
+        board = Board()
+        self.assertEqual(board.load_fen(STARTING_FEN), Color.WHITE)
+        expected = Board()
+        expected.initialize_board()
+        self.assertEqual(board.bitboard.pieces, expected.bitboard.pieces)
+        self.assertEqual(board.zobrist_key, expected.zobrist_key)
+        self.assertEqual(expected.to_fen(), STARTING_FEN)
+
+    def test_load_position(self):
+        board = Board()
+        board.initialize_board()
+        color = board.load_fen("4k3/8/8/8/3P4/8/8/4K3 b - - 0 1")
+        self.assertEqual(color, Color.BLACK)
+        self.assertIsInstance(board.get_piece_at(Position(4, 7)), King)
+        pawn = board.get_piece_at(Position(3, 3))
+        self.assertIsInstance(pawn, Pawn)
+        self.assertTrue(pawn.has_moved)
+        self.assertIsNone(board.get_piece_at(Position(0, 0)))
+        self.assertEqual(board.bitboard.occupied.bit_count(), 3)
+
+    def test_fen_round_trip(self):
+        for fen in POSITIONS:
+            board = Board()
+            color = board.load_fen(fen)
+            self.assertEqual(board.to_fen(color), fen)
+
+    def test_invalid_fen(self):
+        for fen in ["", "8/8/8 w - - 0 1", "9/8/8/8/8/8/8/8 w", "4x3/8/8/8/8/8/8/8 w", "8/8/8/8/8/8/8/8 x"]:
+            with self.assertRaises(ValueError):
+                Board().load_fen(fen)
+
+
+class TestPackedPosition(unittest.TestCase):
+
+    def test_pack_round_trip(self):
+        for fen in POSITIONS:
+            board = Board()
+            color = board.load_fen(fen)
+            data = board.pack(color)
+            self.assertEqual(len(data), PACKED_SIZE)
+            restored = Board()
+            self.assertEqual(restored.load_packed(data), color)
+            self.assertEqual(restored.to_fen(color), fen)
+            self.assertEqual(restored.zobrist_key, board.zobrist_key)
+
+    def test_invalid_packed_data(self):
+        with self.assertRaises(ValueError):
+            Board().load_packed(b'\x00' * 10)
+        with self.assertRaises(ValueError):
+            Board().load_packed(b'\x01' + b'\x00' * 7 + b'\x07' + b'\x00' * 16)
+
+    def test_too_many_pieces(self):
+        board = Board()
+        board.load_fen("pppppppp/pppppppp/pppppppp/pppppppp/pppppppp/8/8/8 w - - 0 1")
+        with self.assertRaises(ValueError):
+            board.pack()
+
+
+class TestGamePosition(unittest.TestCase):
+
+    def test_load_fen_sets_current_player(self):
+        white = MagicMock(spec=Player)
+        white.color = Color.WHITE
+        black = MagicMock(spec=Player)
+        black.color = Color.BLACK
+        game = Game()
+        game.start_game(white, black)
+        fen = "4k3/8/8/8/3P4/8/8/4K3 b - - 0 1"
+        game.load_fen(fen)
+        self.assertIs(game.current_player, black)
+        self.assertEqual(game.to_fen(), fen)
+
+        snapshot = game.pack()
+        game.load_fen(STARTING_FEN)
+        self.assertIs(game.current_player, white)
+        game.load_packed(snapshot)
+        self.assertIs(game.current_player, black)
+        self.assertEqual(game.to_fen(), fen)
+
+
+if __name__ == '__main__':
+    unittest.main()
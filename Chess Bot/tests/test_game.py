@@ -7,6 +7,7 @@ from src.game.position import Position
 from src.enums.color import Color
 from src.game.move import Move
 from src.pieces.king import King
+from src.pieces.rook import Rook
 from src.players.player import Player
 from src.pieces.piece import Piece
 from src.players.human_player import HumanPlayer
@@ -55,85 +56,79 @@ class test_game(unittest.TestCase):
         game.switch_turn()
         self.assertEqual(game.current_player, player1)
 
-    @patch('src.game.game.Game.get_valid_moves')
-    @patch('src.game.board.Board.find_kings_position')
-    @patch('src.players.player.Player')
-    def test_is_check(self, mock_player, mock_find_king, mock_get_moves):
-        player1 = mock_player
-        player1.color = Color.WHITE
-        enemy_king_position = Position(4,4)
-        
-        mock_get_moves.return_value = [Position(4,4), Position(5,5)]
-        
-        mock_find_king.return_value = enemy_king_position
-        game = Game()
-        game.current_player = player1
+    def test_is_check(self):
+        game = self.create_game_with_pieces([
+            King(Position(0, 0), Color.WHITE),
+            Rook(Position(4, 0), Color.WHITE),
+            King(Position(4, 4), Color.BLACK),
+        ])
         result = game.is_check()
         
         self.assertTrue(result)
         
-    @patch('src.game.game.Game.get_valid_moves')
-    @patch('src.game.board.Board.find_kings_position')
-    @patch('src.players.player.Player')
-    def test_is_not_check(self, mock_player, mock_find_king, mock_get_moves):
-        player1 = mock_player
-        player1.color = Color.WHITE
-        enemy_king_position = Position(4,4)
-        
-        mock_get_moves.return_value = [Position(5,5), Position(6,6)]
-        
-        mock_find_king.return_value = enemy_king_position
-        
-        game = Game()
-        game.current_player = player1
+    def test_is_not_check(self):
+        game = self.create_game_with_pieces([
+            King(Position(0, 0), Color.WHITE),
+            Rook(Position(5, 0), Color.WHITE),
+            King(Position(4, 4), Color.BLACK),
+        ])
         result = game.is_check()
         self.assertFalse(result)
-        
-    @patch('src.game.game.Game.get_valid_moves')
-    @patch('src.game.board.Board.find_kings_position')
-    @patch('src.players.player.Player')
-    @patch('src.game.board.Board.get_piece_at')
-    def test_is_checkmate(self, mock_get_piece_at, mock_player, mock_find_king, mock_get_moves):
-        player1 = mock_player
-        player1.color = Color.WHITE
-        enemy_king_position = Position(0,7)
-        
-        mock_enemy_king = MagicMock(spec=King)
-        mock_enemy_king.get_valid_moves.return_value = [Position(1,7), Position(0,6), Position(1,6)]
-        mock_get_piece_at.return_value = mock_enemy_king
-        
-        
-        mock_get_moves.return_value = [Position(0,7), Position(1,7), Position(0,6), Position(1,6)]
-        
-        mock_find_king.return_value = enemy_king_position
-        
+
+    def test_self_check(self):
+        game = self.create_game_with_pieces([
+            King(Position(4, 0), Color.WHITE),
+            Rook(Position(4, 7), Color.BLACK),
+            King(Position(0, 7), Color.BLACK),
+        ])
+        self.assertTrue(game.self_check())
+        game.board.make_move(Move(Position(4, 0), Position(3, 0), game.board.get_piece_at(Position(4, 0))))
+        self.assertFalse(game.self_check())
+        game.board.unmake_move()
+        self.assertTrue(game.self_check())
+        
+    def create_game_with_pieces(self, pieces) -> Game:
+        """Creates a game whose board holds only the given pieces, white to move."""
         game = Game()
+        for piece in pieces:
+            game.board.squares[piece.position.x][piece.position.y].piece = piece
+        game.board.sync_bitboard()
+        player1 = MagicMock(spec=Player)
+        player1.color = Color.WHITE
         game.current_player = player1
+        return game
+
+    def test_is_checkmate(self):
+        game = self.create_game_with_pieces([
+            King(Position(0, 7), Color.WHITE),
+            Rook(Position(7, 7), Color.BLACK),
+            Rook(Position(6, 6), Color.BLACK),
+            King(Position(7, 0), Color.BLACK),
+        ])
         result = game.is_checkmate()
         self.assertTrue(result)
+        self.assertEqual(game.game_status, GameStatus.CHECKMATE)
 
-    @patch('src.game.game.Game.get_valid_moves')
-    @patch('src.game.board.Board.find_kings_position')
-    @patch('src.players.player.Player')
-    @patch('src.game.board.Board.get_piece_at')
-    def test_not_checkmate(self, mock_get_piece_at, mock_player, mock_find_king, mock_get_moves):
-        player1 = mock_player
-        player1.color = Color.WHITE
-        enemy_king_position = Position(0,7)
-        
-        mock_enemy_king = MagicMock(spec=King)
-        mock_enemy_king.get_valid_moves.return_value = [Position(1,7), Position(0,6), Position(1,6)]
-        mock_get_piece_at.return_value = mock_enemy_king
-        
-        
-        mock_get_moves.return_value = [Position(0,7), Position(2,7), Position(0,6), Position(1,6)]
-        
-        mock_find_king.return_value = enemy_king_position
-        
-        game = Game()
-        game.current_player = player1
+    def test_not_checkmate(self):
+        game = self.create_game_with_pieces([
+            King(Position(0, 7), Color.WHITE),
+            Rook(Position(7, 7), Color.BLACK),
+            King(Position(7, 0), Color.BLACK),
+        ])
         result = game.is_checkmate()
         self.assertFalse(result)
+        self.assertEqual(game.game_status, GameStatus.ONGOING)
+
+    def test_legal_moves_escape_check(self):
+        game = self.create_game_with_pieces([
+            King(Position(4, 0), Color.WHITE),
+            Rook(Position(0, 3), Color.WHITE),
+            Rook(Position(4, 7), Color.BLACK),
+            King(Position(7, 7), Color.BLACK),
+        ])
+        moves = sorted((move.from_position.x, move.from_position.y, move.to_position.x, move.to_position.y)
+                       for move in game.legal_moves())
+        self.assertEqual(moves, [(0, 3, 4, 3), (4, 0, 3, 0), (4, 0, 3, 1), (4, 0, 5, 0), (4, 0, 5, 1)])
 
     @patch('src.game.game.Game.is_check')
     @patch('src.players.player.Player.get_available_moves')
@@ -179,7 +174,39 @@ class test_game(unittest.TestCase):
         game.current_player = player1
         result = game.get_valid_moves()
         self.assertEqual(result, [Position(0,0), Position(2,2)])
-        
-        
-        
-    
\ No newline at end of file
+
+    def create_shuffling_game(self, fen: str, moves: list) -> Game:
+        """Creates a game whose two players play the given (from, to) square pairs in turn."""
+        game = Game()
+        game.verbose = False
+
+        class ScriptedPlayer(Player):
+            def make_move(self, game):
+                from_position, to_position = moves.pop(0)
+                return Move(from_position, to_position, game.board.get_piece_at(from_position),
+                            game.board.get_piece_at(to_position))
+
+        game.setup_players(ScriptedPlayer("White", Color.WHITE), ScriptedPlayer("Black", Color.BLACK))
+        game.load_fen(fen)
+        return game
+
+    def test_threefold_repetition_is_draw(self):
+        there_and_back = [(Position(6, 0), Position(5, 2)), (Position(6, 7), Position(5, 5)),
+                          (Position(5, 2), Position(6, 0)), (Position(5, 5), Position(6, 7))]
+        game = self.create_shuffling_game("4k1n1/8/8/8/8/8/8/4K1N1 w - - 0 1", there_and_back * 2)
+        for _ in range(7):
+            game.play_turn()
+            self.assertEqual(game.game_status, GameStatus.ONGOING)
+        self.assertEqual(game.board.repetitions(1), 1)
+        game.play_turn()
+        self.assertEqual(game.game_status, GameStatus.DRAW)
+        self.assertEqual(game.draw_reason, 'repetition')
+
+    def test_fifty_move_rule_is_draw(self):
+        game = self.create_shuffling_game("4k3/8/8/8/8/8/8/4K1N1 w - - 0 1", [])
+        with patch.object(game.board, 'halfmove_clock', return_value=99):
+            self.assertFalse(game.check_draw())
+        with patch.object(game.board, 'halfmove_clock', return_value=100):
+            self.assertTrue(game.check_draw())
+        self.assertEqual(game.game_status, GameStatus.DRAW)
+        self.assertEqual(game.draw_reason, 'fifty moves')
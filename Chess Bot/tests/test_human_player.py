@@ -48,7 +48,7 @@ class TestHumanPlayer(unittest.TestCase):
     def test_make_move_execution(self, mock_input):
         """Test if make_move properly executes the selected move"""
 
-        self.player.get_available_moves = Mock(return_value=self.valid_moves)
+        self.game.legal_moves = Mock(return_value=self.valid_moves)
         
         # Execute make_move
         result_move = self.player.make_move(self.game)
@@ -58,8 +58,8 @@ class TestHumanPlayer(unittest.TestCase):
 
     def test_make_move_no_valid_moves(self):
         """Test handling when there are no valid moves available"""
-        # Mock get_available_moves to return empty list
-        self.player.get_available_moves = Mock(return_value=[])
+        # Mock legal_moves to return empty list
+        self.game.legal_moves = Mock(return_value=[])
         
         result_move = self.player.make_move(self.game)
         
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import MagicMock, patch
 from src.game.board import Move
+from src.game.bitboard import PAWN, KNIGHT
+from src.game.move import encode_move, move_name, square_name
 from src.game.board import Board
 from src.game.position import Position
 from src.pieces.bishop import Bishop
@@ -18,6 +20,9 @@ class test_move(unittest.TestCase):
         self.from_position = Position(0,0)
         self.to_position = Position(1,1)
         self.piece_moved = MagicMock(spec=Bishop)
+        # Instance attributes of the piece, which a class spec does not include
+        self.piece_moved.position = self.from_position
+        self.piece_moved.has_moved = False
         self.piece_captured = MagicMock(spec=Knight)
         self.move = Move(self.from_position, self.to_position, self.piece_moved, self.piece_captured)
         
@@ -70,10 +75,15 @@ class test_move(unittest.TestCase):
         
         mock_from_square.set_piece.side_effect = set_from_piece_side_effect2
         
+        self.assertEqual(self.piece_moved.position, self.to_position)
+        self.assertTrue(self.piece_moved.has_moved)
+
         self.move.undo(mock_board)
         self.assertFalse(self.move.executed)
         self.assertIsInstance(mock_board.squares[self.to_position.x][self.to_position.y].piece, Knight)
         self.assertIsInstance(mock_board.squares[self.from_position.x][self.from_position.y].piece, Bishop)
+        self.assertEqual(self.piece_moved.position, self.from_position)
+        self.assertFalse(self.piece_moved.has_moved)
         
     @patch('src.game.board.Board')
     def test_undo_no_execute(self, MockBaord):
@@ -128,4 +138,51 @@ class test_move(unittest.TestCase):
     
     
     
-    
\ No newline at end of file
+    
+
+class TestCompactMove(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        move = Move(Position(0, 0), Position(1, 1), MagicMock(spec=Bishop))
+        self.assertFalse(hasattr(move, '__dict__'))
+        self.assertFalse(hasattr(Position(0, 0), '__dict__'))
+
+    def test_from_code_shares_positions(self):
+        board = Board()
+        board.initialize_board()
+        code = encode_move(12, 28, PAWN)
+        move = Move.from_code(code, board)
+        self.assertIs(move.from_position, Position.at(4, 1))
+        self.assertIs(move.to_position, Move.from_code(code, board).to_position)
+        self.assertEqual(move.to_position.square, 28)
+        self.assertEqual(move.encode(), code)
+
+    def test_move_name(self):
+        self.assertEqual(square_name(0), 'a1')
+        self.assertEqual(move_name(encode_move(12, 28, PAWN)), 'e2e4')
+        self.assertEqual(move_name(encode_move(62, 45, KNIGHT)), 'g8f6')
+
+    def test_make_unmake_restores_state(self):
+        board = Board()
+        board.load_fen("4k3/8/8/3p4/8/8/4P3/4K3 w - - 0 1")
+        pawn = board.squares[4][1].piece
+        key = board.zobrist_key
+        material, positional = list(board.material), list(board.positional)
+        first = Move.from_code(encode_move(12, 28, PAWN), board)
+        board.make_move(first)
+        self.assertIs(pawn.position, Position.at(4, 3))
+        self.assertTrue(pawn.has_moved)
+        second = Move.from_code(encode_move(35, 28, PAWN, PAWN), board)
+        board.make_move(second)
+        self.assertEqual(board.undo_stack, [first, second])
+
+        self.assertIs(board.unmake_move(), second)
+        self.assertIs(board.squares[4][3].piece, pawn)
+        self.assertIs(board.unmake_move(), first)
+        self.assertIsNone(board.unmake_move())
+        self.assertEqual(pawn.position, Position(4, 1))
+        self.assertFalse(pawn.has_moved)
+        self.assertEqual(board.zobrist_key, key)
+        self.assertEqual((board.material, board.positional), (material, positional))
+        # The double step is available again, as before the moves
+        self.assertIn(Position(4, 3), pawn.get_valid_moves(board))
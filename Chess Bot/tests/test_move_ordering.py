@@ -0,0 +1,49 @@
+import unittest
+from src.game.bitboard import PAWN, KNIGHT, ROOK, QUEEN, WHITE, BLACK
+from src.game.move import encode_move
+from src.search.move_ordering import MoveOrderer
+
+
+class TestMoveOrderer(unittest.TestCase):
+
+    def setUp(self):
+        self.orderer = MoveOrderer([1, 3, 3, 5, 9, 100])
+        self.quiet = encode_move(1, 18, KNIGHT)
+        self.other_quiet = encode_move(12, 28, PAWN)
+        self.pawn_takes_queen = encode_move(12, 21, PAWN, QUEEN)
+        self.queen_takes_pawn = encode_move(3, 11, QUEEN, PAWN)
+        self.queen_takes_rook = encode_move(3, 59, QUEEN, ROOK)
+
+    def test_mvv_lva(self):
+        ordered = self.orderer.order([self.queen_takes_pawn, self.quiet, self.queen_takes_rook,
+                                      self.pawn_takes_queen], None, 0, WHITE)
+        self.assertEqual(ordered, [self.pawn_takes_queen, self.queen_takes_rook,
+                                   self.queen_takes_pawn, self.quiet])
+
+    def test_hash_move_first(self):
+        ordered = self.orderer.order([self.pawn_takes_queen, self.quiet], self.quiet, 0, WHITE)
+        self.assertEqual(ordered[0], self.quiet)
+
+    def test_killer_moves_after_captures(self):
+        self.orderer.record_cutoff(self.other_quiet, 3, 2, WHITE)
+        ordered = self.orderer.order([self.quiet, self.other_quiet, self.queen_takes_pawn], None, 2, WHITE)
+        self.assertEqual(ordered, [self.queen_takes_pawn, self.other_quiet, self.quiet])
+        # Killers are per ply
+        self.assertEqual(self.orderer.score_move(self.other_quiet, None, 3, WHITE),
+                         self.orderer.history[WHITE][self.other_quiet & 4095])
+
+    def test_captures_do_not_become_killers(self):
+        self.orderer.record_cutoff(self.queen_takes_pawn, 3, 2, WHITE)
+        self.assertEqual(self.orderer.killers[2], [None, None])
+
+    def test_history_is_per_color_and_halves_each_search(self):
+        self.orderer.record_cutoff(self.quiet, 4, 1, BLACK)
+        self.assertEqual(self.orderer.history[BLACK][self.quiet & 4095], 16)
+        self.assertEqual(self.orderer.history[WHITE][self.quiet & 4095], 0)
+        self.orderer.new_search()
+        self.assertEqual(self.orderer.history[BLACK][self.quiet & 4095], 8)
+        self.assertEqual(self.orderer.killers[1], [None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+from src.game.bitboard import BitBoard, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, WHITE, BLACK, square_index
+from src.game.board import Board
+from src.game.move import Move, encode_move, move_from, move_to, move_piece, move_captured, NO_CAPTURE
+from src.game.movegen import (KNIGHT_ATTACKS, KING_ATTACKS, generate_moves, generate_legal_moves,
+                              in_check, is_square_attacked, make_move, unmake_move, pinned_pieces,
+                              rook_attacks, attack_map)
+from src.game.position import Position
+from src.enums.color import Color
+
+
+class TestMoveEncoding(unittest.TestCase):
+
+    def test_encode_round_trip(self):
+        code = encode_move(12, 28, PAWN)
+        self.assertEqual((move_from(code), move_to(code), move_piece(code), move_captured(code)),
+                         (12, 28, PAWN, NO_CAPTURE))
+        code = encode_move(63, 0, QUEEN, KING)
+        self.assertEqual((move_from(code), move_to(code), move_piece(code), move_captured(code)),
+                         (63, 0, QUEEN, KING))
+
+    def test_move_object_round_trip(self):
+        board = Board()
+        board.initialize_board()
+        code = encode_move(square_index(6, 0), square_index(5, 2), KNIGHT)
+        move = Move.from_code(code, board)
+        self.assertEqual(move.from_position, Position(6, 0))
+        self.assertEqual(move.to_position, Position(5, 2))
+        self.assertIs(move.piece_moved, board.get_piece_at(Position(6, 0)))
+        self.assertEqual(move.encode(), code)
+
+
+class TestMoveGeneration(unittest.TestCase):
+
+    def setUp(self):
+        self.board = Board()
+        self.board.initialize_board()
+
+    def test_attack_tables(self):
+        self.assertEqual(bin(KNIGHT_ATTACKS[0]).count('1'), 2)
+        self.assertEqual(bin(KNIGHT_ATTACKS[square_index(4, 4)]).count('1'), 8)
+        self.assertEqual(bin(KING_ATTACKS[square_index(7, 7)]).count('1'), 3)
+
+    def test_rook_attacks_stop_at_blockers(self):
+        occupied = 1 << square_index(0, 3)
+        attacks = rook_attacks(square_index(0, 0), occupied)
+        self.assertTrue(attacks & occupied)
+        self.assertFalse(attacks & (1 << square_index(0, 4)))
+
+    def test_starting_position_move_count(self):
+        self.assertEqual(len(generate_moves(self.board.bitboard, WHITE)), 20)
+        self.assertEqual(len(generate_moves(self.board.bitboard, BLACK)), 20)
+
+    def test_matches_piece_classes(self):
+        """The bitboard generator agrees with Player-style generation from the piece objects."""
+        expected = sorted((piece.position.x, piece.position.y, pos.x, pos.y)
+                          for piece in self.board.get_pieces(Color.WHITE)
+                          for pos in piece.get_valid_moves(self.board))
+        generated = sorted((move.from_position.x, move.from_position.y, move.to_position.x, move.to_position.y)
+                           for move in (Move.from_code(code, self.board)
+                                        for code in generate_moves(self.board.bitboard, WHITE)))
+        self.assertEqual(generated, expected)
+
+    def test_captures_only(self):
+        bitboard = BitBoard()
+        bitboard.add_piece(WHITE, ROOK, square_index(0, 0))
+        bitboard.add_piece(BLACK, KNIGHT, square_index(0, 5))
+        captures = generate_moves(bitboard, WHITE, captures_only=True)
+        self.assertEqual(captures, [encode_move(square_index(0, 0), square_index(0, 5), ROOK, KNIGHT)])
+
+    def test_is_square_attacked(self):
+        bitboard = BitBoard()
+        bitboard.add_piece(BLACK, PAWN, square_index(3, 4))
+        self.assertTrue(is_square_attacked(bitboard, square_index(4, 3), BLACK))
+        self.assertFalse(is_square_attacked(bitboard, square_index(3, 3), BLACK))
+
+    def test_attack_map_agrees_with_square_probe(self):
+        for color in (WHITE, BLACK):
+            attacked = attack_map(self.board.bitboard, color)
+            for square in range(64):
+                self.assertEqual(bool(attacked >> square & 1),
+                                 is_square_attacked(self.board.bitboard, square, color))
+
+    def test_make_unmake_restores_bitboard(self):
+        bitboard = self.board.bitboard
+        before = (list(map(list, bitboard.pieces)), list(bitboard.occupancy), bitboard.occupied)
+        for code in generate_moves(bitboard, WHITE):
+            make_move(bitboard, code)
+            unmake_move(bitboard, code)
+        self.assertEqual((bitboard.pieces, bitboard.occupancy, bitboard.occupied), before)
+
+
+class TestLegalMoveGeneration(unittest.TestCase):
+
+    def legal_by_filtering(self, bitboard, color):
+        """Reference: pseudo-legal moves that do not leave the king attacked."""
+        legal = []
+        for code in generate_moves(bitboard, color):
+            make_move(bitboard, code)
+            if not in_check(bitboard, color):
+                legal.append(code)
+            unmake_move(bitboard, code)
+        return sorted(legal)
+
+    def test_starting_position(self):
+        board = Board()
+        board.initialize_board()
+        self.assertEqual(sorted(generate_legal_moves(board.bitboard, WHITE)),
+                         sorted(generate_moves(board.bitboard, WHITE)))
+
+    def test_pinned_piece_moves_along_pin(self):
+        bitboard = BitBoard()
+        bitboard.add_piece(WHITE, KING, square_index(4, 0))
+        bitboard.add_piece(WHITE, ROOK, square_index(4, 3))
+        bitboard.add_piece(WHITE, KNIGHT, square_index(3, 1))
+        bitboard.add_piece(BLACK, QUEEN, square_index(4, 6))
+        bitboard.add_piece(BLACK, BISHOP, square_index(0, 4))
+        bitboard.add_piece(BLACK, KING, square_index(7, 7))
+        self.assertEqual(set(pinned_pieces(bitboard, WHITE, square_index(4, 0))),
+                         {square_index(4, 3), square_index(3, 1)})
+        legal = generate_legal_moves(bitboard, WHITE)
+        rook_targets = sorted((code >> 6) & 63 for code in legal if code & 63 == square_index(4, 3))
+        self.assertEqual(rook_targets, [square_index(4, y) for y in (1, 2, 4, 5, 6)])
+        self.assertFalse([code for code in legal if code & 63 == square_index(3, 1)])
+        self.assertEqual(sorted(legal), self.legal_by_filtering(bitboard, WHITE))
+
+    def test_check_evasions(self):
+        bitboard = BitBoard()
+        bitboard.add_piece(WHITE, KING, square_index(4, 0))
+        bitboard.add_piece(WHITE, ROOK, square_index(0, 3))
+        bitboard.add_piece(WHITE, PAWN, square_index(3, 1))
+        bitboard.add_piece(BLACK, ROOK, square_index(4, 7))
+        bitboard.add_piece(BLACK, KING, square_index(7, 7))
+        self.assertEqual(sorted(generate_legal_moves(bitboard, WHITE)), self.legal_by_filtering(bitboard, WHITE))
+
+    def test_double_check_only_king_moves(self):
+        bitboard = BitBoard()
+        bitboard.add_piece(WHITE, KING, square_index(4, 0))
+        bitboard.add_piece(WHITE, QUEEN, square_index(0, 4))
+        bitboard.add_piece(BLACK, ROOK, square_index(4, 7))
+        bitboard.add_piece(BLACK, KNIGHT, square_index(3, 2))
+        bitboard.add_piece(BLACK, KING, square_index(7, 7))
+        legal = generate_legal_moves(bitboard, WHITE)
+        self.assertTrue(legal)
+        self.assertTrue(all((code >> 12) & 7 == KING for code in legal))
+        self.assertEqual(sorted(legal), self.legal_by_filtering(bitboard, WHITE))
+
+    def test_king_cannot_retreat_along_checking_ray(self):
+        bitboard = BitBoard()
+        bitboard.add_piece(WHITE, KING, square_index(4, 3))
+        bitboard.add_piece(BLACK, ROOK, square_index(4, 7))
+        bitboard.add_piece(BLACK, KING, square_index(0, 7))
+        targets = {(code >> 6) & 63 for code in generate_legal_moves(bitboard, WHITE)}
+        self.assertNotIn(square_index(4, 2), targets)
+        self.assertEqual(sorted(generate_legal_moves(bitboard, WHITE)), self.legal_by_filtering(bitboard, WHITE))
+
+
+if __name__ == '__main__':
+    unittest.main()
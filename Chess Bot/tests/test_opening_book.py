@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from src.game.game import Game
+from src.game.movegen import generate_legal_moves
+from src.game.position import Position
+from src.game.zobrist import position_key
+from src.players.ai_player import AIPlayer
+from src.search.opening_book import OpeningBook, default_book, parse_square
+from src.search.options import SearchOptions
+from src.enums.color import Color
+from src.tools.build_book import main
+
+
+class TestOpeningBook(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.game.board.initialize_board()
+        self.start_key = position_key(self.game.board.zobrist_key, 0)
+        self.legal = generate_legal_moves(self.game.board.bitboard, 0)
+
+    def test_parse_square(self):
+        self.assertEqual(parse_square('a1'), 0)
+        self.assertEqual(parse_square('e4'), 28)
+        with self.assertRaises(ValueError):
+            parse_square('i9')
+
+    def test_heaviest_move_chosen(self):
+        book = OpeningBook.from_lines(["e2e4 e7e5", "1. d2d4 d7d5", "1. e2e4 c7c5 *"])
+        code = book.probe(self.start_key, self.legal)
+        self.assertEqual((code & 63, (code >> 6) & 63), (parse_square('e2'), parse_square('e4')))
+        self.assertEqual(sorted(weight for _, weight in book.moves(self.start_key)), [1, 2])
+
+    def test_illegal_line_rejected(self):
+        with self.assertRaises(ValueError):
+            OpeningBook.from_lines(["e2e5"])
+
+    def test_out_of_book(self):
+        self.assertIsNone(OpeningBook().probe(self.start_key, self.legal))
+
+    def test_save_and_load(self):
+        book = default_book()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'book.bin')
+            book.save(path)
+            loaded = OpeningBook.load(path)
+            with open(path, 'wb') as file:
+                file.write(b'nonsense')
+            with self.assertRaises(ValueError):
+                OpeningBook.load(path)
+        self.assertEqual(loaded.entries, book.entries)
+
+    def test_build_book_tool(self):
+        with tempfile.TemporaryDirectory() as directory:
+            lines = os.path.join(directory, 'lines.txt')
+            output = os.path.join(directory, 'book.bin')
+            with open(lines, 'w') as file:
+                file.write("1. e2e4 e7e5 2. g1f3 b8c6\n# comment\n\nd2d4 d7d5\n")
+            with patch('sys.stdout', new_callable=StringIO):
+                self.assertEqual(main([output, lines, '--max-plies', '2']), 0)
+            self.assertEqual(len(OpeningBook.load(output)), 3)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_ai_plays_book_move_without_searching(self, mock_stdout):
+        player = AIPlayer("AI", Color.WHITE)
+        with patch.object(player, 'iterative_deepening') as search:
+            move = player.make_move(self.game)
+        search.assert_not_called()
+        self.assertEqual(move.from_position, Position(4, 1))
+        self.assertEqual(player.nodes, 0)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_ai_searches_without_book(self, mock_stdout):
+        player = AIPlayer("AI", Color.WHITE, SearchOptions(book=False, max_depth=1))
+        self.assertIsNone(player.opening_book)
+        self.assertIsNotNone(player.make_move(self.game))
+        self.assertGreater(player.nodes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
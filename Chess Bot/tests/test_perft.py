@@ -0,0 +1,37 @@
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from src.game.board import Board
+from src.game.fen import STARTING_FEN
+from src.tools.perft import SUITE, divide, main, run
+
+
+class TestPerft(unittest.TestCase):
+
+    def test_start_position_counts(self):
+        self.assertEqual([run(STARTING_FEN, depth)[0] for depth in (1, 2, 3)], [20, 400, 8902])
+
+    def test_backends_agree_on_suite(self):
+        for name, fen, counts in SUITE:
+            with self.subTest(position=name):
+                self.assertEqual(run(fen, 2, 'bitboard')[0], counts[1])
+                self.assertEqual(run(fen, 2, 'objects')[0], counts[1])
+
+    def test_divide_sums_to_perft(self):
+        fen = SUITE[3][1]
+        board = Board()
+        color = board.load_fen(fen)
+        counts = divide(board, color, 2)
+        self.assertEqual(len(counts), SUITE[3][2][0])
+        self.assertEqual(sum(counts.values()), SUITE[3][2][1])
+        # Divide leaves the position untouched
+        self.assertEqual(divide(board, color, 2, 'objects'), counts)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_suite_exit_status(self, mock_stdout):
+        self.assertEqual(main(['--suite', '--depth', '2']), 0)
+        self.assertNotIn("FAILED", mock_stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from src.players.player import Player
 from src.enums.color import Color
 from src.game.position import Position
@@ -24,11 +24,17 @@ class TestPlayerGetAvailableMoves(unittest.TestCase):
     def setup_board_pieces(self, piece_positions: dict[Position, Mock]):
         def get_piece_at_side_effect(position):
             return piece_positions.get(position)
+        def get_pieces_side_effect(color):
+            return [piece for piece in piece_positions.values() if piece.color == color]
+        for position, piece in piece_positions.items():
+            piece.position = position
         self.board.get_piece_at.side_effect = get_piece_at_side_effect
+        self.board.get_pieces.side_effect = get_pieces_side_effect
 
     def test_get_moves_empty_board(self):
         """Should return empty list when no pieces on board"""
         self.board.get_piece_at.return_value = None
+        self.board.get_pieces.return_value = []
         moves = self.white_player.get_available_moves(self.board)
         self.assertEqual(len(moves), 0)
 
@@ -69,5 +75,21 @@ class TestPlayerGetAvailableMoves(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.white_player.get_available_moves(None)
 
+class TestCreatePlayer(unittest.TestCase):
+    @patch('builtins.input', side_effect=['2', ''])
+    def test_ai_ponders_by_default(self, mock_input):
+        player = Player.create_player(Color.BLACK)
+        self.assertEqual(player.name, "AI_BLACK")
+        self.assertTrue(player.options.ponder)
+
+    @patch('builtins.input', side_effect=['2', 'n'])
+    def test_ai_pondering_can_be_declined(self, mock_input):
+        self.assertFalse(Player.create_player(Color.WHITE).options.ponder)
+
+    @patch('builtins.input', side_effect=['1', 'Alice'])
+    def test_human_player(self, mock_input):
+        player = Player.create_player(Color.WHITE)
+        self.assertEqual((type(player).__name__, player.name), ('HumanPlayer', 'Alice'))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from src.game.board import Board
+from src.game.position import Position
+from src.search.options import SearchOptions
+from src.tools.selfplay import board_errors, main, play_game
+
+MATE_IN_ONE = "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+
+class TestSelfPlay(unittest.TestCase):
+
+    def test_play_game_records_moves(self):
+        record = play_game(0, MATE_IN_ONE, SearchOptions(time_limit=5, max_depth=2), 10, 0, 0)
+        self.assertIsNone(record['error'])
+        self.assertEqual(record['result'], 'checkmate')
+        self.assertEqual(record['winner'], 'white')
+        self.assertEqual(record['moves'][0]['move'], 'a1a8')
+        self.assertGreater(record['moves'][0]['nodes'], 0)
+        self.assertEqual(record['moves'][0]['depth'], 2)
+
+    def test_move_limit(self):
+        record = play_game(1, "4k3/8/8/8/8/8/8/4K2R w - - 0 1", SearchOptions(time_limit=5, max_depth=1), 3, 2, 7)
+        self.assertEqual(record['result'], 'move limit')
+        self.assertEqual(record['plies'], 3)
+
+    def test_board_errors(self):
+        board = Board()
+        board.initialize_board()
+        self.assertEqual(board_errors(board), [])
+        board.squares[4][1].piece.position = Position(4, 3)
+        board.zobrist_key ^= 1
+        errors = board_errors(board)
+        self.assertEqual(len(errors), 2)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_writes_reports(self, mock_stdout):
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, 'report.json')
+            csv_path = os.path.join(directory, 'moves.csv')
+            stats_path = os.path.join(directory, 'stats.jsonl')
+            status = main(['--games', '2', '--fen', MATE_IN_ONE, '--random-plies', '0', '--max-depth', '2',
+                           '--json', json_path, '--csv', csv_path, '--stats', stats_path])
+            self.assertEqual(status, 0)
+            with open(json_path) as file:
+                report = json.load(file)
+            with open(csv_path, newline='') as file:
+                rows = list(csv.DictReader(file))
+            with open(stats_path) as file:
+                stats = [json.loads(line) for line in file]
+        self.assertEqual(report['summary']['games'], 2)
+        self.assertEqual(report['summary']['results'], {'checkmate': 2})
+        self.assertEqual([row['move'] for row in rows], ['a1a8', 'a1a8'])
+        self.assertEqual([(line['game'], line['move'], line['depth']) for line in stats], [(0, 'a1a8', 2), (1, 'a1a8', 2)])
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main_fails_on_illegal_state(self, mock_stdout):
+        with patch('src.tools.selfplay.board_errors', return_value=["bitboards do not match the squares"]):
+            status = main(['--games', '1', '--random-plies', '0', '--max-depth', '1', '--max-plies', '2'])
+        self.assertEqual(status, 1)
+        self.assertIn("bitboards do not match", mock_stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import unittest
+from io import StringIO
+from src.game.game import Game
+from src.players.ai_player import AIPlayer
+from src.search.options import SearchOptions
+from src.search.stats import SearchStats
+from src.enums.color import Color
+
+MATE_IN_ONE = "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+
+class TestSearchStats(unittest.TestCase):
+
+    def test_rates(self):
+        stats = SearchStats()
+        self.assertEqual(stats.first_move_cutoff_rate, 0.0)
+        self.assertEqual(stats.nps, 0.0)
+        stats.nodes, stats.qnodes, stats.seconds = 300, 100, 2.0
+        stats.beta_cutoffs, stats.first_move_cutoffs = 8, 6
+        self.assertEqual(stats.first_move_cutoff_rate, 0.75)
+        self.assertEqual(stats.nps, 200)
+
+    def test_merge(self):
+        stats = SearchStats()
+        worker = SearchStats()
+        worker.nodes, worker.qnodes, worker.evaluations = 10, 5, 7
+        worker.beta_cutoffs, worker.first_move_cutoffs = 3, 2
+        stats.merge(worker)
+        stats.merge(worker)
+        self.assertEqual((stats.nodes, stats.qnodes, stats.evaluations), (20, 10, 14))
+        self.assertEqual((stats.beta_cutoffs, stats.first_move_cutoffs), (6, 4))
+
+    def test_choose_move_returns_stats(self):
+        player = AIPlayer("AI", Color.WHITE, SearchOptions(time_limit=60, max_depth=3, book=False))
+        game = Game()
+        game.load_fen(MATE_IN_ONE)
+        move, stats = player.choose_move(game)
+        self.assertIs(stats, player.stats)
+        self.assertEqual(stats.source, 'search')
+        self.assertEqual(stats.move, 'a1a8')
+        self.assertEqual(stats.depth, 3)
+        self.assertGreater(stats.score, AIPlayer.MATE_SCORE - 10)
+        self.assertGreater(stats.nodes, 0)
+        self.assertGreater(stats.evaluations, 0)
+        self.assertGreater(stats.beta_cutoffs, 0)
+        self.assertLessEqual(stats.first_move_cutoffs, stats.beta_cutoffs)
+        self.assertGreater(stats.seconds, 0)
+        self.assertGreater(stats.tt['stores'], 0)
+        self.assertEqual(player.nodes, stats.nodes)
+
+    def test_stats_stream(self):
+        player = AIPlayer("AI", Color.WHITE, SearchOptions(max_depth=1))
+        player.verbose = False
+        player.stats_stream = StringIO()
+        game = Game()
+        game.board.initialize_board()
+        player.make_move(game)
+        game.load_fen(MATE_IN_ONE)
+        player.make_move(game)
+        lines = [json.loads(line) for line in player.stats_stream.getvalue().splitlines()]
+        self.assertEqual([(line['source'], line['nodes']) for line in lines][0], ('book', 0))
+        self.assertEqual(lines[1]['source'], 'search')
+        self.assertEqual(lines[1]['move'], 'a1a8')
+        self.assertEqual(lines[1]['depth'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import random
+import tempfile
+import unittest
+from src.game.bitboard import BitBoard, PAWN, ROOK, QUEEN, WHITE, BLACK
+from src.game.game import Game
+from src.game.movegen import generate_legal_moves, in_check
+from src.players.ai_player import AIPlayer
+from src.search.options import SearchOptions
+from src.search.opening_book import parse_square
+from src.search.tablebase import (DRAW, ILLEGAL, TABLE_SIZE, Tablebase, _place, _predecessors, save_table,
+                                  table_index, table_name)
+from src.enums.color import Color
+
+
+def decode(index: int):
+    """Splits a table index into side, white king, white piece and black king."""
+    return index >> 18, (index >> 12) & 63, (index >> 6) & 63, index & 63
+
+
+def is_legal(bitboard: BitBoard, side: int) -> bool:
+    """Returns whether the side that just moved did not leave its king attacked."""
+    return not in_check(bitboard, 1 - side)
+
+
+def index_after(piece_type: int, side: int, squares, code: int) -> int:
+    """Returns the table index reached when side plays an encoded move from a table position."""
+    bitboard = BitBoard()
+    _place(bitboard, piece_type, *squares)
+    bitboard.move_piece(side, (code >> 12) & 7, code & 63, (code >> 6) & 63)
+    return table_index(1 - side, bitboard.king_square(WHITE), bitboard.pieces[WHITE][piece_type].bit_length() - 1,
+                       bitboard.king_square(BLACK))
+
+
+class TestTablebase(unittest.TestCase):
+
+    def test_table_name(self):
+        self.assertEqual(table_name(QUEEN), 'KQK')
+        self.assertEqual(table_name(PAWN), 'KPK')
+
+    def test_predecessors_undo_forward_moves(self):
+        rng = random.Random(7)
+        bitboard = BitBoard()
+        for piece_type in (PAWN, ROOK, QUEEN):
+            checked = 0
+            while checked < 100:
+                side = rng.randrange(2)
+                white_king, white_piece, black_king = rng.sample(range(8, 64), 3)
+                _place(bitboard, piece_type, white_king, white_piece, black_king)
+                if not is_legal(bitboard, side):
+                    continue
+                checked += 1
+                index = table_index(side, white_king, white_piece, black_king)
+                squares = (white_king, white_piece, black_king)
+                for code in generate_legal_moves(bitboard, side):
+                    if not (code >> 15) & 7:
+                        child = index_after(piece_type, side, squares, code)
+                        self.assertIn(index, set(_predecessors(child, piece_type)))
+                # Every predecessor of a legal position reaches it with one legal move
+                for previous in _predecessors(index, piece_type):
+                    previous_side, *squares = decode(previous)
+                    _place(bitboard, piece_type, *squares)
+                    if not is_legal(bitboard, previous_side):
+                        continue
+                    reached = {index_after(piece_type, previous_side, squares, code)
+                               for code in generate_legal_moves(bitboard, previous_side)}
+                    self.assertIn(index, reached)
+
+    def test_probe_mirrors_black_piece(self):
+        tablebase = Tablebase()
+        values = bytearray([DRAW]) * TABLE_SIZE
+        values[table_index(WHITE, parse_square('g6'), parse_square('a1'), parse_square('g8'))] = 1
+        tablebase.tables[ROOK] = bytes(values)
+
+        game = Game()
+        game.load_fen("6k1/8/6K1/8/8/8/8/R7 w - - 0 1")
+        self.assertEqual(tablebase.probe(game.board.bitboard, WHITE), 1)
+        game.load_fen("r7/8/8/8/8/6k1/8/6K1 b - - 0 1")
+        self.assertEqual(tablebase.probe(game.board.bitboard, BLACK), 1)
+        self.assertEqual(tablebase.probe(game.board.bitboard, WHITE), DRAW)
+        game.load_fen("6k1/8/6K1/8/8/8/8/Q7 w - - 0 1")
+        self.assertIsNone(tablebase.probe(game.board.bitboard, WHITE))
+        game.load_fen("6k1/8/6K1/8/8/8/1P6/R7 w - - 0 1")
+        self.assertIsNone(tablebase.probe(game.board.bitboard, WHITE))
+
+    def test_save_and_load_dir(self):
+        values = bytearray([DRAW]) * TABLE_SIZE
+        values[5] = ILLEGAL
+        with tempfile.TemporaryDirectory() as directory:
+            save_table(os.path.join(directory, 'KRK.tb'), values)
+            tablebase = Tablebase.load_dir(directory)
+            with open(os.path.join(directory, 'KQK.tb'), 'wb') as file:
+                file.write(b'nonsense')
+            with self.assertRaises(ValueError):
+                Tablebase.load_dir(directory)
+        self.assertEqual(list(tablebase.tables), [ROOK])
+        self.assertEqual(tablebase.tables[ROOK], bytes(values))
+
+    def test_ai_plays_table_mate(self):
+        values = bytearray([DRAW]) * TABLE_SIZE
+        g6, a1, a8, g8 = (parse_square(name) for name in ('g6', 'a1', 'a8', 'g8'))
+        values[table_index(WHITE, g6, a1, g8)] = 1
+        values[table_index(BLACK, g6, a8, g8)] = 0
+        with tempfile.TemporaryDirectory() as directory:
+            save_table(os.path.join(directory, 'KRK.tb'), values)
+            ai_player = AIPlayer("AI", Color.WHITE, SearchOptions(book=False, tablebase_dir=directory))
+        ai_player.verbose = False
+        game = Game()
+        game.load_fen("6k1/8/6K1/8/8/8/8/R7 w - - 0 1")
+
+        move = ai_player.make_move(game)
+        self.assertEqual((move.to_position.x, move.to_position.y), (0, 7))
+        self.assertEqual(ai_player.completed_depth, 0)
+        # Inside the search the table's mate scores like a searched one
+        self.assertEqual(ai_player.tablebase_score(1, 2), AIPlayer.MATE_SCORE - 3)
+        self.assertEqual(ai_player.tablebase_score(0, 3), -(AIPlayer.MATE_SCORE - 3))
+        self.assertEqual(ai_player.tablebase_score(DRAW, 3), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from src.search.transposition_table import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+
+class TestTranspositionTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = TranspositionTable(16)
+
+    def test_size_rounded_to_power_of_two(self):
+        self.assertEqual(TranspositionTable(1000).size, 1024)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            TranspositionTable(0)
+
+    def test_store_and_probe(self):
+        self.table.store(42, 3, 1.5, EXACT, 777)
+        entry = self.table.probe(42)
+        self.assertEqual((entry.depth, entry.value, entry.flag, entry.best_move), (3, 1.5, EXACT, 777))
+        self.assertEqual(self.table.hits, 1)
+
+    def test_probe_miss_on_different_key_in_same_slot(self):
+        self.table.store(1, 3, 0, EXACT, None)
+        self.assertIsNone(self.table.probe(1 + self.table.size))
+        self.assertEqual(self.table.misses, 1)
+
+    def test_deeper_entry_kept_within_same_search(self):
+        self.table.store(1, 5, 10, LOWER_BOUND, None)
+        self.table.store(1 + self.table.size, 2, 20, UPPER_BOUND, None)
+        self.assertEqual(self.table.probe(1).depth, 5)
+
+    def test_older_entry_replaced_in_new_search(self):
+        self.table.store(1, 5, 10, EXACT, None)
+        self.table.new_search()
+        self.table.store(1 + self.table.size, 2, 20, EXACT, None)
+        self.assertIsNotNone(self.table.probe(1 + self.table.size))
+        self.assertEqual(self.table.stats()['overwrites'], 1)
+
+    def test_stats_hit_rate(self):
+        self.table.store(3, 1, 0, EXACT, None)
+        self.table.probe(3)
+        self.table.probe(4)
+        self.assertEqual(self.table.stats()['hit_rate'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import time
+import unittest
+from io import StringIO
+from src.search.options import SearchOptions
+from src.tools.uci import UciEngine, main, search_limits
+from src.enums.color import Color
+
+MATE_IN_ONE = "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+
+class TestUci(unittest.TestCase):
+
+    def setUp(self):
+        self.output = StringIO()
+        self.engine = UciEngine(self.output, SearchOptions(time_limit=5))
+
+    def tearDown(self):
+        self.engine.handle("quit")
+
+    def lines(self):
+        return self.output.getvalue().splitlines()
+
+    def test_handshake(self):
+        self.engine.handle("uci")
+        self.engine.handle("isready")
+        lines = self.lines()
+        self.assertEqual(lines[0], "id name Chess Bot")
+        self.assertIn("option name OwnBook type check default true", lines)
+        self.assertEqual(lines[-2:], ["uciok", "readyok"])
+
+    def test_position_with_moves(self):
+        self.engine.handle("position startpos moves e2e4 e7e5 g1f3")
+        self.assertEqual(self.engine.game.to_fen(), "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b - - 0 1")
+        self.engine.handle(f"position fen {MATE_IN_ONE} moves a1a2")
+        self.assertEqual(self.engine.game.side_to_move(), Color.BLACK)
+
+    def test_illegal_move(self):
+        self.engine.handle("position startpos moves e2e5")
+        self.assertEqual(self.lines(), ["info string illegal move e2e5"])
+
+    def test_go_depth_reports_iterations(self):
+        self.engine.handle("setoption name OwnBook value false")
+        self.engine.handle(f"position fen {MATE_IN_ONE}")
+        self.engine.handle("go depth 2")
+        self.engine.wait()
+        lines = self.lines()
+        self.assertTrue(lines[0].startswith("info depth 1 score mate 1 nodes"))
+        self.assertTrue(lines[1].startswith("info depth 2 "))
+        self.assertTrue(lines[1].endswith("pv a1a8"))
+        self.assertEqual(lines[-1], "bestmove a1a8")
+
+    def test_book_move(self):
+        self.engine.handle("position startpos")
+        self.engine.handle("go movetime 100")
+        self.engine.wait()
+        self.assertEqual(self.lines()[0], "info string book move")
+        self.assertTrue(self.lines()[1].startswith("bestmove "))
+
+    def test_stop_ends_infinite_search(self):
+        self.engine.handle("setoption name OwnBook value false")
+        self.engine.handle("position startpos")
+        self.engine.handle("go infinite")
+        time.sleep(0.05)
+        self.assertTrue(self.engine.search_thread.is_alive())
+        self.engine.handle("stop")
+        self.assertIsNone(self.engine.search_thread)
+        self.assertTrue(self.lines()[-1].startswith("bestmove "))
+
+    def test_search_limits(self):
+        options = SearchOptions(time_limit=2, max_depth=10)
+        self.assertEqual(search_limits([], Color.WHITE, options), (2, 10, False))
+        self.assertEqual(search_limits(['depth', '4'], Color.WHITE, options), (float('inf'), 4, False))
+        self.assertAlmostEqual(search_limits(['movetime', '1000'], Color.WHITE, options)[0], 0.95)
+        time_limit = search_limits(['wtime', '60000', 'btime', '3000', 'winc', '1000'], Color.BLACK, options)[0]
+        self.assertAlmostEqual(time_limit, 3 / 30 - 0.05)
+        self.assertEqual(search_limits(['infinite'], Color.WHITE, options), (float('inf'), 10, True))
+
+
+class TestUciMain(unittest.TestCase):
+
+    def test_main_quits(self):
+        output = StringIO()
+        self.assertEqual(main(StringIO("uci\nisready\nquit\nisready\n"), output), 0)
+        self.assertEqual(output.getvalue().splitlines()[-2:], ["uciok", "readyok"])
+
+
+if __name__ == '__main__':
+    unittest.main()
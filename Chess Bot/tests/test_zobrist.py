@@ -0,0 +1,51 @@
+import unittest
+from src.game.board import Board
+from src.game.move import Move
+from src.game.movegen import generate_moves
+from src.game.bitboard import WHITE, BLACK
+from src.game.zobrist import compute_key, position_key
+
+
+class TestZobrist(unittest.TestCase):
+
+    def setUp(self):
+        self.board = Board()
+        self.board.initialize_board()
+
+    def test_initial_key_matches_full_computation(self):
+        self.assertEqual(self.board.zobrist_key, compute_key(self.board.bitboard))
+        self.assertNotEqual(self.board.zobrist_key, 0)
+
+    def test_incremental_key_through_execute_and_undo(self):
+        start_key = self.board.zobrist_key
+        for code in generate_moves(self.board.bitboard, WHITE):
+            move = Move.from_code(code, self.board)
+            move.execute(self.board)
+            self.assertEqual(self.board.zobrist_key, compute_key(self.board.bitboard))
+            self.assertNotEqual(self.board.zobrist_key, start_key)
+            move.undo(self.board)
+            self.assertEqual(self.board.zobrist_key, start_key)
+
+    def test_transposition_gives_same_key(self):
+        def play(*codes):
+            moves = []
+            for code in codes:
+                move = Move.from_code(code, self.board)
+                move.execute(self.board)
+                moves.append(move)
+            key = self.board.zobrist_key
+            for move in reversed(moves):
+                move.undo(self.board)
+            return key
+
+        white = generate_moves(self.board.bitboard, WHITE)
+        black = generate_moves(self.board.bitboard, BLACK)
+        self.assertEqual(play(white[0], black[0], white[-1]), play(white[-1], black[0], white[0]))
+
+    def test_side_to_move_changes_key(self):
+        key = self.board.zobrist_key
+        self.assertNotEqual(position_key(key, WHITE), position_key(key, BLACK))
+
+
+if __name__ == '__main__':
+    unittest.main()